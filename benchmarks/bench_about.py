@@ -0,0 +1,89 @@
+# benchmarks/bench_about.py
+#
+# The About screen's demo left running: per-minute work per frame (physics
+# plus drawing the bullets to an off-screen surface) and live body count,
+# for the old unbounded Projectile.update loop and the bounded Demo on the
+# shared World step.  Shots go out on a near-circular orbit (the screen's
+# own shot, aimed at the well, just crashes), so they pile up the way
+# orbiting bullets do.
+# Simulated at 60 fps without waiting for the clock.
+#
+#     python benchmarks/bench_about.py [minutes]
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from gravitywell import render
+from gravitywell.about import Demo, DEMO_INTERVAL
+from gravitywell.physics import Projectile
+from gravitywell.settings import Settings
+
+W, H = 1280, 720
+DT   = 1 / 60.0
+
+
+def legacy(settings, center, max_dist, start, vel):
+    """The pre-Demo loop: a shot every DEMO_INTERVAL, all-pairs update."""
+    bullets = []
+    timer = 0.0
+
+    def update(dt, work):
+        nonlocal timer
+        timer += dt
+        if timer >= DEMO_INTERVAL:
+            timer -= DEMO_INTERVAL
+            bullets.append(Projectile(start, vel, settings.bullet_radius, settings.bullet_mass,
+                                      settings.friction))
+        for b in bullets[:]:
+            b.update(dt, settings.gv_radius, settings.gv_mass, center, max_dist, bullets)
+            if not b.active:
+                bullets.remove(b)
+    return update, lambda: bullets
+
+
+def run(minutes, make):
+    surf = pygame.Surface((W, H))
+    update, bullets = make()
+    frames = int(60 / DT)
+    rows, work = [], 0.0
+    for m in range(int(minutes)):
+        spent = 0.0
+        for _ in range(frames):
+            t0 = time.perf_counter()
+            update(DT, work)
+            surf.fill((0, 0, 0))
+            for b in bullets():
+                render.draw_projectile(surf, b, (255, 255, 255))
+            work = time.perf_counter() - t0
+            spent += work
+        rows.append((spent / frames, len(bullets())))
+    return rows
+
+
+def main():
+    minutes  = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    settings = Settings()
+    center   = pygame.math.Vector2(W/2, H/2)
+    max_dist = max(W, H) * 1.5
+    start    = center + pygame.math.Vector2(0, 250)
+    vel      = pygame.math.Vector2((settings.gv_mass / 250) ** 0.5, 0)
+
+    def bounded():
+        demo = Demo(settings, center, max_dist, start, vel)
+        return (lambda dt, work: demo.update(dt, work, render.gravity_indicators),
+                lambda: demo.world.bullets)
+
+    old = run(minutes, lambda: legacy(settings, center, max_dist, start, vel))
+    new = run(minutes, bounded)
+    print("minute   legacy ms/frame (bodies)   demo ms/frame (bodies)")
+    for m, ((t_old, n_old), (t_new, n_new)) in enumerate(zip(old, new), 1):
+        print(f"{m:6d}   {t_old*1e3:10.2f} ({n_old:4d})        {t_new*1e3:10.2f} ({n_new:4d})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# benchmarks/bench_diagnostics.py
+#
+# Cost of the conservation monitor (gravitywell.diagnostics) on World.step,
+# sampling every step and every DIAG_EVERY steps, and the energy /
+# angular momentum drift it reports over a friction-free run at a few
+# timesteps -- the numbers an integrator or dt change should not make
+# worse.
+#
+#     python benchmarks/bench_diagnostics.py [seconds] [count]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pygame.math import Vector2
+from gravitywell.diagnostics import Diagnostics, DIAG_EVERY
+from gravitywell.scenarios import populate
+from gravitywell.settings import Settings
+from gravitywell.world import World
+
+W, H = 1920, 1080
+
+
+def make(n, every):
+    settings = Settings()
+    settings.friction = 0
+    world = World(settings, Vector2(W/2, H/2), max(W, H) * 1.5)
+    if every:
+        world.diagnostics = Diagnostics(every)
+    populate(world, "disc", n, inner=150, outer=650)
+    return world
+
+
+def run(n, every, seconds, dt):
+    world = make(n, every)
+    steps = int(seconds / dt)
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        world.step(dt)
+    return (time.perf_counter() - t0) / steps, world
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 60
+    n       = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    print(f"{n} bodies, {seconds:g} s at 60 Hz; ms per step")
+    base, _ = run(n, 0, seconds, 1 / 60)
+    print(f"off                {base*1e3:8.3f}")
+    for every in (1, DIAG_EVERY):
+        t, _ = run(n, every, seconds, 1 / 60)
+        print(f"every {every:3d} steps    {t*1e3:8.3f}   {(t - base) / base * 100:+6.1f}%")
+
+    print(f"\ndrift after {seconds:g} s (bodies left)")
+    print("   dt        energy     angular momentum")
+    for hz in (120, 60, 30, 15):
+        _, world = run(n, DIAG_EVERY, seconds, 1 / hz)
+        last = world.diagnostics.last
+        print(f"1/{hz:<4d}  {last['drift_energy']:+.3e}   {last['drift_angular']:+.3e}"
+              f"   ({len(world.bullets)})")
+
+
+if __name__ == "__main__":
+    main()
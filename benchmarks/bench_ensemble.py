@@ -0,0 +1,47 @@
+# benchmarks/bench_ensemble.py
+#
+# Evaluate a 400 x 250 (speed x angle) launch grid – 10^5 launches – with
+# gravitywell.ensemble and report wall time and the outcome mix.
+#
+#     python benchmarks/bench_ensemble.py
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravitywell import ensemble
+from gravitywell.orbits import OUTCOMES
+from gravitywell.settings import Settings
+
+WIDTH, HEIGHT = 1920, 1080
+CENTER        = (WIDTH/2, HEIGHT/2)
+MAX_DISTANCE  = max(WIDTH, HEIGHT) * 1.5
+
+
+def main():
+    settings = Settings()
+    start  = (CENTER[0] - 300, CENTER[1])
+    angles = np.linspace(0, 360, 250, endpoint=False)
+    speeds = np.linspace(0, 40, 400)
+
+    t0 = time.perf_counter()
+    outcome, ended = ensemble.launch_grid(
+        start, angles, speeds,
+        settings.gv_radius + settings.bullet_radius,
+        settings.gv_mass, settings.friction,
+        CENTER, MAX_DISTANCE
+    )
+    elapsed = time.perf_counter() - t0
+
+    print(f"launches : {outcome.size}")
+    print(f"time     : {elapsed:.2f} s  ({outcome.size/elapsed:,.0f} launches/s)")
+    for code, name in enumerate(OUTCOMES):
+        print(f"{name:8s} : {np.count_nonzero(outcome == code)/outcome.size:6.1%}")
+    print(f"mean flight of non-orbits : {ended[outcome != ensemble.ORBIT].mean():.2f} s")
+
+
+if __name__ == "__main__":
+    main()
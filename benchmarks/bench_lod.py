@@ -0,0 +1,77 @@
+# benchmarks/bench_lod.py
+#
+# Simulation level of detail (gravitywell.lod): N bullets on orbits out to
+# well past the screen edge, so most of them are off screen, stepped by
+# World with and without a LOD.  Reports the time per step, how many
+# bullets were on the coarse path, and how far the bullets that stayed in
+# view the whole run ended up from the full-fidelity run.
+#
+#     python benchmarks/bench_lod.py [seconds] [count ...]
+
+import os
+import sys
+import time
+import numpy as np
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pygame.math import Vector2
+from gravitywell.lod import LOD
+from gravitywell.scenarios import populate
+from gravitywell.settings import Settings
+from gravitywell.world import World
+
+W, H  = 1920, 1080
+DT    = 1 / 60.0
+VIEW  = (0, 0, W, H)
+OUTER = 2400           # orbits reach this far from the centre
+
+
+def make(n, lod, seed=0):
+    """A world with n bullets on near-circular orbits 150..OUTER px out."""
+    center = Vector2(W/2, H/2)
+    world  = World(Settings(), center, max(W, H) * 1.5)
+    if lod:
+        world.lod = LOD()
+        world.lod.view = VIEW
+    populate(world, "disc", n, inner=150, outer=OUTER, seed=seed)
+    return world
+
+
+def in_view(world):
+    x0, y0, x1, y1 = VIEW
+    return {b.id for b in world.bullets if x0 <= b.pos.x <= x1 and y0 <= b.pos.y <= y1}
+
+
+def run(n, lod, seconds):
+    world = make(n, lod)
+    seen  = in_view(world)
+    coarse = 0
+    t0 = time.perf_counter()
+    steps = int(seconds / DT)
+    for _ in range(steps):
+        world.step(DT)
+        seen &= in_view(world)
+        if world.lod:
+            coarse += world.lod.coarse
+    return world, seen, (time.perf_counter() - t0) / steps, coarse / steps
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    counts  = [int(a) for a in sys.argv[2:]] or [500, 1000, 2000]
+    print(f"position error of the bullets in view for all {seconds:g} s")
+    print(" count   full ms   lod ms  speed-up   coarse   in view   err median / max px")
+    for n in counts:
+        full, seen_f, t_full, _ = run(n, False, seconds)
+        lod, seen_l, t_lod, coarse = run(n, True, seconds)
+        ids = seen_f & seen_l
+        err = np.array([(full.get(i).pos - lod.get(i).pos).length() for i in ids])
+        med, top = (np.median(err), err.max()) if len(err) else (0.0, 0.0)
+        print(f"{n:6d}  {t_full*1e3:8.2f} {t_lod*1e3:8.2f}  x{t_full/t_lod:6.1f}  "
+              f"{coarse:7.0f}  {len(ids):8d}   {med:7.3f} / {top:7.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# benchmarks/bench_mesh.py
+#
+# Bullet-bullet gravity backends on dense swarms: the exact all-pairs pass,
+# the heavy-mass truncation (the other approximate backend -- there is no
+# tree code) and the particle mesh (gravitywell.mesh) with and without the
+# P3M short-range correction.  All-pairs and truncation need N x sources
+# memory, so they only run up to EXACT_LIMIT bodies.  Bodies orbit the GV
+# object in a disc;
+# step time is measured on the full physics.step_arrays pass (wells
+# included, which stay exact), and the error is every body's acceleration
+# against all-pairs -- relative to the whole pull and to the bullet part
+# alone.
+#
+#     python benchmarks/bench_mesh.py [count ...]
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravitywell.mesh import MeshSolver
+from gravitywell.physics import step_arrays
+from gravitywell.scenarios import disc
+from gravitywell.scene import Scene
+from gravitywell.settings import Settings
+
+W, H        = 1920, 1080
+DT          = 1 / 60.0
+EXACT_LIMIT = 5000
+NO_WELLS    = (np.zeros((0, 2)), np.zeros(0), np.zeros(0))
+
+
+def swarm(n, seed=0):
+    """n light bodies on near-circular orbits 100..900 px from the well."""
+    settings = Settings()
+    scene  = Scene.from_settings(settings, (W/2, H/2))
+    pos, vel = disc(n, scene.origin, settings.gv_mass, seed=seed)
+    rng    = np.random.default_rng(seed)
+    mass   = rng.integers(1, 6, n) * rng.integers(2, 9, n) ** 2.0
+    radius = np.full(n, float(settings.bullet_radius))
+    return scene, pos, vel, radius, mass, max(W, H) * 1.5
+
+
+def accelerations(pos, radius, mass, wells, origin, max_dist, pairs):
+    p, v = pos.copy(), np.zeros_like(pos)
+    step_arrays(p, v, radius, mass, np.ones(len(pos)), 1.0, wells, origin,
+                max_dist, pairs)
+    return v
+
+
+def timed(pos, vel, radius, mass, wells, origin, max_dist, pairs, steps):
+    p, v = pos.copy(), vel.copy()
+    damp = np.ones(len(pos))
+    step_arrays(p, v, radius, mass, damp, DT, wells, origin, max_dist, pairs)
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        step_arrays(p, v, radius, mass, damp, DT, wells, origin, max_dist, pairs)
+    return (time.perf_counter() - t0) / steps
+
+
+def main():
+    counts = [int(a) for a in sys.argv[1:]] or [2000, 5000, 20000, 50000]
+    print("acceleration error vs all-pairs: median / p99 of the total pull, "
+          "then of the bullet part")
+    print(" count  backend              ms/step        total err              bullet err")
+    for n in counts:
+        scene, pos, vel, radius, mass, max_dist = swarm(n)
+        wells, origin = scene.arrays(), scene.origin
+        backends = [("all-pairs", True), ("heavy >= 100", 100.0)] if n <= EXACT_LIMIT else []
+        backends += [("mesh 256", MeshSolver(256)),
+                     ("mesh 512", MeshSolver(512)),
+                     ("p3m 256", MeshSolver(256, p3m=True)),
+                     ("p3m 512", MeshSolver(512, p3m=True))]
+        exact = exact_pairs = None
+        if n <= EXACT_LIMIT:
+            exact = accelerations(pos, radius, mass, wells, origin, max_dist, True)
+            exact_pairs = accelerations(pos, radius, mass, NO_WELLS, origin, max_dist, True)
+        for name, pairs in backends:
+            steps = 3 if pairs is True else 10
+            t = timed(pos, vel, radius, mass, wells, origin, max_dist, pairs, steps)
+            line = f"{n:6d}  {name:14s}  {t*1e3:10.2f}"
+            if exact is not None and pairs is not True:
+                a  = accelerations(pos, radius, mass, wells, origin, max_dist, pairs)
+                ap = accelerations(pos, radius, mass, NO_WELLS, origin, max_dist, pairs)
+                e  = np.linalg.norm(a - exact, axis=1) / np.linalg.norm(exact, axis=1)
+                ep = (np.linalg.norm(ap - exact_pairs, axis=1)
+                      / np.linalg.norm(exact_pairs, axis=1))
+                line += (f"   {np.median(e):.1e} / {np.percentile(e, 99):.1e}"
+                         f"      {np.median(ep):.1e} / {np.percentile(ep, 99):.1e}")
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/bench_modes.py
+#
+# Per-step cost of every game mode (gravitywell.modes) on the shared World
+# engine, against the per-object Projectile.update loop the stand-alone
+# scripts ran (GW1.py and practice_orbit.py without mutual gravity, the old
+# main game with it).  Bullets start on circular orbits so none leave
+# during the run; practice mode keeps only its single shot.  World.step
+# also keeps the orbit analytics current, which the old loops did not.
+#
+#     python benchmarks/bench_modes.py [steps] [count ...]
+
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pygame.math import Vector2
+from gravitywell.modes import MODES
+from gravitywell.physics import SCORE_TIME
+from gravitywell.scenarios import populate
+from gravitywell.settings import Settings
+from gravitywell.world import World
+
+W, H = 1920, 1080
+DT   = 1 / 60.0
+
+
+def fill(world, n):
+    populate(world, "disc", n, inner=150, outer=650)
+
+
+def engine(mode, n, steps):
+    world = World(Settings(), Vector2(W/2, H/2), max(W, H) * 1.5, mode=mode)
+    fill(world, n)
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        world.step(DT)
+    return (time.perf_counter() - t0) / steps, len(world.bullets)
+
+
+def legacy(mode, n, steps):
+    world = World(Settings(), Vector2(W/2, H/2), max(W, H) * 1.5, mode=mode)
+    fill(world, n)
+    s, bullets, c = world.settings, world.bullets, world.center
+    others = bullets if mode.pairs else ()
+    goal   = mode.goal * 2 * math.pi if mode.goal is not None else None
+    for b in bullets:
+        b.prev_angle = math.atan2(b.pos.y - c.y, b.pos.x - c.x)
+    score = 0.0
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        for b in bullets[:]:
+            b.update(DT, s.gv_radius, s.gv_mass, c, world.max_dist, others)
+            if b.active and goal is not None:
+                ang   = math.atan2(b.pos.y - c.y, b.pos.x - c.x)
+                delta = ang - b.prev_angle
+                if delta > math.pi:  delta -= 2*math.pi
+                if delta < -math.pi: delta += 2*math.pi
+                b.accum_angle += delta
+                b.prev_angle = ang
+                if abs(b.accum_angle) >= goal:
+                    b.active = False
+            if mode.score and b.active and b.arc_time > SCORE_TIME:
+                score += DT
+            if not b.active:
+                bullets.remove(b)
+    return (time.perf_counter() - t0) / steps, len(bullets)
+
+
+def main():
+    steps  = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    counts = [int(a) for a in sys.argv[2:]] or [10, 100, 500]
+    print(f"{steps} steps; ms per step (bodies at the end)")
+    print("mode        count     per-object loop          World.step")
+    for mode in MODES.values():
+        for n in counts:
+            t_old, n_old = legacy(mode, n, steps)
+            t_new, n_new = engine(mode, n, steps)
+            print(f"{mode.name:10s} {n:6d}   {t_old*1e3:9.3f} ({n_old:4d})   "
+                  f"{t_new*1e3:9.3f} ({n_new:4d})   x{t_old/t_new:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
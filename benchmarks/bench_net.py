@@ -0,0 +1,85 @@
+# benchmarks/bench_net.py
+#
+# Loopback throughput of gravitywell.net: a server process with N bodies on
+# circular orbits ticking at 60 Hz, and a headless client in this process
+# decoding every snapshot.  Reports the snapshot rate the client sees, the
+# bandwidth and the server's per-tick cost.
+#
+#     python benchmarks/bench_net.py [bodies] [seconds]
+
+import os
+import sys
+import time
+import asyncio
+import multiprocessing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravitywell import net
+from gravitywell.scenarios import populate
+
+PORT = 8799
+
+
+def serve(n):
+    server = net.Server()
+    populate(server, "disc", n)
+    asyncio.run(server.serve(port=PORT))
+
+
+async def watch(seconds):
+    for _ in range(50):
+        try:
+            conn = await net.Connection.open(port=PORT)
+            break
+        except OSError:
+            await asyncio.sleep(0.1)
+    recv = asyncio.create_task(conn.receive())
+    await asyncio.sleep(1.0)          # let the keyframe and warm-up pass
+    f0, b0, t0 = conn.frames, conn.received, time.perf_counter()
+    await asyncio.sleep(seconds)
+    frames, nbytes = conn.frames - f0, conn.received - b0
+    elapsed = time.perf_counter() - t0
+    recv.cancel()
+    conn.close()
+    return frames / elapsed, nbytes / elapsed, len(conn.view.ids)
+
+
+def main():
+    n       = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+
+    # server tick cost in isolation: physics, then the shared publish pass
+    # and one full-view client's snapshot
+    server = net.Server()
+    populate(server, "disc", n)
+    peer = server.add_peer(None)
+    step = publish = 0.0
+    for _ in range(120):
+        t0 = time.perf_counter()
+        server.step()
+        t1 = time.perf_counter()
+        b = server.bodies
+        server.publisher.update(server.tick, b.ids, b.pos, b.radius, b.mass)
+        peer.snapshot(server.publisher, server.tick, server.time, 0.0,
+                      (None, None) if peer.due(server.tick) else None)
+        t2 = time.perf_counter()
+        step += t1 - t0
+        publish += t2 - t1
+
+    proc = multiprocessing.Process(target=serve, args=(n,), daemon=True)
+    proc.start()
+    try:
+        rate, bw, seen = asyncio.run(watch(seconds))
+    finally:
+        proc.terminate()
+        proc.join()
+
+    print(f"bodies      : {n}  (client sees {seen})")
+    print(f"server tick : step {step/120*1e3:.2f} ms + publish/encode {publish/120*1e3:.2f} ms")
+    print(f"snapshots   : {rate:.1f} Hz over {seconds:.0f} s")
+    print(f"bandwidth   : {bw/1024:.0f} KiB/s  ({bw/max(rate, 1)/n:.2f} bytes/body/snapshot)")
+
+
+if __name__ == "__main__":
+    main()
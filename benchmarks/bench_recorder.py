@@ -0,0 +1,80 @@
+# benchmarks/bench_recorder.py
+#
+# Cost of gravitywell.recorder on a long run: N bodies on circular orbits
+# stepped on the array engine for the given simulated time, recorded every
+# ``every`` ticks.  Reports what recording adds to each tick, how long the
+# writer needs to drain at the end, the size on disk and how long loading
+# the run back takes – next to loading the same samples from JSON.
+#
+#     python benchmarks/bench_recorder.py [bodies] [minutes] [every]
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravitywell import net, recorder
+from gravitywell.scenarios import populate
+
+JSON_SAMPLES = 200     # samples written as JSON for the comparison
+
+
+def main():
+    n       = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    minutes = float(sys.argv[2]) if len(sys.argv) > 2 else 10.0
+    every   = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    ticks   = int(minutes * 60 * net.TICK_RATE)
+
+    server = net.Server()
+    populate(server, "disc", n)
+    out = tempfile.mkdtemp(prefix="gw_record_")
+    try:
+        step = rec = 0.0
+        with recorder.Recorder(out, every) as r:
+            for _ in range(ticks):
+                t0 = time.perf_counter()
+                server.step()
+                t1 = time.perf_counter()
+                r.record_bodies(server.tick, server.time, server.bodies)
+                t2 = time.perf_counter()
+                step += t1 - t0
+                rec  += t2 - t1
+            t0 = time.perf_counter()
+        drain = time.perf_counter() - t0
+        size  = sum(os.path.getsize(f) for f in recorder.chunk_files(out))
+
+        t0  = time.perf_counter()
+        run = recorder.load(out)
+        load_s = time.perf_counter() - t0
+
+        # the same data as JSON records, savegame style, on a sample
+        b = server.bodies
+        sample = [{"tick": k, "bodies": [
+                      {"id": int(i), "pos": p, "vel": v, "mass": m, "arc_time": a, "active": True}
+                      for i, p, v, m, a in zip(b.ids.tolist(), b.pos.tolist(), b.vel.tolist(),
+                                               b.mass.tolist(), b.arc_time.tolist())]}
+                  for k in range(JSON_SAMPLES)]
+        name = os.path.join(out, "sample.json")
+        with open(name, "w") as f:
+            json.dump(sample, f)
+        t0 = time.perf_counter()
+        with open(name) as f:
+            json.load(f)
+        json_s = (time.perf_counter() - t0) * len(run["tick"]) / JSON_SAMPLES
+    finally:
+        shutil.rmtree(out)
+
+    print(f"{n} bodies, {minutes:g} min at {net.TICK_RATE} Hz, every {every} tick(s): "
+          f"{len(run['tick'])} samples, {len(run['id'])} rows")
+    print(f"per tick    : step {step/ticks*1e3:.3f} ms + record {rec/ticks*1e3:.3f} ms")
+    print(f"close       : {drain:.2f} s waiting for the writer")
+    print(f"on disk     : {size/2**20:.0f} MiB in {r.chunks} chunks")
+    print(f"load        : {load_s:.2f} s  (JSON, extrapolated: {json_s:.0f} s)")
+
+
+if __name__ == "__main__":
+    main()
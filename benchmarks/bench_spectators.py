@@ -0,0 +1,81 @@
+# benchmarks/bench_spectators.py
+#
+# Server-side cost of fanning one 10k-body simulation out to many
+# spectators: 100 peers with their own zoomed-in viewports against peers
+# that watch the whole world.  Peers write into counters instead of sockets
+# so only the server's broadcast (interest query + encode) is timed; for the
+# same over real loopback sockets run
+#
+#     python -m gravitywell.net server   and   python -m gravitywell.net loadgen
+#
+#     python benchmarks/bench_spectators.py [bodies] [spectators]
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravitywell import net
+from gravitywell.scenarios import populate
+
+TICKS = 120
+
+
+class NullTransport:
+    def get_write_buffer_size(self):
+        return 0
+
+
+class NullWriter:
+    transport = NullTransport()
+
+    def write(self, data):
+        pass
+
+
+def run(n, views):
+    server = net.Server()
+    populate(server, "disc", n)
+    for v in views:
+        peer = net.Peer(NullWriter())
+        peer.view = v
+        server.peers.add(peer)
+    server.broadcast()                       # first, full sends
+    sent0 = sum(p.sent for p in server.peers)
+    spent = 0.0
+    for _ in range(TICKS):
+        server.step()
+        t0 = time.perf_counter()
+        server.broadcast()
+        spent += time.perf_counter() - t0
+    sent = sum(p.sent for p in server.peers) - sent0
+    per_s = server.tick_rate / TICKS
+    return spent / TICKS, sent * per_s / len(views)
+
+
+def main():
+    n     = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    rng   = random.Random(0)
+    w, h  = net.WIDTH, net.HEIGHT
+
+    views = []
+    for _ in range(count):
+        zoom = rng.uniform(1.0, 4.0)
+        views.append((rng.uniform(0, w), rng.uniform(0, h), w/2/zoom, h/2/zoom))
+    full = max(1, count // 10)
+
+    t_view, bw_view = run(n, views)
+    t_full, bw_full = run(n, [None] * full)
+
+    print(f"bodies {n}, {TICKS} ticks")
+    print(f"{count:4d} viewports  : broadcast {t_view*1e3:6.2f} ms/tick "
+          f"({t_view/count*1e6:5.0f} us per spectator), {bw_view/1024:6.1f} KiB/s each")
+    print(f"{full:4d} full views : broadcast {t_full*1e3:6.2f} ms/tick "
+          f"({t_full/full*1e6:5.0f} us per spectator), {bw_full/1024:6.1f} KiB/s each")
+
+
+if __name__ == "__main__":
+    main()
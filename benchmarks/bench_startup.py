@@ -0,0 +1,47 @@
+# benchmarks/bench_startup.py
+#
+# Import-time cost of the package, measured with ``python -X importtime``.
+# Each target is imported in a fresh interpreter; we report the cumulative
+# self+children time of the target module and its slowest direct imports, and
+# check that importing it did not initialise a display or fonts.
+#
+#     python benchmarks/bench_startup.py [module ...]
+
+import os
+import re
+import subprocess
+import sys
+
+ROOT    = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TARGETS = ["gravitywell.physics", "gravitywell.scene", "gravitywell.render",
+           "gravitywell.app"]
+PROBE   = ("import {mod}, sys; pg = sys.modules.get('pygame'); "
+           "print(bool(pg and pg.display.get_init()), bool(pg and pg.font.get_init()))")
+LINE    = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def measure(mod):
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", PROBE.format(mod=mod)],
+                         cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    rows = []
+    for line in out.stderr.splitlines():
+        m = LINE.match(line)
+        if m:
+            rows.append((int(m.group(2)), (len(m.group(3)) - 1) // 2, m.group(4)))
+    total = sum(cum for cum, depth, _ in rows if depth == 0)
+    top   = sorted((r for r in rows if r[1] == 1), reverse=True)[:5]
+    display, fonts = out.stdout.split()
+    return total, top, display == "True", fonts == "True"
+
+
+def main():
+    for mod in sys.argv[1:] or TARGETS:
+        total, top, display, fonts = measure(mod)
+        print(f"{mod:22s} {total/1000:8.1f} ms   display={display} fonts={fonts}")
+        for cum, depth, name in top:
+            print(f"    {cum/1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# benchmarks/bench_truncation.py
+#
+# Mass-aware force truncation (``pairs=<mass>`` in physics.step_arrays): N
+# bodies on orbits around the GV object, a few percent of them heavy
+# (the largest bullet the settings allow) and the rest light shots of
+# random size.  For each heavy-mass limit it reports the step time against
+# the exact all-pairs pass and the error it introduces: the relative
+# difference in every body's acceleration on the same state, and how far
+# the bodies have drifted apart after simulating both for a few seconds.
+# ``ignored`` is the mass that no longer acts as a source relative to the
+# well's: the error follows it, so the default well (9000) is compared
+# with a heavy one.
+#
+#     python benchmarks/bench_truncation.py [seconds] [count ...]
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravitywell.bodies import Bodies
+from gravitywell.physics import step_arrays
+from gravitywell.scenarios import disc
+from gravitywell.scene import Scene
+from gravitywell.settings import (
+    Settings, BULLET_DENSITY_RANGE, BULLET_RADIUS_RANGE
+)
+
+W, H      = 1920, 1080
+DT        = 1 / 60.0
+HEAVY     = 0.02       # fraction of heavy bodies
+LIMITS    = (True, 100.0, 1000.0)
+WELLS     = {"default": {}, "heavy": {"gv_radius": 60, "gv_density": 100}}
+
+
+def make(n, well=None, seed=0):
+    """A scene and n orbiting bodies: HEAVY of them at the largest mass."""
+    settings = Settings()
+    settings.update(**(well or {}))
+    center   = (W/2, H/2)
+    scene    = Scene.from_settings(settings, center)
+    pos, vel = disc(n, center, settings.gv_mass, jitter=0.1, seed=seed)
+    rng  = np.random.default_rng(seed)
+    mass = rng.integers(1, 6, n) * rng.integers(2, 9, n) ** 2.0    # 4 .. 320
+    mass[rng.random(n) < HEAVY] = BULLET_DENSITY_RANGE[1] * BULLET_RADIUS_RANGE[1] ** 2
+    bodies = Bodies()
+    for p, u, m in zip(pos, vel, mass):
+        bodies.spawn(p, u, settings.bullet_radius, m, 0.0)
+    return scene, bodies, max(W, H) * 1.5, settings.gv_mass
+
+
+def accelerations(scene, bodies, max_dist, pairs):
+    """Every body's acceleration on the current state (bodies untouched)."""
+    pos, vel = bodies.pos.copy(), bodies.vel.copy()
+    before   = vel.copy()
+    step_arrays(pos, vel, bodies.radius, bodies.mass, np.ones(len(bodies)), 1.0,
+                scene.arrays(), scene.origin, max_dist, pairs)
+    return vel - before
+
+
+def timed(scene, bodies, max_dist, pairs, steps=20):
+    pos, vel = bodies.pos.copy(), bodies.vel.copy()
+    damp = np.ones(len(bodies))
+    wells = scene.arrays()
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        step_arrays(pos, vel, bodies.radius, bodies.mass, damp, DT,
+                    wells, scene.origin, max_dist, pairs)
+    return (time.perf_counter() - t0) / steps
+
+
+def run(n, well, pairs, seconds):
+    scene, bodies, max_dist, _ = make(n, well)
+    for _ in range(int(seconds / DT)):
+        bodies.step(DT, scene, max_dist, pairs)
+    return bodies
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    counts  = [int(a) for a in sys.argv[2:]] or [500, 2000]
+    print(f"{HEAVY:.0%} heavy bodies; acceleration error on one state, "
+          f"position error after {seconds:g} s")
+    print("well     count  heavy >=  ignored   ms/step  speed-up   "
+          "accel err median / p99      pos err median / p99 px")
+    for name, well in WELLS.items():
+        for n in counts:
+            scene, bodies, max_dist, gv_mass = make(n, well)
+            exact_acc = accelerations(scene, bodies, max_dist, True)
+            exact_t   = timed(scene, bodies, max_dist, True)
+            exact_run = run(n, well, True, seconds)
+            for limit in LIMITS:
+                exact = limit is True
+                t = exact_t if exact else timed(scene, bodies, max_dist, limit)
+                acc = accelerations(scene, bodies, max_dist, limit)
+                err = (np.linalg.norm(acc - exact_acc, axis=1)
+                       / np.maximum(np.linalg.norm(exact_acc, axis=1), 1e-12))
+                final = exact_run if exact else run(n, well, limit, seconds)
+                _, a, b = np.intersect1d(exact_run.ids, final.ids, return_indices=True)
+                drift = np.linalg.norm(exact_run.pos[a] - final.pos[b], axis=1)
+                ignored = 0.0 if exact else bodies.mass[bodies.mass < limit].sum() / gv_mass
+                label = "exact" if exact else f"{limit:g}"
+                print(f"{name:8s} {n:5d}  {label:>8s}  {ignored:7.2f}  {t*1e3:8.2f}  "
+                      f"x{exact_t/t:6.1f}   {np.median(err):.1e} / {np.percentile(err, 99):.1e}"
+                      f"      {np.median(drift):7.3f} / {np.percentile(drift, 99):8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+# gravitywell/__init__.py
+#
+# GravityWell as an importable package:
+#
+#   gravitywell.physics   projectiles and integrators (no display)
+#   gravitywell.orbits    orbit analytics: accumulated angle, elements, fate
+#   gravitywell.bodies    struct-of-arrays body store for the array engine
+#   gravitywell.mesh      particle-mesh (FFT) gravity for dense swarms
+#   gravitywell.lod       coarse steps for far / off-screen bullets
+#   gravitywell.scene     gravity-well scenes
+#   gravitywell.settings  tweakable ranges & persistence
+#   gravitywell.render    drawing helpers, lazily created fonts
+#   gravitywell.trails    ghost trails in a fixed-size ring buffer
+#   gravitywell.governor  frame-budget governor that sheds optional work
+#   gravitywell.fork      world snapshots and background "what if" shots
+#   gravitywell.stats     incremental scoring count, oldest bullet, HUD aggregates
+#   gravitywell.scenarios bulk bullet distributions (ring, disc, clusters)
+#   gravitywell.world     display-free game state: bullets, wells, score
+#   gravitywell.modes     game variants (multibody, classic, practice) as configs
+#   gravitywell.app       the interactive game (python -m gravitywell)
+#   gravitywell.input     event dispatch table for the app
+#   gravitywell.about     tutorial demo screen
+#   gravitywell.ensemble  batch evaluation of many launches
+#   gravitywell.sweep     headless parameter sweeps (python -m gravitywell.sweep)
+#   gravitywell.net       physics server / thin client (python -m gravitywell.net)
+#   gravitywell.recorder  per-tick state export to chunked NPZ files
+#   gravitywell.diagnostics  energy / angular momentum conservation monitor
+#
+# Submodules are deliberately not imported here so that
+# ``import gravitywell.physics`` stays cheap.
@@ -0,0 +1,5 @@
+# gravitywell/__main__.py
+
+from .app import main
+
+main()
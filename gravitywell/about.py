@@ -0,0 +1,145 @@
+# gravitywell/about.py
+#
+# The About / tutorial screen.  Its auto-play demo runs on the same World
+# and batched physics step as the game, with a cap on the number of bodies
+# (oldest evicted first) and a spawn rate that backs off when frames get
+# too expensive, so the screen costs the same however long it stays open.
+
+import sys
+import time
+import pygame
+from . import render
+from .settings import Settings
+from .world import World
+
+DEMO_INTERVAL = 2.0     # seconds between demo shots when there is headroom
+MAX_INTERVAL  = 16.0    # slowest the demo backs off to
+MAX_BODIES    = 40      # body budget; the oldest demo shot is evicted first
+MIN_BODIES    = 4
+FRAME_BUDGET  = 0.008   # seconds of update + draw work per frame to stay under
+SMOOTHING     = 0.05    # weight of the newest frame in the work average
+
+class Demo:
+    """
+    The self-throttling demo: fires from ``start`` every ``interval``
+    seconds, toward the GV object unless a shot velocity ``vel`` is given.
+    ``update`` takes the work time of the previous frame; while its running
+    average is over FRAME_BUDGET the interval doubles and the body limit
+    shrinks, and both recover slowly once there is headroom again.
+    """
+    def __init__(self, settings, center, max_dist, start, vel=None):
+        self.world    = World(settings, center, max_dist)
+        self.start    = pygame.math.Vector2(start)
+        self.vel      = vel
+        self.interval = DEMO_INTERVAL
+        self.limit    = MAX_BODIES
+        self.timer    = 0.0
+        self.work     = 0.0
+        self.evicted  = 0
+
+    def adapt(self, work):
+        self.work += (work - self.work) * SMOOTHING
+        if self.work > FRAME_BUDGET:
+            self.interval = min(MAX_INTERVAL, self.interval * 2)
+            self.limit    = max(MIN_BODIES, min(self.limit, len(self.world.bullets)) - 1)
+            self.work     = FRAME_BUDGET      # give the change time to show
+        elif self.work < 0.5 * FRAME_BUDGET:
+            self.interval = max(DEMO_INTERVAL, self.interval * 0.99)
+            if self.limit < MAX_BODIES and len(self.world.bullets) >= self.limit:
+                self.limit += 1
+
+    def update(self, dt, work=0.0, components=False):
+        self.adapt(work)
+        world = self.world
+        self.timer += dt
+        if self.timer >= self.interval:
+            self.timer = 0.0
+            vel = self.vel
+            if vel is None:
+                vel = (world.center - self.start) * (world.settings.drag_scale / 10)
+            world.spawn(self.start, vel)
+        excess = len(world.bullets) - self.limit
+        if excess > 0:
+            world.remove(world.bullets[:excess])    # spawn order = age
+            self.evicted += excess
+        world.step(dt, components=components)
+
+def run_about(screen):
+    """
+    Show the About/tutorial screen with an auto‑play demo.
+    Press ESC to return.
+    """
+    clock = pygame.time.Clock()
+    font  = render.font(28)
+    small = render.font(20)
+    settings = Settings()
+
+    WIDTH, HEIGHT = screen.get_size()
+    CENTER = pygame.math.Vector2(WIDTH/2, HEIGHT/2)
+    MAX_DIST = max(WIDTH, HEIGHT) * 1.5
+    demo = Demo(settings, CENTER, MAX_DIST, (100, HEIGHT - 100))
+
+    instructions = [
+        "Gravity Well — Tutorial",
+        "",
+        "Click & drag to shoot objects into the well.",
+        "Try to catch them in orbit instead of crashing.",
+        "",
+        "Auto‑demo firing every 2s from bottom‑left",
+        "",
+        "P = pause    G = toggle gravity vectors",
+        "D = toggle head/tail arrows    S = in‑game menu",
+        "Mouse wheel or +/- = zoom in/out",
+        "",
+        "Press ESC to return to the main menu"
+    ]
+
+    running = True
+    work = 0.0
+    while running:
+        dt = clock.tick(60) / 1000.0
+        t0 = time.perf_counter()
+
+        for ev in pygame.event.get():
+            if ev.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
+                running = False
+
+        # auto‑fire, evict and step the demo bullets
+        demo.update(dt, work, components=render.gravity_indicators)
+
+        # draw background
+        screen.fill((0, 0, 0))
+
+        # draw GV object
+        pygame.draw.circle(
+            screen,
+            (0, 100, 255),
+            (int(CENTER.x), int(CENTER.y)),
+            settings.gv_radius
+        )
+
+        # draw bullets
+        for b in demo.world.bullets:
+            render.draw_projectile(screen, b, (255, 255, 255))
+
+        # draw instructions
+        y = 20
+        for line in instructions:
+            surf = font.render(line, True, (200, 200, 200))
+            screen.blit(surf, (20, y))
+            y += 30
+        status = (f"demo: {len(demo.world.bullets)}/{demo.limit} bodies, "
+                  f"a shot every {demo.interval:.1f}s")
+        screen.blit(small.render(status, True, (120, 120, 120)), (20, HEIGHT - 30))
+
+        pygame.display.flip()
+        work = time.perf_counter() - t0
+
+if __name__ == "__main__":
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    run_about(screen)
+    pygame.quit()
@@ -0,0 +1,873 @@
+# gravitywell/app.py
+#
+# The interactive game.  Nothing here runs at import time: the display,
+# clock and fonts are only created by App() / main().
+
+import os
+import sys
+import json
+import time
+import argparse
+import pygame
+from . import about, render
+import numpy as np
+from .render import mass_to_color, to_screen, screen_to_world, path_to_screen
+from .settings import (
+    Settings, clamp,
+    GV_RADIUS_RANGE, GV_DENSITY_RANGE,
+    BULLET_RADIUS_RANGE, BULLET_DENSITY_RANGE,
+    GAME_SAVE_FILE, SETTINGS_FILE
+)
+from .physics import simulate_trajectory, simulate_scene_trajectory
+from .scene import Scene
+from .world import World
+from .modes import MODES, DEFAULT_MODE
+from .recorder import Recorder
+from .mesh import MeshSolver, solver_for
+from .lod import LOD
+from .trails import Trails
+from .fork import Forker
+from .scenarios import SCENARIOS, populate
+from .governor import Governor, SHED_VECTORS, SHED_ARROWS, SHED_PREVIEW, SHED_PHYSICS
+from .diagnostics import Diagnostics, DIAG_EVERY
+from .orbits import OUTCOMES, CRASH, ESCAPE, ORBIT, orbit_count
+from .input import Dispatcher, TextLayout, coalesce_motion, hit_index
+
+STATE_MENU     = "MENU"
+STATE_SETTINGS = "SETTINGS"
+STATE_SAVELOAD = "SAVELOAD"
+STATE_PLAY     = "PLAY"
+FPS            = 60
+
+menu_items       = ["Start Game", "About", "Settings", "Save/Load", "Quit"]
+save_items       = ["Save Game", "Load Game", "Back"]
+settings_options = [
+    ("GV Radius",      "gv_radius"),
+    ("GV Density",     "gv_density"),
+    ("Bullet Radius",  "bullet_radius"),
+    ("Bullet Density", "bullet_density"),
+    ("Drag Scale",     "drag_scale"),
+    ("Friction",       "friction"),
+    ("Save Settings",  None),
+    ("Load Settings",  None),
+    ("Back",           None),
+]
+
+# hold‑to‑repeat support for in‑game +/- buttons
+HOLD_DELAY_INITIAL = 0.5
+HOLD_DELAY_REPEAT  = 0.1
+
+gv_min  = GV_DENSITY_RANGE[0] * (GV_RADIUS_RANGE[0]**2)
+gv_max  = GV_DENSITY_RANGE[1] * (GV_RADIUS_RANGE[1]**2)
+bul_min = BULLET_DENSITY_RANGE[0] * (BULLET_RADIUS_RANGE[0]**2)
+bul_max = BULLET_DENSITY_RANGE[1] * (BULLET_RADIUS_RANGE[1]**2)
+
+ZOOM_STEP = 0.1
+# physics steps in the trajectory preview; with the governor shedding
+# preview resolution it takes PREVIEW_COARSE times fewer, longer steps
+PREVIEW_STEPS  = 200
+PREVIEW_COARSE = 4
+
+# time warp (W cycles it): fixed physics steps per rendered frame, None
+# running them flat out and drawing only WARP_MAX_REFRESH times a second
+WARP_LEVELS      = (1, 4, 16, None)
+WARP_MAX_REFRESH = 4
+
+# "what if" forks (F while aiming): the aimed shot and shots this many
+# degrees to either side, and their overlay colours
+FORK_SPREAD = 5
+FORK_COLORS = ((255,120,220), (120,220,255), (255,220,120))
+
+# bullets added per B press (the scenarios take turns), and how long the
+# HUD names the one just added, in seconds
+BULK_COUNT  = 1000
+NOTICE_TIME = 2.0
+
+# gravity indicators are one arrow per source per bullet (N x N with mutual
+# gravity); above this many arrows they are neither kept nor drawn, so a
+# bulk load does not stall on them before the governor can shed them
+VECTOR_LIMIT = 20000
+
+# bar width and height of the HUD's distance histogram, in px
+HIST_BAR    = 10
+HIST_HEIGHT = 40
+
+# samples in the HUD's energy drift plot, and its width in px
+DIAG_PLOT       = 200
+DIAG_PLOT_WIDTH = 300
+
+# what a practice-mode shot ended as
+RESULT_TEXT = {CRASH: "Crashed!", ESCAPE: "Lost!", ORBIT: "Orbit!"}
+
+# selected‑bullet speed buttons and the in‑game overlay's +/- buttons
+SPEED_MINUS_RECT = pygame.Rect(180, 90, 20, 20)
+SPEED_PLUS_RECT  = pygame.Rect(210, 90, 20, 20)
+OVERLAY_BUTTONS  = [
+    (attr, pygame.Rect(60, 60+i*40, 30, 30), pygame.Rect(310, 60+i*40, 30, 30))
+    for i, (disp, attr) in enumerate(settings_options) if attr
+]
+
+class App:
+    def __init__(self, scene_file=None, record=None, record_every=1, mode=None,
+                 diagnostics=None, watch_settings=False, heavy=None, mesh=None,
+                 lod=None, preview_steps=PREVIEW_STEPS, governor=True,
+                 bulk=BULK_COUNT, record_deltas=False):
+        pygame.init()
+        self.screen   = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        self.width, self.height = self.screen.get_size()
+        self.center   = pygame.math.Vector2(self.width/2, self.height/2)
+        self.max_dist = max(self.width, self.height) * 1.5
+        self.clock    = pygame.time.Clock()
+
+        self.settings = Settings()
+        self.settings.subscribe(self.on_settings_changed)
+        # optional scene file (JSON/TOML), else the classic single well
+        scene         = Scene.load(scene_file, self.center) if scene_file else None
+        self.world    = World(self.settings, self.center, self.max_dist, scene, mode)
+        pygame.display.set_caption(self.world.mode.title)
+        if heavy and self.world.pairs:
+            self.world.pairs = heavy    # only bullets this heavy pull on others
+        if mesh and self.world.pairs:
+            self.world.pairs = mesh     # a mesh.MeshSolver for dense swarms
+        if lod:
+            self.world.lod = LOD(lod)   # far / off-screen bullets step coarsely
+        # frame-budget governor: sheds optional work while frames run long;
+        # the physics chosen here is what it restores
+        self.governor = Governor(1.0 / FPS) if governor else None
+        self.physics  = (self.world.pairs, self.world.lod)
+        self.meshes   = {}    # p3m -> MeshSolver for shed physics, kept for its kernels
+        self.world.stats.aggregates = True    # mean speed / histogram for the HUD
+        # derived drawing state, dropped when the settings change
+        self.well_colors   = None    # (scene, colour per well)
+        self.preview_key   = None
+        self.preview_steps = preview_steps
+        # preview points in world and screen space, reused every frame
+        self.preview_buf   = np.empty((preview_steps, 2))
+        self.preview_pts   = np.empty((preview_steps, 2))
+        self.preview_path  = self.preview_buf[:0]
+        self.bullet_colors = {}      # mass -> colour
+        if watch_settings:
+            # re-read settings.json whenever it is saved (polled in update)
+            self.settings.watch(SETTINGS_FILE)
+        # optional per-tick state export, see gravitywell.recorder
+        self.recorder = Recorder(record, record_every, meta={"scene": scene_file},
+                                 deltas=record_deltas) if record else None
+        self.tick     = 0
+        # conservation monitor (E toggles it), see gravitywell.diagnostics
+        self.diag_every = diagnostics or DIAG_EVERY
+        if diagnostics:
+            self.world.diagnostics = Diagnostics(diagnostics)
+
+        self.state           = STATE_MENU
+        self.menu_idx        = self.save_idx = self.settings_idx = 0
+        self.paused          = False
+        self.dragging        = False
+        self.drag_start      = pygame.math.Vector2(0, 0)
+        self.in_game_menu    = False
+        self.selected_id     = None   # world id of the inspected bullet
+        self.result          = ""     # how the last shot ended (goal modes)
+        self.warp            = 1      # one of WARP_LEVELS
+        self.warp_steps      = 0      # physics steps in the last frame
+        self.trails          = Trails()   # ghost trails (T toggles them)
+        self.forker          = None       # "what if" forks, started on first use
+        self.bulk            = bulk       # bullets per scenario (B)
+        self.bulk_next       = 0          # index into SCENARIOS
+        self.notice          = ("", 0.0)  # (text, shown until perf_counter)
+        self.show_trails     = True
+
+        self.hold_attr  = None
+        self.hold_sign  = 0
+        self.hold_timer = 0.0
+
+        # camera / zoom
+        self.zoom = 1.0
+        render.camera_center = self.center
+        render.camera_zoom   = self.zoom
+
+        # widget rects for hit-testing, measured once instead of per event
+        self.layout     = TextLayout(render.font(36))
+        self.menu_rects = [self.layout.rect(it, center=(self.center.x, 200+i*50))
+                           for i, it in enumerate(menu_items)]
+        self.save_rects = [self.layout.rect(it, center=(self.center.x, 200+i*50))
+                           for i, it in enumerate(save_items)]
+        self.dispatcher = Dispatcher()
+        self.bind_events()
+
+    # ── persistence ─────────────────────────────────────────────────────────
+    def save_game(self):
+        data = {
+            "settings": self.settings.to_dict(),
+            **self.world.to_dict(),
+            "scene": self.world.scene.to_dict()
+        }
+        with open(GAME_SAVE_FILE, "w") as f:
+            json.dump(data, f, indent=2)
+
+    def load_game(self):
+        with open(GAME_SAVE_FILE, "r") as f:
+            data = json.load(f)
+        if "settings" in data:
+            self.settings.load()
+        if "scene" in data:
+            self.world.scene = Scene.from_dict(data["scene"], self.center)
+        self.world.load_dict(data)
+        self.well_colors = None
+
+    def on_settings_changed(self, settings, changed):
+        # settings subscriber: drop the cached well colours and trajectory
+        # preview
+        self.well_colors = None
+        self.preview_key = None
+
+    # ── helpers ─────────────────────────────────────────────────────────────
+    @property
+    def selected_bullet(self):
+        """The inspected bullet, or None once it has crashed or escaped."""
+        return self.world.get(self.selected_id)
+
+    def quit(self):
+        if self.recorder:
+            self.recorder.close()
+        if self.forker:
+            self.forker.close()
+        pygame.quit()
+        sys.exit()
+
+    def start_game(self):
+        self.state = STATE_PLAY
+        self.world.clear()
+        self.paused = False
+        self.result = ""
+        if self.forker:
+            self.forker.cancel()
+
+    def choose_menu(self, c):
+        if c == "Start Game":
+            self.start_game()
+        elif c == "About":
+            about.run_about(self.screen)
+        elif c == "Settings":
+            self.state = STATE_SETTINGS
+        elif c == "Save/Load":
+            self.state = STATE_SAVELOAD
+        elif c == "Quit":
+            self.quit()
+
+    def choose_saveload(self, c):
+        if c == "Save Game":
+            self.save_game()
+        elif c == "Load Game":
+            self.load_game(); self.state = STATE_PLAY; self.paused = False
+        elif c == "Back":
+            self.state = STATE_MENU
+
+    def set_zoom(self, zoom):
+        self.zoom = max(0.2, min(3.0, zoom))
+        render.camera_zoom = self.zoom
+
+    # ── events ──────────────────────────────────────────────────────────────
+    def bind_events(self):
+        d = self.dispatcher
+        d.on(None,           pygame.QUIT,            lambda ev: self.quit())
+        d.on(STATE_MENU,     pygame.MOUSEMOTION,     self.on_menu_motion)
+        d.on(STATE_MENU,     pygame.MOUSEBUTTONDOWN, self.on_menu_click)
+        d.on(STATE_MENU,     pygame.KEYDOWN,         self.on_menu_key)
+        d.on(STATE_SETTINGS, pygame.MOUSEMOTION,     self.on_settings_motion)
+        d.on(STATE_SETTINGS, pygame.MOUSEBUTTONDOWN, self.on_settings_click)
+        d.on(STATE_SETTINGS, pygame.KEYDOWN,         self.on_settings_key)
+        d.on(STATE_SAVELOAD, pygame.MOUSEMOTION,     self.on_saveload_motion)
+        d.on(STATE_SAVELOAD, pygame.MOUSEBUTTONDOWN, self.on_saveload_click)
+        d.on(STATE_SAVELOAD, pygame.KEYDOWN,         self.on_saveload_key)
+        d.on(STATE_PLAY,     pygame.KEYDOWN,         self.on_play_key)
+        d.on(STATE_PLAY,     pygame.MOUSEWHEEL,      self.on_play_wheel)
+        d.on(STATE_PLAY,     pygame.MOUSEBUTTONDOWN, self.on_play_mousedown)
+        d.on(STATE_PLAY,     pygame.MOUSEBUTTONUP,   self.on_play_mouseup)
+
+    def settings_text(self, disp, attr):
+        return disp if attr is None else f"{disp}: {getattr(self.settings, attr)}"
+
+    def settings_rect(self, i):
+        disp, attr = settings_options[i]
+        return self.layout.rect(self.settings_text(disp, attr), topleft=(100, 150+i*50))
+
+    # Main menu
+    def on_menu_motion(self, ev):
+        i = hit_index(self.menu_rects, ev.pos)
+        if i is not None:
+            self.menu_idx = i
+
+    def on_menu_click(self, ev):
+        if ev.button == 1:
+            self.choose_menu(menu_items[self.menu_idx])
+
+    def on_menu_key(self, ev):
+        if ev.key in (pygame.K_UP, pygame.K_DOWN):
+            self.menu_idx = (self.menu_idx + (1 if ev.key==pygame.K_DOWN else -1)) % len(menu_items)
+        elif ev.key == pygame.K_RETURN:
+            self.choose_menu(menu_items[self.menu_idx])
+        elif ev.key == pygame.K_ESCAPE:
+            self.state = STATE_PLAY; self.paused = False
+
+    # Settings screen
+    def on_settings_motion(self, ev):
+        for i in range(len(settings_options)):
+            if self.settings_rect(i).collidepoint(ev.pos):
+                self.settings_idx = i
+
+    def on_settings_click(self, ev):
+        if ev.button != 1:
+            return
+        settings = self.settings
+        disp, attr = settings_options[self.settings_idx]
+        if attr is None:
+            if disp=="Back":
+                self.state = STATE_MENU
+            elif disp=="Save Settings":
+                settings.save()
+            elif disp=="Load Settings":
+                settings.load()
+        else:
+            r = self.settings_rect(self.settings_idx)
+            delta = -1 if ev.pos[0]<r.centerx else 1
+            setattr(settings,attr,clamp(attr,getattr(settings,attr)+delta))
+
+    def on_settings_key(self, ev):
+        settings = self.settings
+        if ev.key in (pygame.K_UP, pygame.K_DOWN):
+            self.settings_idx = (self.settings_idx + (1 if ev.key==pygame.K_DOWN else -1)) % len(settings_options)
+        elif ev.key in (pygame.K_LEFT, pygame.K_RIGHT):
+            disp, attr = settings_options[self.settings_idx]
+            if attr:
+                delta = -1 if ev.key==pygame.K_LEFT else 1
+                setattr(settings,attr,clamp(attr,getattr(settings,attr)+delta))
+        elif ev.key==pygame.K_RETURN and settings_options[self.settings_idx][0]=="Back":
+            self.state = STATE_MENU
+        elif ev.key==pygame.K_ESCAPE:
+            self.state = STATE_MENU
+
+    # Save/Load screen
+    def on_saveload_motion(self, ev):
+        i = hit_index(self.save_rects, ev.pos)
+        if i is not None:
+            self.save_idx = i
+
+    def on_saveload_click(self, ev):
+        if ev.button == 1:
+            self.choose_saveload(save_items[self.save_idx])
+
+    def on_saveload_key(self, ev):
+        if ev.key in (pygame.K_UP, pygame.K_DOWN):
+            self.save_idx = (self.save_idx + (1 if ev.key==pygame.K_DOWN else -1)) % len(save_items)
+        elif ev.key == pygame.K_RETURN:
+            self.choose_saveload(save_items[self.save_idx])
+        elif ev.key==pygame.K_ESCAPE:
+            self.state = STATE_MENU
+
+    # Play state
+    def on_play_key(self, ev):
+        # zoom controls
+        if ev.key in (pygame.K_EQUALS, pygame.K_KP_PLUS):
+            self.set_zoom(self.zoom + ZOOM_STEP)
+        elif ev.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.set_zoom(self.zoom - ZOOM_STEP)
+        # toggles
+        elif ev.key == pygame.K_p:
+            self.paused = not self.paused
+        elif ev.key == pygame.K_g:
+            render.gravity_indicators = not render.gravity_indicators
+        elif ev.key == pygame.K_d:
+            render.show_head_tail = not render.show_head_tail
+        elif ev.key == pygame.K_f:
+            self.fork_shots()
+        elif ev.key == pygame.K_b:
+            self.spawn_scenario()
+        elif ev.key == pygame.K_t:
+            self.show_trails = not self.show_trails
+            self.trails.clear()
+        elif ev.key == pygame.K_s:
+            self.in_game_menu = not self.in_game_menu
+        elif ev.key == pygame.K_e:
+            self.world.diagnostics = (None if self.world.diagnostics
+                                      else Diagnostics(self.diag_every))
+        elif ev.key == pygame.K_w:
+            i = WARP_LEVELS.index(self.warp)
+            self.warp = WARP_LEVELS[(i + 1) % len(WARP_LEVELS)]
+        # retry (modes with a goal)
+        elif ev.key == pygame.K_SPACE and self.world.mode.goal is not None:
+            self.world.clear()
+            self.result = ""
+        # ESC behavior
+        elif ev.key == pygame.K_ESCAPE:
+            if self.in_game_menu:
+                self.in_game_menu = False
+            else:
+                self.save_game()
+                self.state = STATE_MENU
+                self.paused = False
+
+    def on_play_wheel(self, ev):
+        self.set_zoom(self.zoom + ev.y * ZOOM_STEP)
+
+    def on_play_mousedown(self, ev):
+        if ev.button != 1:
+            return
+        settings = self.settings
+
+        # in‑game settings +/- click
+        if self.in_game_menu:
+            for attr, minus, plus in OVERLAY_BUTTONS:
+                if minus.collidepoint(ev.pos):
+                    setattr(settings,attr,clamp(attr,getattr(settings,attr)-1))
+                    self.hold_attr,self.hold_sign,self.hold_timer = attr,-1,0.0
+                elif plus.collidepoint(ev.pos):
+                    setattr(settings,attr,clamp(attr,getattr(settings,attr)+1))
+                    self.hold_attr,self.hold_sign,self.hold_timer = attr,1,0.0
+            return
+
+        # adjust speed via +/- buttons w/out spawning
+        sel = self.selected_bullet
+        if sel:
+            if SPEED_MINUS_RECT.collidepoint(ev.pos):
+                mag = sel.vel.length()
+                mag = max(0.0, mag - 0.1)
+                sel.vel = sel.vel.normalize() * mag
+                self.world.touch(sel)
+                return
+            elif SPEED_PLUS_RECT.collidepoint(ev.pos):
+                mag = sel.vel.length()
+                mag += 0.1
+                sel.vel = sel.vel.normalize() * mag
+                self.world.touch(sel)
+                return
+
+        # left‑click starts aiming
+        if not self.paused:
+            self.dragging   = True
+            self.drag_start = screen_to_world(pygame.math.Vector2(ev.pos))
+
+    def on_play_mouseup(self, ev):
+        if ev.button == 1:
+            self.hold_attr = None
+            # release fires
+            if not self.paused and self.dragging:
+                self.dragging = False
+                drag_end = screen_to_world(pygame.math.Vector2(ev.pos))
+                vel = self.world.launch_velocity(self.drag_start, drag_end)
+                self.world.spawn(self.drag_start, vel)
+
+        # right‑click select
+        elif ev.button == 3:
+            click_world = screen_to_world(pygame.math.Vector2(ev.pos))
+            self.selected_id = None
+            for b in self.world.bullets:
+                if (b.pos-click_world).length() <= b.radius*2:
+                    self.selected_id = b.id
+                    break
+
+    # ── per‑frame update ────────────────────────────────────────────────────
+    def update_hold(self, dt):
+        # handle hold‑to‑repeat for in‑game +/- buttons
+        if self.in_game_menu and self.hold_attr:
+            if pygame.mouse.get_pressed()[0]:
+                self.hold_timer += dt
+                delay = HOLD_DELAY_INITIAL if self.hold_timer < HOLD_DELAY_INITIAL else HOLD_DELAY_REPEAT
+                if self.hold_timer >= delay:
+                    cur = getattr(self.settings, self.hold_attr)
+                    setattr(self.settings, self.hold_attr, clamp(self.hold_attr, cur + self.hold_sign))
+                    self.hold_timer -= delay
+            else:
+                self.hold_attr = None
+
+    def update(self, dt):
+        self.settings.poll()
+        self.world.sync()
+
+        # physics update
+        if self.state==STATE_PLAY and not self.paused:
+            if self.world.lod:
+                # the visible world rectangle; bullets outside it may go coarse
+                x0, y0 = screen_to_world(pygame.math.Vector2(0, 0))
+                x1, y1 = screen_to_world(pygame.math.Vector2(self.width, self.height))
+                self.world.lod.view = (x0, y0, x1, y1)
+            if self.physics[0] is True and self.shed(SHED_PHYSICS):
+                # the mesh follows the bullet count
+                self.world.pairs = solver_for(len(self.world.bullets), self.meshes)
+            components = render.gravity_indicators and self.vectors()
+            if self.warp == 1:
+                self.step_world(dt, components)
+                self.warp_steps = 1
+            else:
+                # fixed steps of one nominal frame each, so scoring and
+                # arc times add up as in real time; only the last step is
+                # drawn, and only it keeps the gravity-indicator components
+                h, steps = 1.0 / FPS, 0
+                if self.warp is None:
+                    end = time.perf_counter() + 1.0 / WARP_MAX_REFRESH
+                    while time.perf_counter() < end:
+                        self.step_world(h, False)
+                        steps += 1
+                else:
+                    for _ in range(self.warp - 1):
+                        self.step_world(h, False)
+                        steps += 1
+                self.step_world(h, components)
+                self.warp_steps = steps + 1
+
+    def shed(self, level):
+        """True while the governor has shed the work of ``level``."""
+        return self.governor is not None and self.governor.level >= level
+
+    def vectors(self):
+        """Whether the gravity-indicator arrows are kept and drawn."""
+        n = len(self.world.bullets)
+        sources = len(self.world.scene.wells) + (n if self.world.pairs else 0)
+        return not self.shed(SHED_VECTORS) and n * sources <= VECTOR_LIMIT
+
+    def on_level_changed(self):
+        # swap in approximate physics (mutual gravity on a particle mesh,
+        # see mesh.solver_for, and LOD for far bullets) or back to the
+        # chosen one
+        world = self.world
+        pairs, lod = self.physics
+        if self.shed(SHED_PHYSICS):
+            if pairs is True:
+                world.pairs = solver_for(len(world.bullets), self.meshes)
+            if lod is None:
+                world.lod = LOD()
+        else:
+            world.pairs, world.lod = pairs, lod
+
+    def spawn_scenario(self):
+        # the next stress-test scenario, inserted in one go
+        names = list(SCENARIOS)
+        name  = names[self.bulk_next % len(names)]
+        self.bulk_next += 1
+        added = populate(self.world, name, self.bulk, seed=self.bulk_next)
+        self.notice = (f"+{len(added)} bullets: {name}", time.perf_counter() + NOTICE_TIME)
+
+    def fork_shots(self):
+        # while aiming, simulate the aimed shot and two variations in the
+        # background; otherwise clear the overlay
+        if self.forker is None:
+            # worker processes keep the forks off the game's GIL, given
+            # a spare core for them
+            self.forker = Forker(processes=(os.cpu_count() or 1) > 1)
+        if not self.dragging:
+            self.forker.cancel()
+            return
+        drag_end = screen_to_world(pygame.math.Vector2(pygame.mouse.get_pos()))
+        vel = self.world.launch_velocity(self.drag_start, drag_end)
+        shots = [(self.drag_start, vel.rotate(a)) for a in (-FORK_SPREAD, 0, FORK_SPREAD)]
+        self.forker.submit(self.world, shots)
+
+    def step_world(self, dt, components):
+        removed = self.world.step(dt, components=components)
+        self.tick += 1
+        if self.show_trails:
+            self.trails.record(self.world.bullets)
+        for b in removed:
+            self.result = RESULT_TEXT[b.outcome]
+        if self.recorder:
+            self.recorder.record_world(self.tick, self.world, removed)
+
+    # ── drawing ─────────────────────────────────────────────────────────────
+    def preview(self, drag_end):
+        """
+        The predicted path of a shot released at ``drag_end``, recomputed
+        only when the aim, the settings or (for moving wells) the scene
+        time change.
+        """
+        world, settings = self.world, self.settings
+        scene = world.scene
+        coarse = PREVIEW_COARSE if self.shed(SHED_PREVIEW) else 1
+        key = (tuple(self.drag_start), tuple(drag_end), settings.version,
+               world.friction, scene, None if scene.is_static else scene.time, coarse)
+        if key == self.preview_key:
+            return self.preview_path
+        vel = world.launch_velocity(self.drag_start, drag_end)
+        steps, dt = self.preview_steps // coarse, coarse / FPS
+        if scene.is_classic:
+            path = simulate_trajectory(
+                self.drag_start, vel,
+                settings.gv_radius + settings.bullet_radius,
+                settings.gv_mass,
+                world.friction,
+                self.center,
+                self.max_dist,
+                steps=steps, dt=dt,
+                out=self.preview_buf
+            )
+        else:
+            path = simulate_scene_trajectory(
+                self.drag_start, vel, scene,
+                settings.bullet_radius,
+                world.friction,
+                self.max_dist,
+                steps=steps, dt=dt,
+                out=self.preview_buf
+            )
+        self.preview_key, self.preview_path = key, path
+        return path
+
+    def draw(self):
+        screen   = self.screen
+        settings = self.settings
+        font     = render.font(36)
+        small    = render.font(24)
+        zoom     = self.zoom
+
+        screen.fill((0,0,0))
+
+        if self.state==STATE_PLAY:
+            # draw GV objects
+            scene = self.world.scene
+            if self.well_colors is None or self.well_colors[0] is not scene:
+                self.well_colors = (scene, [mass_to_color(w.mass, gv_min, gv_max)
+                                            for w in scene.wells])
+            for w, wp, gv_color in zip(scene.wells, scene.positions(), self.well_colors[1]):
+                center_s = to_screen(pygame.math.Vector2(wp))
+                pygame.draw.circle(screen, gv_color,
+                                   (int(center_s.x), int(center_s.y)),
+                                   int(w.radius * zoom))
+
+            # trajectory preview
+            if not self.paused and self.dragging:
+                de_screen = pygame.mouse.get_pos()
+                de_world  = screen_to_world(pygame.math.Vector2(de_screen))
+                path = self.preview(de_world)
+                pts = path_to_screen(path, self.preview_pts)
+                if len(pts)>1:
+                    pygame.draw.lines(screen,(100,255,100),False,pts.tolist(),max(1,int(2*zoom)))
+                pygame.draw.line(screen,(200,200,200),
+                                 to_screen(self.drag_start),
+                                 to_screen(de_world),
+                                 max(1,int(2*zoom)))
+
+            if self.show_trails:
+                self.trails.draw(screen)
+            if self.forker:
+                self.draw_forks(self.forker.poll())
+
+            # draw bullets
+            colors = self.bullet_colors
+            vectors   = self.vectors()
+            head_tail = not self.shed(SHED_ARROWS)
+            for b in self.world.bullets:
+                col = colors.get(b.mass)
+                if col is None:
+                    col = colors[b.mass] = mass_to_color(b.mass, bul_min, bul_max)
+                render.draw_projectile(screen,b,col,vectors,head_tail)
+
+            # HUD
+            bullets = self.world.bullets
+            if self.world.mode.score:
+                screen.blit(font.render(f"Score: {int(self.world.total_score)}",True,(255,255,255)),(10,10))
+            else:
+                text = f"{self.result}   Space = retry" if self.result else "Click+drag to launch"
+                screen.blit(font.render(text,True,(255,255,255)),(10,10))
+            crash, escape, orbit = self.world.orbits.counts
+            text = f"Objects: {len(bullets)}   orbit {orbit} / crash {crash} / escape {escape}"
+            if self.world.lod:
+                text += f"   coarse {self.world.lod.coarse}"
+            screen.blit(small.render(text,True,(255,255,255)),(10,40))
+            oldest = self.world.oldest
+            if oldest:
+                stats = self.world.stats
+                screen.blit(small.render(f"Oldest: {oldest.arc_time:.1f}s   scoring {stats.scoring}"
+                                         f"   mean speed {stats.mean_speed:.2f}",
+                                         True,(255,255,255)),(10,65))
+                self.draw_histogram(stats)
+            if self.warp != 1:
+                text = (f"Warp {self.warp}x" if self.warp else
+                        f"Warp max ({self.warp_steps} steps/frame)")
+                surf = small.render(text,True,(255,200,100))
+                screen.blit(surf,surf.get_rect(topright=(self.width-10,10)))
+            text, until = self.notice
+            if text and time.perf_counter() < until:
+                surf = font.render(text,True,(255,255,255))
+                screen.blit(surf,surf.get_rect(midtop=(self.center.x,10)))
+            gov = self.governor
+            if gov and gov.level:
+                times = "  ".join(f"{k} {v*1e3:.1f}" for k, v in gov.stages.items())
+                surf = small.render(f"Load {gov.level}: {gov.name}  ({times} ms)",True,(255,150,100))
+                screen.blit(surf,surf.get_rect(topright=(self.width-10,35)))
+            if self.world.diagnostics:
+                self.draw_diagnostics(self.world.diagnostics)
+
+            # selected bullet info + speed +/- buttons
+            sel = self.selected_bullet
+            if sel:
+                self.world.orbits.refresh()
+                info = [
+                    f"Pos:   {sel.pos.x:.1f},{sel.pos.y:.1f}",
+                    f"Dist:  {sel.distance:.1f}",
+                    f"Speed: {sel.vel.length():.1f}",
+                    f"Age:   {sel.arc_time:.1f}s",
+                    f"Mass:  {sel.mass:.1f}",
+                    f"Fric:  {sel.friction:.1f}%",
+                    f"Orbits:{orbit_count(sel.accum_angle):.2f}",
+                    f"a, e:  {sel.semi_major:.1f}, {sel.eccentricity:.3f}",
+                    f"Peri:  {sel.periapsis:.1f}",
+                    f"Fate:  {OUTCOMES[sel.fate] if sel.fate is not None else '-'}"
+                ]
+                for i,line in enumerate(info):
+                    screen.blit(small.render(line,True,(255,255,0)),(10,90+i*20))
+                minus_r = SPEED_MINUS_RECT
+                plus_r  = SPEED_PLUS_RECT
+                pygame.draw.rect(screen,(180,180,180),minus_r)
+                screen.blit(small.render("-",True,(0,0,0)),(minus_r.x+4, minus_r.y))
+                pygame.draw.rect(screen,(180,180,180),plus_r)
+                screen.blit(small.render("+",True,(0,0,0)),(plus_r.x+4, plus_r.y))
+
+            # in‑game settings overlay
+            if self.in_game_menu:
+                overlay = pygame.Surface((380, len(settings_options)*40+40), pygame.SRCALPHA)
+                overlay.fill((0,0,0,200))
+                screen.blit(overlay,(50,50))
+                for i,(disp,attr) in enumerate(settings_options):
+                    y = 60 + i*40
+                    text = disp if attr is None else f"{disp}: {getattr(settings,attr)}"
+                    color = (255,255,0) if i==self.settings_idx else (200,200,200)
+                    screen.blit(font.render(text,True,color),(100,y))
+                    if attr:
+                        pygame.draw.rect(screen,(180,180,180),(60,y,30,30))
+                        screen.blit(small.render("-",True,(0,0,0)),(68,y+2))
+                        pygame.draw.rect(screen,(180,180,180),(310,y,30,30))
+                        screen.blit(small.render("+",True,(0,0,0)),(318,y+2))
+
+        elif self.state==STATE_MENU:
+            for i,it in enumerate(menu_items):
+                color = (255,255,0) if i==self.menu_idx else (200,200,200)
+                surf = font.render(it,True,color)
+                screen.blit(surf,surf.get_rect(center=(self.center.x,200+i*50)))
+
+        elif self.state==STATE_SETTINGS:
+            for i,(disp,attr) in enumerate(settings_options):
+                text  = disp if attr is None else f"{disp}: {getattr(settings,attr)}"
+                color = (255,255,0) if i==self.settings_idx else (200,200,200)
+                surf  = font.render(text,True,color)
+                screen.blit(surf,surf.get_rect(topleft=(100,150+i*50)))
+
+        elif self.state==STATE_SAVELOAD:
+            for i,it in enumerate(save_items):
+                color = (255,255,0) if i==self.save_idx else (200,200,200)
+                surf  = font.render(it,True,color)
+                screen.blit(surf,surf.get_rect(center=(self.center.x,200+i*50)))
+
+        pygame.display.flip()
+
+    def draw_forks(self, results):
+        # each candidate's path and how it ended
+        small = render.font(20)
+        for r, color in zip(results, FORK_COLORS):
+            pts = path_to_screen(r.path)
+            if len(pts) > 1:
+                pygame.draw.lines(self.screen,color,False,pts.tolist(),1)
+            text = f"{OUTCOMES[r.outcome]} {r.reached:.1f}s"
+            if not r.complete:
+                text = f"flying {r.reached:.1f}s (budget)"
+            if r.lost:
+                text += f", {r.lost} lost"
+            x, y = pts[-1]
+            self.screen.blit(small.render(text,True,color),(x + 6, y - 6))
+        if self.forker.busy:
+            self.screen.blit(small.render("what if: simulating...",True,(200,200,200)),
+                             (10, self.height - 140))
+        elif self.forker.failed:
+            self.screen.blit(small.render(f"what if: {self.forker.failed} failed",True,(255,120,120)),
+                             (10, self.height - 140))
+
+    def draw_histogram(self, stats):
+        # bullets by distance from the centre, top right under the warp /
+        # governor lines
+        hist = stats.histogram
+        top  = max(int(hist.max()), 1)
+        x, y = self.width - 10 - len(hist) * HIST_BAR, 60
+        for i, n in enumerate(hist.tolist()):
+            h = round(n / top * HIST_HEIGHT)
+            if h:
+                pygame.draw.rect(self.screen,(120,160,220),
+                                 (x + i*HIST_BAR, y + HIST_HEIGHT - h, HIST_BAR - 1, h))
+        label = render.font(20).render(f"distance 0-{stats.edges[-1]:.0f}",True,(120,160,220))
+        self.screen.blit(label,(x, y + HIST_HEIGHT + 2))
+
+    def draw_diagnostics(self, diags):
+        # energy / angular momentum readout and an energy drift sparkline,
+        # bottom left
+        small = render.font(24)
+        x, y  = 10, self.height - 110
+        last  = diags.last
+        if last is None:
+            self.screen.blit(small.render("Diagnostics: waiting for a sample",True,(150,200,255)),(x,y))
+            return
+        lines = [
+            f"E: {last['kinetic'] + last['potential']:.1f}  (K {last['kinetic']:.1f}, U {last['potential']:.1f})",
+            f"L: {last['angular']:.1f}",
+            f"drift  E {last['drift_energy']*100:+.4f}%   L {last['drift_angular']*100:+.4f}%",
+        ]
+        for i, line in enumerate(lines):
+            self.screen.blit(small.render(line,True,(150,200,255)),(x,y+i*20))
+        drift = diags.rows["drift_energy"][-DIAG_PLOT:]
+        if len(drift) > 1:
+            scale = max(max(abs(d) for d in drift), 1e-9)
+            pts = [(x + i * DIAG_PLOT_WIDTH / (DIAG_PLOT - 1),
+                    y + 80 - d / scale * 15) for i, d in enumerate(drift)]
+            pygame.draw.line(self.screen,(60,60,60),(x,y+80),(x+DIAG_PLOT_WIDTH,y+80))
+            pygame.draw.lines(self.screen,(150,200,255),False,pts)
+
+    def run(self):
+        while True:
+            dt = self.clock.tick(FPS) / 1000.0
+            gov = self.governor
+            if gov:
+                gov.start()
+            self.update_hold(dt)
+            for ev in coalesce_motion(pygame.event.get()):
+                self.dispatcher.dispatch(self.state, ev)
+            self.update(dt)
+            if gov:
+                gov.lap("physics")
+            self.draw()
+            if gov:
+                gov.lap("draw")
+                # only steady play says anything about the load
+                steady = self.state == STATE_PLAY and not self.paused and self.warp == 1
+                if gov.finish(steady):
+                    self.on_level_changed()
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="GravityWell")
+    ap.add_argument("scene", nargs="?", help="scene file (JSON/TOML)")
+    ap.add_argument("--mode", choices=sorted(MODES), default=DEFAULT_MODE,
+                    help="multibody (default), classic single-well, or orbit practice")
+    ap.add_argument("--record", metavar="DIR", help="record every body's state to DIR")
+    ap.add_argument("--record-every", type=int, default=1, metavar="N",
+                    help="record every N-th physics step")
+    ap.add_argument("--record-deltas", action="store_true",
+                    help="with --record, write only the bullets that changed (World.delta)")
+    ap.add_argument("--diagnostics", type=int, default=0, metavar="N",
+                    help="monitor energy and angular momentum every N steps from the start")
+    ap.add_argument("--watch-settings", action="store_true",
+                    help=f"reload {SETTINGS_FILE} while running whenever it changes")
+    ap.add_argument("--heavy", type=float, metavar="MASS",
+                    help="only bullets of at least MASS pull on other bullets")
+    ap.add_argument("--mesh", type=int, metavar="CELLS",
+                    help="bullet-bullet gravity on a CELLS x CELLS particle mesh")
+    ap.add_argument("--p3m", action="store_true",
+                    help="with --mesh, add exact short-range forces (P3M)")
+    ap.add_argument("--lod", type=float, metavar="RADIUS",
+                    help="bullets beyond RADIUS px or off screen step on a coarse path")
+    ap.add_argument("--preview-steps", type=int, default=PREVIEW_STEPS, metavar="N",
+                    help=f"physics steps in the trajectory preview (default {PREVIEW_STEPS})")
+    ap.add_argument("--bulk", type=int, default=BULK_COUNT, metavar="N",
+                    help=f"bullets added per press of B (default {BULK_COUNT})")
+    ap.add_argument("--no-governor", action="store_true",
+                    help="never shed drawing or physics work to hold the frame rate")
+    args = ap.parse_args(argv)
+    mesh = MeshSolver(args.mesh, args.p3m) if args.mesh else None
+    App(args.scene, args.record, args.record_every, args.mode, args.diagnostics,
+        args.watch_settings, args.heavy, mesh, args.lod, args.preview_steps,
+        not args.no_governor, args.bulk, args.record_deltas).run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# gravitywell/bodies.py
+#
+# Struct-of-arrays body storage for the array engine (the network server and
+# other headless consumers).  The interactive World keeps Projectile objects
+# for the UI, but with thousands of bodies packing and unpacking those every
+# step costs more than the physics; here the state lives in numpy arrays and
+# physics.step_arrays runs on them directly.
+
+import numpy as np
+from .physics import step_arrays
+from .orbits import CRASH, ESCAPE
+from .mesh import solver_for
+
+# bullet-bullet gravity is all-pairs (N^2 time and memory): above this many
+# bodies it goes to the particle mesh (mesh.solver_for)
+PAIR_LIMIT = 500
+
+# name -> (per-body shape, dtype)
+FIELDS = {
+    "ids":      ((),   np.int64),
+    "pos":      ((2,), float),
+    "vel":      ((2,), float),
+    "radius":   ((),   float),
+    "mass":     ((),   float),
+    "friction": ((),   float),
+    "arc_time": ((),   float),
+}
+
+class Bodies:
+    """
+    Every live body as rows of parallel arrays (``ids``, ``pos``, ``vel``,
+    ``radius``, ``mass``, ``friction``, ``arc_time``).  The attributes are
+    views of the first ``n`` rows of buffers that grow by doubling.  Ids are
+    handed out in increasing order and removal keeps the order, so ``ids``
+    is always sorted.
+    """
+    def __init__(self, capacity=256):
+        self.n       = 0
+        self.next_id = 0
+        self.meshes  = {}      # p3m -> MeshSolver past PAIR_LIMIT
+        self._buf    = {k: np.zeros((capacity,) + shape, dtype)
+                        for k, (shape, dtype) in FIELDS.items()}
+        self._views()
+
+    def __len__(self):
+        return self.n
+
+    def _views(self):
+        for k, a in self._buf.items():
+            setattr(self, k, a[:self.n])
+
+    def _reserve(self, n):
+        cap = len(self._buf["ids"])
+        if n <= cap:
+            return
+        while cap < n:
+            cap *= 2
+        for k, a in self._buf.items():
+            grown = np.zeros((cap,) + a.shape[1:], a.dtype)
+            grown[:self.n] = a[:self.n]
+            self._buf[k] = grown
+
+    def spawn(self, pos, vel, radius, mass, friction):
+        """
+        Add one body, or many with (k, 2) ``pos``/``vel`` (the scalars are
+        broadcast).  Returns the new ids.
+        """
+        pos = np.atleast_2d(np.asarray(pos, dtype=float))
+        vel = np.atleast_2d(np.asarray(vel, dtype=float))
+        k   = len(pos)
+        i, j = self.n, self.n + k
+        self._reserve(j)
+        b = self._buf
+        b["ids"][i:j]      = np.arange(self.next_id, self.next_id + k)
+        b["pos"][i:j]      = pos
+        b["vel"][i:j]      = vel
+        b["radius"][i:j]   = radius
+        b["mass"][i:j]     = mass
+        b["friction"][i:j] = friction
+        b["arc_time"][i:j] = 0.0
+        self.n        = j
+        self.next_id += k
+        self._views()
+        return b["ids"][i:j].copy()
+
+    def keep(self, mask):
+        """Drop the rows where ``mask`` is False, keeping the order."""
+        k = int(np.count_nonzero(mask))
+        if k == self.n:
+            return
+        for a in self._buf.values():
+            a[:k] = a[:self.n][mask]
+        self.n = k
+        self._views()
+
+    def clear(self):
+        self.n = 0
+        self._views()
+
+    def step(self, dt, scene, max_dist, pairs=None):
+        """
+        Advance every body by ``dt`` and remove the ones that crashed or
+        escaped.  ``pairs`` (bullet-bullet gravity) defaults to on up to
+        PAIR_LIMIT bodies; a mass lets only bodies that heavy attract, and a
+        ``mesh.MeshSolver`` handles any number of bodies.  Returns the removed ``(ids, outcomes)``.
+        """
+        if not self.n:
+            return self.ids.copy(), np.zeros(0, np.int8)
+        if pairs is None:
+            pairs = True if self.n <= PAIR_LIMIT else solver_for(self.n, self.meshes)
+        damp = np.maximum(0.0, 1 - self.friction / 100.0 * dt)
+        crashed, dead, *_ = step_arrays(self.pos, self.vel, self.radius,
+                                        self.mass, damp, dt, scene.arrays(),
+                                        scene.origin, max_dist, pairs)
+        self.arc_time += dt
+        removed  = self.ids[dead].copy()
+        outcomes = np.where(crashed[dead], CRASH, ESCAPE).astype(np.int8)
+        if len(removed):
+            self.keep(~dead)
+        return removed, outcomes
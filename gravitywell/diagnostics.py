@@ -0,0 +1,84 @@
+# gravitywell/diagnostics.py
+#
+# Conservation monitor.  Every ``every`` steps the physics step also fills
+# in the total kinetic and potential energy (wells plus bullet pairs, from
+# the same force terms) and the angular momentum about the scene origin;
+# those samples are kept as a time series for the HUD and the recorder.
+#
+# Energy and angular momentum are only conserved while nothing is spawned
+# or removed, friction is 0 and the wells stand still, so the drift is
+# accumulated over the stretches where the population did not change and
+# frozen across the jumps.  With friction or moving wells it measures the
+# work they do, which is still worth watching.
+
+import numpy as np
+
+DIAG_EVERY = 10        # steps between samples
+DIAG_HISTORY = 4096    # samples kept (older ones are dropped in halves)
+
+SERIES = ("tick", "time", "count", "kinetic", "potential", "angular",
+          "drift_energy", "drift_angular")
+
+def relative(new, old):
+    return (new - old) / abs(old) if old else 0.0
+
+class Diagnostics:
+    """
+    The time series: one row per sample of SERIES.  ``due`` says whether
+    the coming step should be sampled; ``add`` takes the step's diag dict
+    and a population key that changes whenever bodies were added or
+    removed since the previous sample.
+    """
+    def __init__(self, every=DIAG_EVERY, history=DIAG_HISTORY):
+        self.every   = max(1, int(every))
+        self.history = history
+        self.steps   = 0
+        self.rows    = {k: [] for k in SERIES}
+        self.last    = None     # the latest row as a dict
+        self._key    = None
+
+    def __len__(self):
+        return len(self.rows["tick"])
+
+    def due(self):
+        """Count one step; True if it is one to sample."""
+        due = self.steps % self.every == 0
+        self.steps += 1
+        return due
+
+    def add(self, tick, t, diag, key):
+        ke  = diag.get("kinetic", 0.0)
+        pe  = diag.get("potential", 0.0)
+        ang = diag.get("angular", 0.0)
+        de = dl = 0.0
+        last = self.last
+        if last is not None:
+            de, dl = last["drift_energy"], last["drift_angular"]
+            if key == self._key:
+                de += relative(ke + pe, last["kinetic"] + last["potential"])
+                dl += relative(ang, last["angular"])
+        self._key = key
+        row = {"tick": tick, "time": t, "count": diag.get("count", 0),
+               "kinetic": ke, "potential": pe, "angular": ang,
+               "drift_energy": de, "drift_angular": dl}
+        for k in SERIES:
+            self.rows[k].append(row[k])
+        if len(self) > self.history:
+            for k in SERIES:
+                del self.rows[k][:self.history // 2]
+        self.last = row
+        return row
+
+    @property
+    def energy(self):
+        return self.last["kinetic"] + self.last["potential"] if self.last else 0.0
+
+    def arrays(self):
+        """The series as numpy arrays (for plotting or saving)."""
+        return {k: np.array(v, dtype=float) for k, v in self.rows.items()}
+
+    def save(self, filename):
+        """Write the series as a CSV with a header row."""
+        a = self.arrays()
+        np.savetxt(filename, np.column_stack([a[k] for k in SERIES]),
+                   delimiter=",", header=",".join(SERIES), comments="")
@@ -0,0 +1,108 @@
+# gravitywell/ensemble.py
+#
+# Batch evaluation of many launches at once, e.g. to tune drag_scale and
+# shot angles.  Every launch follows ``simulate_trajectory`` semantics (test
+# particles: wells pull, bullets do not pull each other, friction applies)
+# but all of them are integrated together as one set of numpy arrays.
+
+import numpy as np
+from .physics import G, SCORE_TIME
+# ORBIT here means still in flight once arc_time > SCORE_TIME
+from .orbits import CRASH, ESCAPE, ORBIT
+
+def evaluate_launches(starts, vels, gv_radius, gv_mass, fr, center, max_dist,
+                      dt=1/60.0, scene=None, pad=0.0):
+    """
+    Integrate N launches in parallel and classify each one.
+
+    ``starts`` and ``vels`` are (N, 2) arrays.  As with
+    ``simulate_trajectory``, ``gv_radius`` is the crash radius (GV radius plus
+    bullet radius) and ``center`` the GV position.  Given a ``scene``, its
+    wells are used instead (each well's radius plus ``pad``), following
+    moving wells in time.
+
+    Returns ``(outcome, time)``: an int8 array of CRASH/ESCAPE/ORBIT and the
+    flight time at which each launch ended (capped just past SCORE_TIME).
+    """
+    pos = np.array(starts, dtype=float).reshape(-1, 2)
+    vel = np.array(vels, dtype=float).reshape(-1, 2)
+    n   = len(pos)
+    outcome = np.full(n, ORBIT, dtype=np.int8)
+    ended   = np.zeros(n)
+
+    if scene is None:
+        ox, oy = float(center[0]), float(center[1])
+        wells  = [(ox, oy, gv_radius * gv_radius, G * gv_mass)]
+    else:
+        ox, oy = scene.origin
+        wells  = None
+    damp = max(0.0, 1 - fr/100.0*dt)
+    max2 = max_dist * max_dist
+
+    # one 1‑D array per component keeps every op a flat, contiguous loop
+    x,  y  = pos[:, 0].copy(), pos[:, 1].copy()
+    vx, vy = vel[:, 0].copy(), vel[:, 1].copy()
+    idx = np.arange(n)    # launches still in flight
+    t   = 0.0
+
+    # t accumulates exactly like Projectile.arc_time
+    while t <= SCORE_TIME:
+        if scene is not None and (wells is None or not scene.is_static):
+            wells = [(wx, wy, (w.radius + pad) ** 2, G * w.mass)
+                     for (wx, wy), w in zip(scene.positions(scene.time + t), scene.wells)]
+        t += dt
+
+        dx, dy = x - ox, y - oy
+        escaped = dx*dx + dy*dy > max2
+        crashed = np.zeros(len(x), dtype=bool)
+        pulls = []
+        for wx, wy, cr2, gm in wells:
+            dx = wx - x
+            dy = wy - y
+            r2 = dx*dx + dy*dy
+            crashed |= r2 <= cr2
+            pulls.append((dx, dy, r2, gm))
+
+        done = crashed | escaped
+        if done.any():
+            escaped &= ~crashed
+            outcome[idx[crashed]] = CRASH
+            outcome[idx[escaped]] = ESCAPE
+            ended[idx[done]] = t
+            keep = ~done
+            idx, x, y, vx, vy = idx[keep], x[keep], y[keep], vx[keep], vy[keep]
+            pulls = [(dx[keep], dy[keep], r2[keep], gm) for dx, dy, r2, gm in pulls]
+            if not len(idx):
+                break
+
+        for dx, dy, r2, gm in pulls:
+            k = np.sqrt(r2)
+            k *= r2
+            np.divide(gm * dt, k, out=k)
+            vx += dx * k
+            vy += dy * k
+        if damp != 1.0:
+            vx *= damp
+            vy *= damp
+        x += vx * dt
+        y += vy * dt
+
+    ended[idx] = t
+    return outcome, ended
+
+def launch_grid(start, angles, speeds, gv_radius, gv_mass, fr, center,
+                max_dist, dt=1/60.0, scene=None, pad=0.0):
+    """
+    Heatmap of launches from a single ``start`` point: one row per speed,
+    one column per angle (degrees, 0 = +x, 90 = +y on screen).  Returns
+    ``(outcome, time)`` arrays of shape (len(speeds), len(angles)).
+    """
+    ang = np.radians(np.asarray(angles, dtype=float))
+    spd = np.asarray(speeds, dtype=float)
+    dirs = np.column_stack((np.cos(ang), np.sin(ang)))
+    vels = (spd[:, None, None] * dirs[None, :, :]).reshape(-1, 2)
+    starts = np.broadcast_to(np.asarray(start, dtype=float), vels.shape)
+    outcome, ended = evaluate_launches(starts, vels, gv_radius, gv_mass, fr,
+                                       center, max_dist, dt, scene, pad)
+    shape = (len(spd), len(ang))
+    return outcome.reshape(shape), ended.reshape(shape)
@@ -0,0 +1,190 @@
+# gravitywell/fork.py
+#
+# "What if" shots.  ``snapshot`` copies the bullets of a World into plain
+# arrays (a bodies.Bodies store) plus a copy of the scene; nothing in the
+# World is shared, so the snapshot can be stepped on a worker thread -- or
+# pickled to a worker process -- while the game runs on.  ``run_fork`` adds
+# one candidate shot to a private copy of the snapshot and simulates ahead
+# with the world's bullet-bullet gravity, within a wall-clock budget, and
+# reports where the shot went and what it did to the bullets already in
+# flight.  A ``Forker`` runs several candidates in parallel and hands
+# back whatever has finished, so the main loop never waits on it.
+
+import multiprocessing
+import time
+from concurrent.futures import BrokenExecutor, ThreadPoolExecutor, ProcessPoolExecutor
+import numpy as np
+from .bodies import Bodies
+from .mesh import MeshSolver
+from .orbits import ORBIT
+from .scene import Scene
+
+FORK_SECONDS = 10.0    # simulated time ahead
+FORK_BUDGET  = 1.0     # wall-clock seconds a fork may take
+FORK_WORKERS = 3
+PATH_EVERY   = 4       # steps between recorded points of the shot's path
+
+class Snapshot:
+    """
+    The state a fork starts from: ``bodies`` (every live bullet), the
+    ``scene`` as data, ``max_dist``, the world's ``pairs`` setting and the
+    ``shot`` parameters (radius, mass, friction) new bullets get.
+    """
+    def __init__(self, bodies, scene, origin, max_dist, pairs, shot):
+        self.bodies   = bodies
+        self.scene    = scene
+        self.origin   = origin
+        self.max_dist = max_dist
+        self.pairs    = pairs
+        self.shot     = shot
+
+def snapshot(world):
+    """An array snapshot of ``world`` that shares nothing with it."""
+    live = [b for b in world.bullets if b.active]
+    bodies = Bodies(max(len(live) + 1, 16))
+    if live:
+        state = np.array([(b.pos.x, b.pos.y, b.vel.x, b.vel.y, b.radius, b.mass,
+                           b.friction, b.arc_time) for b in live], dtype=float)
+        bodies.spawn(state[:, 0:2], state[:, 2:4], 0.0, 0.0, 0.0)
+        bodies.radius[:]   = state[:, 4]
+        bodies.mass[:]     = state[:, 5]
+        bodies.friction[:] = state[:, 6]
+        bodies.arc_time[:] = state[:, 7]
+    pairs = world.pairs
+    if hasattr(pairs, "accelerations"):
+        pairs = MeshSolver(pairs.cells, pairs.p3m)    # without the kernel cache
+    s = world.settings
+    return Snapshot(bodies, world.scene.to_dict(), world.scene.origin,
+                    world.max_dist, pairs, (s.bullet_radius, s.bullet_mass, world.friction))
+
+class ForkResult:
+    """
+    How a candidate shot ``(pos, vel)`` played out: ``outcome`` (CRASH,
+    ESCAPE, or ORBIT if it was still flying when the fork stopped), its
+    ``path`` ((k, 2), every PATH_EVERY steps), the number of other bullets
+    ``lost`` on the way and the simulated time ``reached`` -- when the shot
+    ended, or short of ``seconds`` if the budget ran out first.
+    """
+    def __init__(self, shot, outcome, path, lost, reached, seconds):
+        self.shot     = shot
+        self.outcome  = outcome
+        self.path     = path
+        self.lost     = lost
+        self.reached  = reached
+        self.seconds  = seconds
+
+    @property
+    def complete(self):
+        return self.outcome != ORBIT or self.reached >= self.seconds
+
+def run_fork(snap, shot, seconds=FORK_SECONDS, dt=1/60.0, budget=FORK_BUDGET):
+    """Simulate ``snap`` plus one shot ``(pos, vel)``; returns a ForkResult."""
+    bodies = Bodies(len(snap.bodies) + 1)
+    bodies.spawn(snap.bodies.pos, snap.bodies.vel, 0.0, 0.0, 0.0)
+    for k in ("radius", "mass", "friction", "arc_time"):
+        getattr(bodies, k)[:] = getattr(snap.bodies, k)
+    radius, mass, friction = snap.shot
+    shot_id = int(bodies.spawn(shot[0], shot[1], radius, mass, friction)[0])
+    scene = Scene.from_dict(snap.scene, snap.origin)
+    pairs = snap.pairs
+    if hasattr(pairs, "accelerations"):
+        pairs = MeshSolver(pairs.cells, pairs.p3m)    # solvers keep per-call state
+
+    steps = int(round(seconds / dt))
+    path  = np.empty((steps // PATH_EVERY + 2, 2))
+    path[0] = bodies.pos[-1]
+    n, lost, outcome, t = 1, 0, ORBIT, 0.0
+    end = time.perf_counter() + budget
+    for i in range(1, steps + 1):
+        removed, outcomes = bodies.step(dt, scene, snap.max_dist, pairs)
+        scene.advance(dt)
+        t += dt
+        hit = removed == shot_id
+        if hit.any():
+            outcome = int(outcomes[hit][0])
+            lost += len(removed) - 1
+            break
+        lost += len(removed)
+        if i % PATH_EVERY == 0:
+            path[n] = bodies.pos[-1]    # the shot is always the last row
+            n += 1
+        if time.perf_counter() > end:
+            break
+    if outcome == ORBIT:
+        path[n] = bodies.pos[-1]
+        n += 1
+    return ForkResult(shot, outcome, path[:n].copy(), lost, t, seconds)
+
+def what_if(world, shots, seconds=FORK_SECONDS, budget=FORK_BUDGET):
+    """Run the candidate ``shots`` against ``world`` in this thread."""
+    snap = snapshot(world)
+    return [run_fork(snap, s, seconds, budget=budget) for s in shots]
+
+class Forker:
+    """
+    Runs forks in the background, on ``workers`` threads (or processes).
+    ``submit`` replaces any earlier batch; ``poll`` returns the results
+    finished so far, in shot order, without waiting.  A fork that raised
+    is left out of the results and counted in ``failed``; a broken
+    process pool is replaced on the next ``submit``.
+    """
+    def __init__(self, workers=FORK_WORKERS, processes=False):
+        self.processes = processes
+        self.workers   = workers
+        self.pool      = self._pool()
+        self.futures   = []
+        self.results   = []
+        self.failed    = 0
+
+    def _pool(self):
+        if not self.processes:
+            return ThreadPoolExecutor(max_workers=self.workers)
+        # spawned, not forked: the game may already run other threads (the
+        # recorder's writer), whose locks a forked child would inherit held
+        return ProcessPoolExecutor(max_workers=self.workers,
+                                   mp_context=multiprocessing.get_context("spawn"))
+
+    def submit(self, world, shots, seconds=FORK_SECONDS, budget=FORK_BUDGET):
+        self.cancel()
+        snap  = snapshot(world)
+        shots = [(tuple(p), tuple(v)) for p, v in shots]
+        try:
+            self.futures = [self.pool.submit(run_fork, snap, s, seconds, 1/60.0, budget)
+                            for s in shots]
+        except BrokenExecutor:
+            # a worker process died; start over with a fresh pool
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool    = self._pool()
+            self.futures = [self.pool.submit(run_fork, snap, s, seconds, 1/60.0, budget)
+                            for s in shots]
+
+    def poll(self):
+        if self.futures and any(f.done() for f in self.futures):
+            results, failed = [], 0
+            for f in self.futures:
+                if not f.done() or f.cancelled():
+                    continue
+                if f.exception() is not None:
+                    failed += 1
+                else:
+                    results.append(f.result())
+            self.results, self.failed = results, failed
+            if all(f.done() for f in self.futures):
+                self.futures = []
+        return self.results
+
+    @property
+    def busy(self):
+        return bool(self.futures)
+
+    def cancel(self):
+        """Drop the current batch (running forks end within their budget)."""
+        for f in self.futures:
+            f.cancel()
+        self.futures = []
+        self.results = []
+        self.failed  = 0
+
+    def close(self):
+        self.cancel()
+        self.pool.shutdown(cancel_futures=True)
@@ -0,0 +1,85 @@
+# gravitywell/governor.py
+#
+# Frame-budget governor.  The app times the stages of every frame (physics,
+# drawing); when frames keep running over budget the governor raises its
+# degradation level one step at a time, and the app sheds the optional
+# work that level names -- gravity vectors, then head/tail arrows, then
+# preview resolution, then exact physics.  Once frames have had plenty of
+# headroom for a while the level comes back down, one step at a time.
+
+import time
+
+# what each level gives up, cumulatively
+LEVELS = (
+    "full",
+    "no gravity vectors",
+    "no head/tail arrows",
+    "coarse preview",
+    "approximate physics",
+)
+SHED_VECTORS, SHED_ARROWS, SHED_PREVIEW, SHED_PHYSICS = 1, 2, 3, 4
+
+SHED_ABOVE     = 1.0    # of the budget: slower frames count towards shedding
+RESTORE_BELOW  = 0.5    # of the budget: faster frames count towards restoring
+SHED_AFTER     = 0.25   # s of consecutive slow frames before shedding a level
+RESTORE_AFTER  = 2.0    # s of consecutive fast frames before restoring one
+SMOOTHING      = 0.2    # weight of the newest frame in the stage averages
+
+class Governor:
+    """
+    ``budget`` is the frame time to hold, in seconds.  Per frame: ``start``,
+    ``lap(stage)`` after each stage, then ``finish``.  ``stages`` holds the
+    smoothed time of each stage and ``frame`` of the whole frame; ``over``
+    and ``under`` the time spent in the current run of slow / fast frames
+    (counted in frame time, so a single very slow frame sheds at once).
+    """
+    def __init__(self, budget, max_level=len(LEVELS) - 1):
+        self.budget    = budget
+        self.max_level = max_level
+        self.level     = 0
+        self.stages    = {}
+        self.frame     = 0.0
+        self.over = self.under = 0.0
+        self.t0 = self.mark = 0.0
+
+    @property
+    def name(self):
+        return LEVELS[self.level]
+
+    def start(self):
+        self.t0 = self.mark = time.perf_counter()
+
+    def lap(self, stage):
+        now = time.perf_counter()
+        last = self.stages.get(stage)
+        dt = now - self.mark
+        self.stages[stage] = dt if last is None else last + SMOOTHING * (dt - last)
+        self.mark = now
+
+    def finish(self, judge=True):
+        """
+        End the frame.  With ``judge`` (the frame is representative: not
+        paused, not time-warped) it counts towards a level change; returns
+        True if the level changed.
+        """
+        frame = time.perf_counter() - self.t0
+        self.frame += SMOOTHING * (frame - self.frame)
+        if not judge:
+            self.over = self.under = 0.0
+            return False
+        # a frame that waited for the clock is one budget long
+        if frame > self.budget * SHED_ABOVE:
+            self.over, self.under = self.over + frame, 0.0
+            if self.over >= SHED_AFTER and self.level < self.max_level:
+                self.level += 1
+                self.over = 0.0
+                return True
+        elif frame < self.budget * RESTORE_BELOW:
+            self.over, self.under = 0.0, self.under + self.budget
+            if self.under >= RESTORE_AFTER and self.level > 0:
+                self.level -= 1
+                self.under = 0.0
+                return True
+        else:
+            self.over = self.under = 0.0
+        return False
@@ -0,0 +1,72 @@
+# gravitywell/input.py
+#
+# Event plumbing for the app.  Handlers are looked up by (state, event type)
+# instead of every event walking the whole if/elif chain, runs of
+# MOUSEMOTION are collapsed to one event per frame, and hit-tests use cached
+# text extents rather than rendering fonts.
+
+import pygame
+
+class Dispatcher:
+    """
+    Table of event handlers keyed by (state, event type).  A handler
+    registered with state ``None`` runs in every state, before the
+    state-specific one.  Events nobody handles cost a dict lookup.
+    """
+    def __init__(self):
+        self.handlers = {}
+
+    def on(self, state, etype, handler):
+        self.handlers[(state, etype)] = handler
+
+    def dispatch(self, state, ev):
+        h = self.handlers.get((None, ev.type))
+        if h:
+            h(ev)
+        h = self.handlers.get((state, ev.type))
+        if h:
+            h(ev)
+
+def coalesce_motion(events):
+    """
+    Collapse each run of consecutive MOUSEMOTION events into its last one
+    (with the relative motion summed), keeping every other event in order.
+    """
+    out = []
+    for ev in events:
+        if ev.type == pygame.MOUSEMOTION and out and out[-1].type == pygame.MOUSEMOTION:
+            prev = out[-1]
+            prel = getattr(prev, "rel", (0, 0))
+            rel  = getattr(ev, "rel", (0, 0))
+            out[-1] = pygame.event.Event(
+                pygame.MOUSEMOTION,
+                pos=ev.pos,
+                rel=(prel[0] + rel[0], prel[1] + rel[1]),
+                buttons=getattr(ev, "buttons", (0, 0, 0))
+            )
+        else:
+            out.append(ev)
+    return out
+
+class TextLayout:
+    """Text extents for one font, measured once per distinct string."""
+    def __init__(self, font):
+        self.font   = font
+        self._sizes = {}
+
+    def rect(self, text, **anchor):
+        """Rect the rendered ``text`` would occupy, e.g. ``rect(t, center=(x, y))``."""
+        size = self._sizes.get(text)
+        if size is None:
+            size = self._sizes[text] = self.font.size(text)
+        r = pygame.Rect((0, 0), size)
+        for k, v in anchor.items():
+            setattr(r, k, v)
+        return r
+
+def hit_index(rects, pos):
+    """Index of the first rect containing ``pos``, or None."""
+    for i, r in enumerate(rects):
+        if r.collidepoint(pos):
+            return i
+    return None
@@ -0,0 +1,64 @@
+# gravitywell/lod.py
+#
+# Simulation level of detail for World.  Bullets far from the centre or
+# out of view step on a coarse path: once every ``every`` ticks (staggered
+# by id, so each tick carries a share) with an ``every``-times larger
+# step, feeling the wells exactly and the other bullets only through a
+# coarse particle mesh.  Bullets near a well or near another bullet, and
+# everything in (or just outside) the viewport, stay on the full path,
+# so the frame cost follows what the player is watching.
+
+import numpy as np
+from .mesh import MeshSolver, near_pairs
+
+LOD_RADIUS  = 1200     # px from the centre beyond which bullets may go coarse
+LOD_EVERY   = 4        # coarse bullets step once per this many ticks
+NEAR_BODY   = 25       # px: closer than this to another bullet stays full
+NEAR_WELL   = 150      # px: closer than this to a well stays full
+VIEW_MARGIN = 0.25     # of the view's size, around it, still counted as in view
+FIELD_CELLS = 64       # cells per side of the coarse far-field mesh
+
+class LOD:
+    """
+    The coarse-path policy.  ``view`` is the visible world rectangle
+    ``(x0, y0, x1, y1)`` (the app sets it every frame; None: no view test).
+    ``field`` is the mesh that stands in for bullet-bullet forces between
+    the two paths; ``coarse`` / ``due`` count the bullets on the coarse
+    path and the ones stepped in the last tick.
+    """
+    def __init__(self, radius=LOD_RADIUS, every=LOD_EVERY, near=NEAR_BODY,
+                 near_well=NEAR_WELL, cells=FIELD_CELLS):
+        self.radius    = radius
+        self.every     = max(1, int(every))
+        self.near      = near
+        self.near_well = near_well
+        self.field     = MeshSolver(cells)
+        self.view      = None
+        self.coarse    = 0
+        self.due       = 0
+
+    def classify(self, pos, center, dist):
+        """
+        Coarse mask for bullets at ``pos`` whose distance to the nearest
+        well was ``dist`` last step.
+        """
+        off = pos - np.asarray(center, dtype=float)
+        far = np.einsum("nk,nk->n", off, off) > self.radius * self.radius
+        if self.view is not None:
+            x0, y0, x1, y1 = self.view
+            mx, my = (x1 - x0) * VIEW_MARGIN, (y1 - y0) * VIEW_MARGIN
+            x, y = pos[:, 0], pos[:, 1]
+            far |= (x < x0 - mx) | (x > x1 + mx) | (y < y0 - my) | (y > y1 + my)
+        far &= dist > self.near_well
+        if far.any() and self.near > 0:
+            # promote bullets closing in on another one
+            i, j = near_pairs(pos, self.near)
+            d = pos[j] - pos[i]
+            close = np.einsum("pk,pk->p", d, d) < self.near * self.near
+            far[i[close]] = False
+            far[j[close]] = False
+        return far
+
+    def stepping(self, ids, tick):
+        """Which coarse bullets step this tick (each one every ``every``)."""
+        return (ids + tick) % self.every == 0
@@ -0,0 +1,44 @@
+# gravitywell/modes.py
+#
+# The game variants as configurations of one engine.  GW1.py (the classic
+# single-well game), practice_orbit.py (one shot at a time, aiming for a
+# full orbit) and main.py (many mutually attracting bullets) used to carry
+# their own Settings, Projectile and integrator; they are now all a World
+# stepped by physics.step_bullets, differing only in the fields below.
+
+class Mode:
+    """
+    ``pairs``      bullets attract each other (the N x N term); a mass
+                   instead of True lets only bullets that heavy attract
+    ``max_shots``  bullets in flight at once; a new shot replaces the oldest
+    ``vel_scale``  launch velocity per px of drag (None: drag_scale / 10)
+    ``friction``   friction for new shots (None: the Settings value)
+    ``goal``       revolutions around the first well that end a shot as an
+                   ORBIT success (None: no goal)
+    ``score``      whether bullets in flight past SCORE_TIME score
+    """
+    def __init__(self, name, title, pairs=True, max_shots=None, vel_scale=None,
+                 friction=None, goal=None, score=True):
+        self.name      = name
+        self.title     = title
+        self.pairs     = pairs
+        self.max_shots = max_shots
+        self.vel_scale = vel_scale
+        self.friction  = friction
+        self.goal      = goal
+        self.score     = score
+
+MODES = {m.name: m for m in (
+    Mode("multibody", "GravityWell"),
+    Mode("classic",   "GravityWell Classic", pairs=False),
+    Mode("practice",  "Orbit Practice", pairs=False, max_shots=1,
+         vel_scale=2.0, friction=0, goal=1.0, score=False),
+)}
+
+DEFAULT_MODE = "multibody"
+
+def get(mode):
+    """A Mode by name (a Mode passes through; None is the default)."""
+    if isinstance(mode, Mode):
+        return mode
+    return MODES[mode or DEFAULT_MODE]
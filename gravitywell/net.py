@@ -0,0 +1,811 @@
+# gravitywell/net.py
+#
+# Client/server split.  The server owns the simulation (a Bodies store and a
+# Scene, stepped at a fixed tick on asyncio) and streams snapshots to every
+# connected client over TCP; clients only draw what they receive and send
+# spawn commands and their current viewport back.
+#
+#   python -m gravitywell.net server [--port 8765] [--scene scenes/binary.json]
+#   python -m gravitywell.net client [--host 127.0.0.1] [--port 8765]
+#   python -m gravitywell.net loadgen --count 100 --seconds 10
+#
+# Wire format: every message is a little-endian uint32 length followed by a
+# one-byte message type and its payload.  Positions are quantised to
+# 1/QUANT px.  Both ends dead-reckon each body from the last two positions
+# published for it (``predict``), and the server publishes a body again –
+# once per tick for all clients, as an int16 residual from that prediction –
+# only when the prediction drifts past TOL or goes STALE.
+#
+# Interest management: a client that sent a viewport (MSG_VIEW) holds only
+# the bodies in and around it.  Which bodies those are is re-evaluated every
+# INTEREST_EVERY ticks (staggered over the clients); in between, a client is
+# just forwarded the published changes to the bodies it holds.  Bodies in
+# the margin around the view get no per-tick updates; at a re-evaluation
+# they are resent in full only if the client's own extrapolation is off by
+# more than FAR_TOL.  A client that falls behind skips snapshots and is
+# resynchronised with a keyframe; so is one that cannot apply a snapshot
+# (it asks with MSG_RESYNC).
+
+import argparse
+import asyncio
+import json
+import random
+import struct
+import time
+import zlib
+import numpy as np
+from .settings import Settings
+from .scene import Scene
+from .bodies import Bodies
+from .recorder import Recorder
+from .mesh import MeshSolver
+from .physics import SCORE_TIME
+
+MSG_HELLO    = 1   # server -> client, JSON: tick rate, size, scene, settings
+MSG_SNAPSHOT = 2   # server -> client, zlib'd SNAP_HEADER + arrays
+MSG_SPAWN    = 3   # client -> server, SPAWN (pos, vel)
+MSG_CLEAR    = 4   # client -> server, no payload
+MSG_VIEW     = 5   # client -> server, VIEW (centre, half width, half height)
+MSG_RESYNC   = 6   # client -> server, no payload: send a keyframe next
+
+PROTOCOL     = 2
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+TICK_RATE    = 60
+QUANT        = 16        # position units per px
+TOL          = QUANT // 4  # dead-reckoning error (position units) before an update
+STALE        = TICK_RATE   # ticks before a body is published again regardless
+RESID_MAX    = 32767     # int16 residuals; a body further off is re-sent in full
+ZLIB_LEVEL   = 1
+MAX_BACKLOG  = 1 << 20   # bytes queued for a client before it skips snapshots
+MAX_LAG      = 0.25      # seconds behind schedule before the tick loop resyncs
+WIDTH, HEIGHT = 1920, 1080
+
+INTEREST_EVERY = 10      # ticks between re-evaluating a client's interest set
+FAR_TOL        = 4 * QUANT  # dead-reckoning error tolerated around the view
+GRID_CELL      = 128     # px, spatial hash cell for viewport queries
+VIEW_MARGIN    = 0.25    # interest area reaches this fraction of the view past each edge
+
+KEYFRAME = 1
+
+LENGTH      = struct.Struct("<I")
+SNAP_HEADER = struct.Struct("<BIddIII")  # flags, tick, time, score, gone, full, updated
+SPAWN       = struct.Struct("<dddd")
+VIEW        = struct.Struct("<dddd")
+
+def frame(msg_type, payload=b""):
+    return LENGTH.pack(len(payload) + 1) + bytes((msg_type,)) + payload
+
+async def read_frame(reader):
+    """Next (message type, payload) from a stream."""
+    (n,) = LENGTH.unpack(await reader.readexactly(LENGTH.size))
+    data = await reader.readexactly(n)
+    return data[0], data[1:]
+
+def member(sorted_ids, ids):
+    """Mask of the ``ids`` that occur in the sorted array ``sorted_ids``."""
+    if not len(sorted_ids):
+        return np.zeros(len(ids), bool)
+    at = np.searchsorted(sorted_ids, ids)
+    at[at == len(sorted_ids)] = 0
+    return sorted_ids[at] == ids
+
+# ── snapshot codec ──────────────────────────────────────────────────────────
+def predict(q, prev, t_q, t_prev, tick):
+    """
+    Integer dead reckoning shared by both ends: positions at ``tick``
+    extrapolated from the last two updates (``prev`` at ``t_prev``, ``q``
+    at ``t_q``).  Bodies with a single update stand still.
+    """
+    span = np.maximum(t_q - t_prev, 1)
+    return q + (q - prev) * (tick - t_q)[:, None] // span[:, None]
+
+class Publisher:
+    """
+    The published state of every body – the last two quantised positions
+    sent out and the ticks they were sent at – shared by all clients.  Its
+    arrays are aligned with the Bodies rows after each ``update``, which
+    also leaves this tick's ``changed_rows`` (with their ``resid``),
+    ``fresh_rows`` (spawned, or too far off to patch) and ``gone`` ids.
+    """
+    def __init__(self):
+        self.ids    = np.zeros(0, np.int64)
+        self.q      = np.zeros((0, 2), np.int64)
+        self.prev   = np.zeros((0, 2), np.int64)
+        self.t_q    = np.zeros(0, np.int64)
+        self.t_prev = np.zeros(0, np.int64)
+        self.radius = np.zeros(0)
+        self.mass   = np.zeros(0)
+        self.now    = np.zeros((0, 2), np.int64)   # true quantised positions
+        self.changed_rows = self.fresh_rows = np.zeros(0, np.intp)
+        self.resid  = np.zeros((0, 2), np.int64)
+        self.gone   = np.zeros(0, np.int64)
+
+    def update(self, tick, ids, pos, radius, mass):
+        q     = np.rint(pos * QUANT).astype(np.int64)
+        known = member(self.ids, ids)
+        rows  = np.searchsorted(self.ids, ids[known])
+        self.gone = self.ids[~member(ids, self.ids)]
+
+        err  = q[known] - predict(self.q[rows], self.prev[rows],
+                                  self.t_q[rows], self.t_prev[rows], tick)
+        amax = np.abs(err).max(axis=1) if len(err) else np.zeros(0, np.int64)
+        send = (amax > TOL) | (tick - self.t_q[rows] >= STALE)
+        over = amax > RESID_MAX
+        held = np.flatnonzero(known)
+
+        n = len(ids)
+        Q, P   = q.copy(), q.copy()
+        TQ, TP = np.full(n, tick), np.full(n, tick)
+        same, upd = held[~send], held[send & ~over]
+        Q[same], P[same] = self.q[rows[~send]], self.prev[rows[~send]]
+        TQ[same], TP[same] = self.t_q[rows[~send]], self.t_prev[rows[~send]]
+        P[upd], TP[upd] = self.q[rows[send & ~over]], self.t_q[rows[send & ~over]]
+
+        fresh = ~known
+        fresh[held[over]] = True
+        self.ids, self.q, self.prev, self.t_q, self.t_prev = ids.copy(), Q, P, TQ, TP
+        self.radius, self.mass = radius.copy(), mass.copy()
+        self.now          = q
+        self.changed_rows = upd
+        self.resid        = err[send & ~over]
+        self.fresh_rows   = np.flatnonzero(fresh)
+
+def merge(ids, *columns):
+    """Concatenate (held, new) pairs of columns and reorder them by id."""
+    ids   = np.concatenate(ids)
+    order = np.argsort(ids, kind="stable")
+    return (ids[order],) + tuple(np.concatenate(c)[order] for c in columns)
+
+class Decoder:
+    """
+    Client side of the stream: the bodies this client holds and, per body,
+    the same prediction state the server published.
+    """
+    def __init__(self, tick_rate=TICK_RATE):
+        self.tick_rate = tick_rate
+        self.tick  = 0
+        self.time  = 0.0
+        self.score = 0.0
+        self.reset()
+
+    def reset(self):
+        self.ids    = np.zeros(0, np.int64)
+        self.q      = np.zeros((0, 2), np.int64)
+        self.prev   = np.zeros((0, 2), np.int64)
+        self.t_q    = np.zeros(0, np.int64)
+        self.t_prev = np.zeros(0, np.int64)
+        self.radius = np.zeros(0, np.float32)
+        self.mass   = np.zeros(0, np.float32)
+
+    def decode(self, payload):
+        body = zlib.decompress(payload)
+        flags, tick, t, score, n_gone, n_full, n_upd = SNAP_HEADER.unpack_from(body)
+        off = SNAP_HEADER.size
+
+        def take(dtype, count, width=1):
+            nonlocal off
+            a = np.frombuffer(body, dtype, count * width, off)
+            off += a.nbytes
+            a = a.astype(np.int64) if a.dtype.kind in "iu" else a
+            return a.reshape(-1, width) if width > 1 else a
+
+        if flags & KEYFRAME:
+            self.reset()
+        gone     = take("<u4", n_gone)
+        full_ids = take("<u4", n_full)
+        full_q   = take("<i4", n_full, 2)
+        full_p   = take("<i4", n_full, 2)
+        full_tq  = take("<u4", n_full)
+        full_tp  = take("<u4", n_full)
+        full_r   = take("<f4", n_full)
+        full_m   = take("<f4", n_full)
+        upd_ids  = take("<u4", n_upd)
+        resid    = take("<i2", n_upd, 2)
+
+        rows = np.flatnonzero(~np.isin(self.ids, np.concatenate((gone, full_ids))))
+        ids, q, prev = self.ids[rows], self.q[rows], self.prev[rows]
+        t_q, t_prev  = self.t_q[rows], self.t_prev[rows]
+        if not member(ids, upd_ids).all():
+            raise ValueError("snapshot updates a body the client does not hold")
+        u = np.searchsorted(ids, upd_ids)
+        pred = predict(q[u], prev[u], t_q[u], t_prev[u], tick)
+        prev[u], t_prev[u] = q[u], t_q[u]
+        q[u], t_q[u]       = pred + resid, tick
+
+        (self.ids, self.q, self.prev, self.t_q, self.t_prev,
+         self.radius, self.mass) = merge(
+            (ids, full_ids), (q, full_q), (prev, full_p), (t_q, full_tq),
+            (t_prev, full_tp), (self.radius[rows], full_r), (self.mass[rows], full_m))
+        self.tick, self.time, self.score = tick, t, score
+
+    @property
+    def pos(self):
+        """Positions at the current tick, extrapolated like ``predict``."""
+        span  = np.maximum(self.t_q - self.t_prev, 1)
+        ahead = ((self.tick - self.t_q) / span)[:, None]
+        return (self.q + (self.q - self.prev) * ahead) / QUANT
+
+    @property
+    def vel(self):
+        """Velocities implied by the last two updates (zero for new bodies)."""
+        span = np.maximum(self.t_q - self.t_prev, 1)[:, None]
+        return (self.q - self.prev) * (self.tick_rate / QUANT) / span
+
+# ── server ──────────────────────────────────────────────────────────────────
+class Grid:
+    """
+    Body indices bucketed into GRID_CELL squares.  Built at most once per
+    tick and shared by every client's viewport query, so a query costs what
+    is in (and around) that viewport rather than a pass over every body.
+    """
+    def __init__(self, pos, cell=GRID_CELL):
+        self.pos  = pos
+        self.cell = cell
+        c = np.floor(pos / cell).astype(np.int64)
+        self.lo = c.min(axis=0) if len(c) else np.zeros(2, np.int64)
+        hi      = c.max(axis=0) if len(c) else np.zeros(2, np.int64)
+        self.nx, self.ny = (hi - self.lo + 1).tolist()
+        key = (c[:, 1] - self.lo[1]) * self.nx + (c[:, 0] - self.lo[0])
+        self.order = np.argsort(key, kind="stable")
+        self.keys  = key[self.order]
+
+    def query(self, x0, y0, x1, y1):
+        """Sorted indices of the bodies inside the rectangle."""
+        cell, (lx, ly) = self.cell, self.lo.tolist()
+        cx0 = max(int(np.floor(x0 / cell)) - lx, 0)
+        cx1 = min(int(np.floor(x1 / cell)) - lx, self.nx - 1)
+        cy0 = max(int(np.floor(y0 / cell)) - ly, 0)
+        cy1 = min(int(np.floor(y1 / cell)) - ly, self.ny - 1)
+        if cx0 > cx1 or cy0 > cy1 or not len(self.keys):
+            return np.zeros(0, np.intp)
+        rows   = np.arange(cy0, cy1 + 1) * self.nx
+        starts = np.searchsorted(self.keys, rows + cx0, "left").tolist()
+        ends   = np.searchsorted(self.keys, rows + cx1, "right").tolist()
+        idx = np.concatenate([self.order[s:e] for s, e in zip(starts, ends)])
+        p   = self.pos[idx]
+        inside = (p[:, 0] >= x0) & (p[:, 0] <= x1) & (p[:, 1] >= y0) & (p[:, 1] <= y1)
+        return np.sort(idx[inside])
+
+def view_masks(view, pos):
+    """(in the interest area, in the view proper) for positions under ``view``."""
+    cx, cy, hw, hh = view
+    dx, dy = np.abs(pos[:, 0] - cx), np.abs(pos[:, 1] - cy)
+    area = (dx <= hw * (1 + VIEW_MARGIN)) & (dy <= hh * (1 + VIEW_MARGIN))
+    return area, (dx <= hw) & (dy <= hh)
+
+class Peer:
+    """
+    A connected client: its stream, viewport (``(cx, cy, half width, half
+    height)``, None for everything) and counters, plus the bodies it holds
+    with the prediction state it holds them at.  Bodies inside the view
+    (``near``) are kept equal to the published state; the rest may lag it.
+    """
+    def __init__(self, writer, phase=0):
+        self.writer  = writer
+        self.view    = None
+        self.phase   = phase
+        self._hold(np.zeros(0, np.int64), np.zeros(0, bool),
+                   np.zeros((0, 2), np.int64), np.zeros((0, 2), np.int64),
+                   np.zeros(0, np.int64), np.zeros(0, np.int64))
+        self.last    = -1       # tick of the last snapshot sent
+        self.dirty   = True     # view changed, re-evaluate next tick
+        self.sent    = 0
+        self.skipped = 0
+
+    def backlog(self):
+        return self.writer.transport.get_write_buffer_size()
+
+    def send(self, msg_type, payload=b""):
+        data = frame(msg_type, payload)
+        self.writer.write(data)
+        self.sent += len(data)
+
+    def set_view(self, view):
+        self.view  = view
+        self.dirty = True
+
+    def resync(self):
+        """Make the next snapshot a keyframe (the client lost track)."""
+        self.last = -1
+
+    def due(self, tick):
+        """Whether this tick re-evaluates the interest set."""
+        return (self.dirty or tick - self.last != 1
+                or (tick + self.phase) % INTEREST_EVERY == 0)
+
+    def _hold(self, held, near, q, prev, t_q, t_prev):
+        self.held, self.near = held, near      # sorted ids, inside the view
+        self.q, self.prev, self.t_q, self.t_prev = q, prev, t_q, t_prev
+        self.near_ids = held[near]
+
+    def _keep(self, mask):
+        self._hold(self.held[mask], self.near[mask], self.q[mask],
+                   self.prev[mask], self.t_q[mask], self.t_prev[mask])
+
+    def _sync(self, pub, rows):
+        """Record that the held bodies at publisher ``rows`` were sent in full
+        (or forwarded), so the client now has their published state."""
+        at = np.searchsorted(self.held, pub.ids[rows])
+        self.q[at], self.prev[at] = pub.q[rows], pub.prev[rows]
+        self.t_q[at], self.t_prev[at] = pub.t_q[rows], pub.t_prev[rows]
+
+    def snapshot(self, pub, tick, t, score, interest=None):
+        """
+        Payload for this tick.  ``interest`` is given when ``due``: the
+        (rows, near) of the bodies to hold, as indices into the publisher's
+        arrays, with rows None for all of them.  Otherwise only the
+        published changes touching held bodies go out.
+        """
+        keyframe = tick - self.last != 1
+        if keyframe:
+            self._keep(np.zeros(len(self.held), bool))
+        self.last = tick
+
+        gone = pub.gone[member(self.held, pub.gone)]
+        if len(gone):
+            self._keep(~member(gone, self.held))
+
+        # published changes to bodies in the view go out as residuals
+        c   = pub.changed_rows
+        cid = pub.ids[c]
+        fwd = member(self.near_ids, cid)
+        self._sync(pub, c[fwd])
+
+        full = np.zeros(0, np.intp)
+        if interest is not None:
+            rows, near = interest
+            if rows is None:
+                rows, near = np.arange(len(pub.ids)), np.ones(len(pub.ids), bool)
+            ids  = pub.ids[rows]
+            had  = member(self.held, ids)
+            kept = member(ids, self.held)
+            gone = np.concatenate((gone, self.held[~kept]))
+
+            # the client's copies, published state for the ones it lacks
+            pq, pp = pub.q[rows], pub.prev[rows]
+            ptq, ptp = pub.t_q[rows], pub.t_prev[rows]
+            q, prev, t_q, t_prev = pq.copy(), pp.copy(), ptq.copy(), ptp.copy()
+            q[had], prev[had] = self.q[kept], self.prev[kept]
+            t_q[had], t_prev[had] = self.t_q[kept], self.t_prev[kept]
+            synced = ((t_q == ptq) & (t_prev == ptp)
+                      & (q == pq).all(axis=1) & (prev == pp).all(axis=1))
+            # in the view: must match the published state to take residuals;
+            # around it: only resent once the client's own guess is FAR_TOL off
+            off = np.abs(pub.now[rows] - predict(q, prev, t_q, t_prev, tick)).max(axis=1, initial=0)
+            resend = ~had | (~synced & (near | (off > FAR_TOL)))
+            full = rows[resend]
+            q[resend], prev[resend] = pq[resend], pp[resend]
+            t_q[resend], t_prev[resend] = ptq[resend], ptp[resend]
+            self._hold(ids, near, q, prev, t_q, t_prev)
+            self.dirty = False
+
+        # spawned this tick, or too far off to patch: resend if held, take
+        # on if inside the interest area
+        f = pub.fresh_rows
+        if len(f):
+            fid = pub.ids[f]
+            had = member(self.held, fid)
+            if self.view is None:
+                area = inside = np.ones(len(f), bool)
+            else:
+                area, inside = view_masks(self.view, pub.now[f] / QUANT)
+            add = ~had & area
+            if add.any():
+                a = f[add]
+                self._hold(*merge((self.held, fid[add]), (self.near, inside[add]),
+                                  (self.q, pub.q[a]), (self.prev, pub.prev[a]),
+                                  (self.t_q, pub.t_q[a]), (self.t_prev, pub.t_prev[a])))
+            full = np.union1d(full, f[had | add])
+            self._sync(pub, f[had])
+
+        # residuals only for what is still held and was not just resent
+        if interest is not None or len(full):
+            fwd &= member(self.held, cid) & ~member(pub.ids[full], cid)
+        upd = c[fwd]
+
+        body = b"".join((
+            SNAP_HEADER.pack(KEYFRAME if keyframe else 0, tick, t, score,
+                             len(gone), len(full), len(upd)),
+            gone.astype("<u4").tobytes(),
+            pub.ids[full].astype("<u4").tobytes(),
+            pub.q[full].astype("<i4").tobytes(),
+            pub.prev[full].astype("<i4").tobytes(),
+            pub.t_q[full].astype("<u4").tobytes(),
+            pub.t_prev[full].astype("<u4").tobytes(),
+            pub.radius[full].astype("<f4").tobytes(),
+            pub.mass[full].astype("<f4").tobytes(),
+            pub.ids[upd].astype("<u4").tobytes(),
+            pub.resid[fwd].astype("<i2").tobytes(),
+        ))
+        return zlib.compress(body, ZLIB_LEVEL)
+
+class Server:
+    """
+    The authoritative simulation: bodies, wells and score, stepped at
+    ``tick_rate``, published once per tick and fanned out to every peer.
+    """
+    def __init__(self, settings=None, scene=None, size=(WIDTH, HEIGHT),
+                 tick_rate=TICK_RATE, pairs=None):
+        self.settings  = settings or Settings()
+        self.size      = size
+        self.center    = (size[0]/2, size[1]/2)
+        self.max_dist  = max(size) * 1.5
+        self.scene     = scene or Scene.from_settings(self.settings, self.center)
+        self.bodies    = Bodies()
+        self.publisher = Publisher()
+        self.tick_rate = tick_rate
+        self.pairs     = pairs
+        self.tick        = 0
+        self.time        = 0.0
+        self.total_score = 0.0
+        self.peers     = set()
+        self.joined    = 0
+        self.log       = False
+        self.left_sent = 0       # bytes sent to peers that have disconnected
+        self.recorder  = None    # a recorder.Recorder, fed every tick
+        self.step_time = self.send_time = 0.0
+
+    def hello(self):
+        return json.dumps({
+            "protocol":  PROTOCOL,
+            "tick_rate": self.tick_rate,
+            "quant":     QUANT,
+            "size":      list(self.size),
+            "max_dist":  self.max_dist,
+            "scene":     self.scene.to_dict(),
+            "settings":  self.settings.to_dict(),
+        }).encode()
+
+    def add_peer(self, writer):
+        peer = Peer(writer, phase=self.joined % INTEREST_EVERY)
+        self.joined += 1
+        self.peers.add(peer)
+        return peer
+
+    def spawn(self, pos, vel):
+        """Add bodies with the current bullet settings; returns their ids."""
+        s = self.settings
+        return self.bodies.spawn(pos, vel, s.bullet_radius, s.bullet_mass, s.friction)
+
+    def clear(self):
+        self.bodies.clear()
+        self.total_score = 0.0
+
+    def step(self):
+        dt = 1.0 / self.tick_rate
+        self.settings.poll()
+        self.scene.sync(self.settings)
+        self.bodies.step(dt, self.scene, self.max_dist, self.pairs)
+        self.scene.advance(dt)
+        self.tick += 1
+        self.time += dt
+        self.total_score += dt * np.count_nonzero(self.bodies.arc_time > SCORE_TIME)
+        if self.recorder:
+            self.recorder.record_bodies(self.tick, self.time, self.bodies)
+
+    def broadcast(self):
+        b, pub = self.bodies, self.publisher
+        pub.update(self.tick, b.ids, b.pos, b.radius, b.mass)
+        grid = None
+        for peer in list(self.peers):
+            if peer.backlog() > MAX_BACKLOG:
+                peer.skipped += 1
+                continue
+            interest = None
+            if peer.due(self.tick):
+                if peer.view is None:
+                    interest = (None, None)
+                else:
+                    if grid is None:
+                        grid = Grid(b.pos)
+                    cx, cy, hw, hh = peer.view
+                    mx, my = hw * (1 + VIEW_MARGIN), hh * (1 + VIEW_MARGIN)
+                    rows = grid.query(cx - mx, cy - my, cx + mx, cy + my)
+                    interest = (rows, view_masks(peer.view, b.pos[rows])[1])
+            peer.send(MSG_SNAPSHOT, peer.snapshot(
+                pub, self.tick, self.time, self.total_score, interest))
+
+    async def handle(self, reader, writer):
+        peer = self.add_peer(writer)
+        peer.send(MSG_HELLO, self.hello())
+        try:
+            while True:
+                msg, payload = await read_frame(reader)
+                if msg == MSG_SPAWN:
+                    x, y, vx, vy = SPAWN.unpack(payload)
+                    self.spawn((x, y), (vx, vy))
+                elif msg == MSG_VIEW:
+                    peer.set_view(VIEW.unpack(payload))
+                elif msg == MSG_CLEAR:
+                    self.clear()
+                elif msg == MSG_RESYNC:
+                    peer.resync()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.peers.discard(peer)
+            self.left_sent += peer.sent
+            writer.close()
+
+    async def run(self, ticks=None):
+        """Fixed-tick loop; runs forever unless a tick count is given."""
+        loop = asyncio.get_running_loop()
+        dt   = 1.0 / self.tick_rate
+        due  = loop.time()
+        last_log, last_tick = time.perf_counter(), self.tick
+        last_sent = 0
+        while ticks is None or ticks > 0:
+            t0 = time.perf_counter()
+            self.step()
+            t1 = time.perf_counter()
+            self.broadcast()
+            t2 = time.perf_counter()
+            self.step_time, self.send_time = t1 - t0, t2 - t1
+            if ticks is not None:
+                ticks -= 1
+
+            if self.log and t2 - last_log >= 1.0:
+                rate = (self.tick - last_tick) / (t2 - last_log)
+                sent = self.left_sent + sum(p.sent for p in self.peers)
+                print(f"tick {self.tick}  {rate:5.1f} Hz  bodies {len(self.bodies)}  "
+                      f"step {self.step_time*1e3:.1f} ms  send {self.send_time*1e3:.1f} ms  "
+                      f"peers {len(self.peers)}  out {(sent - last_sent)/1024/(t2 - last_log):.0f} KiB/s")
+                last_log, last_tick, last_sent = t2, self.tick, sent
+
+            due += dt
+            delay = due - loop.time()
+            if delay < -MAX_LAG:
+                due = loop.time()
+            await asyncio.sleep(max(0.0, delay))
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await self.run()
+
+# ── client ──────────────────────────────────────────────────────────────────
+class Connection:
+    """Client end of the stream: the HELLO record and a live Decoder."""
+    def __init__(self, reader, writer, hello):
+        self.reader   = reader
+        self.writer   = writer
+        self.hello    = hello
+        self.view     = Decoder(hello["tick_rate"])
+        self.received = 0
+        self.frames   = 0
+        self.resyncs  = 0
+
+    @classmethod
+    async def open(cls, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        reader, writer = await asyncio.open_connection(host, port)
+        msg, payload = await read_frame(reader)
+        if msg != MSG_HELLO:
+            raise ConnectionError(f"expected HELLO, got message type {msg}")
+        hello = json.loads(payload)
+        if hello["protocol"] != PROTOCOL:
+            raise ConnectionError(f"server speaks protocol {hello['protocol']}, not {PROTOCOL}")
+        return cls(reader, writer, hello)
+
+    async def receive(self):
+        """Decode snapshots until the server goes away."""
+        try:
+            while True:
+                msg, payload = await read_frame(self.reader)
+                self.received += len(payload) + LENGTH.size + 1
+                if msg == MSG_SNAPSHOT:
+                    try:
+                        self.view.decode(payload)
+                    except (ValueError, zlib.error, struct.error):
+                        # out of step with the server (or a damaged
+                        # payload): drop it and ask for a keyframe
+                        self.writer.write(frame(MSG_RESYNC))
+                        self.resyncs += 1
+                        continue
+                    self.frames += 1
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+    def spawn(self, pos, vel):
+        self.writer.write(frame(MSG_SPAWN, SPAWN.pack(pos[0], pos[1], vel[0], vel[1])))
+
+    def set_view(self, cx, cy, half_w, half_h):
+        """Only hear about bodies in (and near) this world rectangle."""
+        self.writer.write(frame(MSG_VIEW, VIEW.pack(cx, cy, half_w, half_h)))
+
+    def clear(self):
+        self.writer.write(frame(MSG_CLEAR))
+
+    def close(self):
+        self.writer.close()
+
+async def run_client(host=DEFAULT_HOST, port=DEFAULT_PORT, fps=60):
+    """
+    A pygame window that draws the server's state and fires on drag.  The
+    camera pans with the arrow keys and zooms with the wheel; the server is
+    told the visible rectangle after every change.
+    """
+    import pygame
+    from . import render
+    from .app import bul_min, bul_max, gv_min, gv_max, ZOOM_STEP
+
+    conn = await Connection.open(host, port)
+    hello, view = conn.hello, conn.view
+    settings = Settings()
+    for k, v in hello["settings"].items():
+        setattr(settings, k, v)
+    size  = hello["size"]
+    scene = Scene.from_dict(hello["scene"], (size[0]/2, size[1]/2))
+
+    pygame.init()
+    screen = pygame.display.set_mode(size)
+    pygame.display.set_caption(f"gravitywell – {host}:{port}")
+    half  = pygame.math.Vector2(size[0]/2, size[1]/2)
+    cam   = pygame.math.Vector2(scene.origin)
+    zoom  = 1.0
+    small = render.font(24)
+    pan   = {pygame.K_LEFT: (-1, 0), pygame.K_RIGHT: (1, 0),
+             pygame.K_UP: (0, -1), pygame.K_DOWN: (0, 1)}
+
+    def to_screen(p):
+        return (p - cam) * zoom + half
+
+    def to_world(s):
+        return (pygame.math.Vector2(s) - half) / zoom + cam
+
+    def send_view():
+        conn.set_view(cam.x, cam.y, half.x / zoom, half.y / zoom)
+
+    recv = asyncio.create_task(conn.receive())
+    send_view()
+    drag_start, running = None, True
+    colors = {}
+    last, last_bytes, rate = time.perf_counter(), 0, 0.0
+    try:
+        while running and not recv.done():
+            for ev in pygame.event.get():
+                if ev.type == pygame.QUIT or (ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE):
+                    running = False
+                elif ev.type == pygame.KEYDOWN and ev.key == pygame.K_c:
+                    conn.clear()
+                elif ev.type == pygame.KEYDOWN and ev.key in pan:
+                    cam += pygame.math.Vector2(pan[ev.key]) * (0.2 * half.x / zoom)
+                    send_view()
+                elif ev.type == pygame.MOUSEWHEEL:
+                    zoom = max(ZOOM_STEP, zoom + ev.y * ZOOM_STEP)
+                    send_view()
+                elif ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
+                    drag_start = to_world(ev.pos)
+                elif ev.type == pygame.MOUSEBUTTONUP and ev.button == 1 and drag_start:
+                    drag_end = to_world(ev.pos)
+                    conn.spawn(drag_start, (drag_start - drag_end) * (settings.drag_scale / 10))
+                    drag_start = None
+
+            screen.fill((0, 0, 0))
+            scene.time = view.time
+            for w, wp in zip(scene.wells, scene.positions()):
+                c = to_screen(pygame.math.Vector2(wp))
+                pygame.draw.circle(screen, render.mass_to_color(w.mass, gv_min, gv_max),
+                                   (int(c.x), int(c.y)), int(w.radius * zoom))
+
+            pts = (view.pos - cam) * zoom + half
+            rad = np.maximum(1, (view.radius * zoom).astype(int))
+            for (x, y), r, m in zip(pts.tolist(), rad.tolist(), view.mass.tolist()):
+                col = colors.get(m)
+                if col is None:
+                    col = colors[m] = render.mass_to_color(m, bul_min, bul_max)
+                pygame.draw.circle(screen, col, (int(x), int(y)), r)
+            if drag_start:
+                pygame.draw.line(screen, (200, 200, 200), to_screen(drag_start),
+                                 pygame.mouse.get_pos(), 2)
+
+            now = time.perf_counter()
+            if now - last >= 1.0:
+                rate = (conn.received - last_bytes) / (now - last)
+                last, last_bytes = now, conn.received
+            hud = (f"Score: {int(view.score)}   In view: {len(view.ids)}   "
+                   f"tick {view.tick}   {rate/1024:.1f} KiB/s")
+            screen.blit(small.render(hud, True, (255, 255, 255)), (10, 10))
+            pygame.display.flip()
+            await asyncio.sleep(1.0 / fps)
+    finally:
+        recv.cancel()
+        conn.close()
+        pygame.quit()
+
+async def load(host=DEFAULT_HOST, port=DEFAULT_PORT, count=100, seconds=10.0,
+               seed=0):
+    """
+    Load generator: ``count`` headless spectators, each with its own
+    randomly placed, zoomed and slowly panning viewport.  Returns one
+    (snapshots/s, bytes/s, bodies held) tuple per spectator.
+    """
+    rng   = random.Random(seed)
+    conns = [await Connection.open(host, port) for _ in range(count)]
+    w, h  = conns[0].hello["size"]
+    cams  = []
+    for c in conns:
+        zoom = rng.uniform(1.0, 4.0)
+        cam  = [rng.uniform(0, w), rng.uniform(0, h), w/2/zoom, h/2/zoom,
+                rng.uniform(-40, 40), rng.uniform(-40, 40)]
+        c.set_view(*cam[:4])
+        cams.append(cam)
+    tasks = [asyncio.create_task(c.receive()) for c in conns]
+
+    await asyncio.sleep(1.0)                  # initial full sends
+    start  = [(c.frames, c.received) for c in conns]
+    t0     = time.perf_counter()
+    while time.perf_counter() - t0 < seconds:
+        await asyncio.sleep(0.5)
+        for c, cam in zip(conns, cams):
+            cam[0] += cam[4] * 0.5
+            cam[1] += cam[5] * 0.5
+            c.set_view(*cam[:4])
+    elapsed = time.perf_counter() - t0
+
+    stats = [((c.frames - f0) / elapsed, (c.received - b0) / elapsed, len(c.view.ids))
+             for c, (f0, b0) in zip(conns, start)]
+    for t in tasks:
+        t.cancel()
+    for c in conns:
+        c.close()
+    return stats
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="gravitywell network server / client")
+    ap.add_argument("mode", choices=("server", "client", "loadgen"))
+    ap.add_argument("--host", default=DEFAULT_HOST)
+    ap.add_argument("--port", type=int, default=DEFAULT_PORT)
+    ap.add_argument("--scene", help="scene file (server)")
+    ap.add_argument("--settings", help="settings JSON (server)")
+    ap.add_argument("--watch", action="store_true",
+                    help="reload the --settings file whenever it changes (server)")
+    ap.add_argument("--tick-rate", type=int, default=TICK_RATE)
+    ap.add_argument("--heavy", type=float, metavar="MASS",
+                    help="only bodies of at least MASS pull on other bodies (server)")
+    ap.add_argument("--mesh", type=int, metavar="CELLS",
+                    help="body-body gravity on a CELLS x CELLS particle mesh (server)")
+    ap.add_argument("--p3m", action="store_true",
+                    help="with --mesh, add exact short-range forces (server)")
+    ap.add_argument("--record", metavar="DIR", help="record every body's state to DIR (server)")
+    ap.add_argument("--record-every", type=int, default=1, metavar="N")
+    ap.add_argument("--count", type=int, default=100, help="spectators (loadgen)")
+    ap.add_argument("--seconds", type=float, default=10.0, help="duration (loadgen)")
+    args = ap.parse_args(argv)
+
+    if args.mode == "client":
+        asyncio.run(run_client(args.host, args.port))
+        return
+    if args.mode == "loadgen":
+        stats = asyncio.run(load(args.host, args.port, args.count, args.seconds))
+        rates, bw, held = (np.array(s, dtype=float) for s in zip(*stats))
+        print(f"{len(stats)} spectators over {args.seconds:.0f} s")
+        print(f"snapshots/s : mean {rates.mean():.1f}  min {rates.min():.1f}")
+        print(f"KiB/s each  : mean {bw.mean()/1024:.1f}  max {bw.max()/1024:.1f}  "
+              f"total {bw.sum()/1024:.0f}")
+        print(f"bodies held : mean {held.mean():.0f}  max {held.max():.0f}")
+        return
+    settings = Settings()
+    if args.settings:
+        settings.load(args.settings)
+        if args.watch:
+            settings.watch(args.settings)
+    pairs = MeshSolver(args.mesh, args.p3m) if args.mesh else args.heavy
+    server = Server(settings, tick_rate=args.tick_rate, pairs=pairs)
+    if args.scene:
+        server.scene = Scene.load(args.scene, server.center)
+    if args.record:
+        server.recorder = Recorder(args.record, args.record_every,
+                                   meta={"scene": args.scene, "tick_rate": args.tick_rate})
+    server.log = True
+    print(f"serving on {args.host}:{args.port} at {args.tick_rate} Hz")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server.recorder:
+            server.recorder.close()
+
+if __name__ == "__main__":
+    main()
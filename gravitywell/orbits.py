@@ -0,0 +1,163 @@
+# gravitywell/orbits.py
+#
+# Orbit analytics for every body, updated incrementally by the physics step:
+# accumulated angle around the GV object, osculating orbital elements and a
+# predicted fate.  Everything is evaluated on whole arrays at once, except
+# when only the wells pull (the classic and practice modes): then the angle
+# is kept body by body (``advance``) and the elements are only worked out
+# when something reads them (``refresh``).
+
+import math
+import numpy as np
+
+# outcome / predicted-fate codes (shared with gravitywell.ensemble)
+CRASH  = 0
+ESCAPE = 1
+ORBIT  = 2
+
+OUTCOMES = ("crash", "escape", "orbit")
+
+TWO_PI = 2 * math.pi
+
+def accumulate_angle(rel_pos, prev_angle, accum):
+    """
+    Advance the accumulated polar angle of each body around the GV object.
+    ``prev_angle`` is NaN for bodies seen for the first time.  Returns the
+    new (angle, accum) arrays.
+    """
+    angle = np.arctan2(rel_pos[:, 1], rel_pos[:, 0])
+    delta = angle - prev_angle
+    delta = (delta + math.pi) % TWO_PI - math.pi
+    accum = accum + np.where(np.isnan(delta), 0.0, delta)
+    return angle, accum
+
+def elements(rel_pos, rel_vel, mu):
+    """
+    Osculating two-body elements for (N, 2) position/velocity arrays taken
+    relative to a body with gravitational parameter ``mu`` = G*M.
+
+    Returns ``(a, e, periapsis, apoapsis)``; ``a`` is negative and the
+    apoapsis infinite for unbound (e >= 1) bodies.
+    """
+    rx, ry = rel_pos[:, 0], rel_pos[:, 1]
+    vx, vy = rel_vel[:, 0], rel_vel[:, 1]
+    r  = np.sqrt(rx*rx + ry*ry)
+    h  = rx*vy - ry*vx
+    energy = 0.5 * (vx*vx + vy*vy) - mu / r
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = -mu / (2 * energy)
+        e = np.sqrt(np.maximum(0.0, 1 + 2 * energy * h*h / (mu*mu)))
+        peri = h*h / (mu * (1 + e))
+        apo  = np.where(e < 1, a * (1 + e), np.inf)
+    return a, e, peri, apo
+
+def predict(peri, apo, crash_r, max_dist):
+    """Predicted fate: CRASH if periapsis is under the surface, ESCAPE if the
+    orbit is unbound or leaves the play area, else ORBIT."""
+    fate = np.full(len(peri), ORBIT, dtype=np.int8)
+    fate[apo > max_dist] = ESCAPE
+    fate[peri <= crash_r] = CRASH
+    return fate
+
+class OrbitTracker:
+    """
+    Keeps the per-body orbit analytics (``accum_angle``, ``semi_major``,
+    ``eccentricity``, ``periapsis``, ``fate``) current on each projectile,
+    and ``counts`` of how many bodies are predicted to crash/escape/orbit.
+    After ``advance`` the elements, fates and counts are only worked out
+    when ``counts`` is next read or ``refresh`` is called.
+    """
+    def __init__(self):
+        self._counts = np.zeros(3, dtype=int)
+        self.pending = None     # (bodies, center, mu, gv_radius, max_dist)
+
+    @property
+    def counts(self):
+        self.refresh()
+        return self._counts
+
+    def clear(self):
+        self.pending = None
+        self._counts = np.zeros(3, dtype=int)
+
+    def update(self, bodies, pos, vel, center, mu, gv_radius, max_dist):
+        """
+        ``bodies`` are the projectiles behind the rows of the (N, 2) ``pos``
+        and ``vel`` arrays; elements are taken about the GV object at
+        ``center`` with ``mu`` = G*M.
+        """
+        self.pending = None
+        if not bodies:
+            self.clear()
+            return
+        rel   = pos - center
+        prev  = np.array([b.prev_angle for b in bodies], dtype=float)
+        accum = np.array([b.accum_angle for b in bodies], dtype=float)
+        rad   = np.array([b.radius for b in bodies], dtype=float)
+
+        angle, accum = accumulate_angle(rel, prev, accum)
+        a, e, peri, apo = elements(rel, vel, mu)
+        fate = predict(peri, apo, gv_radius + rad, max_dist)
+        self._counts = np.bincount(fate, minlength=3)
+
+        for b, ang, acc, sa, ecc, q, f in zip(bodies, angle.tolist(), accum.tolist(),
+                                              a.tolist(), e.tolist(), peri.tolist(),
+                                              fate.tolist()):
+            b.prev_angle   = ang
+            b.accum_angle  = acc
+            b.semi_major   = sa
+            b.eccentricity = ecc
+            b.periapsis    = q
+            b.fate         = f
+
+    def advance(self, bodies, center, mu, gv_radius, max_dist):
+        """
+        ``update`` for the active ``bodies`` when they are stepped one by one:
+        only the accumulated angle, which depends on every step, is taken now.
+        """
+        cx, cy = center
+        atan2, pi, isnan = math.atan2, math.pi, math.isnan
+        live = []
+        for b in bodies:
+            if not b.active:
+                continue
+            live.append(b)
+            pos = b.pos
+            angle = atan2(pos.y - cy, pos.x - cx)
+            delta = (angle - b.prev_angle + pi) % TWO_PI - pi
+            if not isnan(delta):
+                b.accum_angle += delta
+            b.prev_angle = angle
+        self.pending = (live, (cx, cy), mu, gv_radius, max_dist)
+
+    def refresh(self):
+        """Work out the elements held back by ``advance``, if any."""
+        if self.pending is None:
+            return
+        bodies, center, mu, gv_radius, max_dist = self.pending
+        if not bodies:
+            self.clear()
+            return
+        pos = np.array([(b.pos.x, b.pos.y) for b in bodies], dtype=float)
+        vel = np.array([(b.vel.x, b.vel.y) for b in bodies], dtype=float)
+        rad = np.array([b.radius for b in bodies], dtype=float)
+        self.pending = None
+        a, e, peri, apo = elements(pos - center, vel, mu)
+        fate = predict(peri, apo, gv_radius + rad, max_dist)
+        self._counts = np.bincount(fate, minlength=3)
+        for b, sa, ecc, q, f in zip(bodies, a.tolist(), e.tolist(), peri.tolist(),
+                                    fate.tolist()):
+            b.semi_major   = sa
+            b.eccentricity = ecc
+            b.periapsis    = q
+            b.fate         = f
+
+    def recount(self, bodies):
+        """``counts`` over ``bodies`` from their last predicted ``fate``
+        (for when they were updated in several batches)."""
+        fate = [b.fate for b in bodies if b.fate is not None]
+        self._counts = np.bincount(np.array(fate, dtype=np.intp), minlength=3)
+
+def orbit_count(accum_angle):
+    """Full revolutions represented by an accumulated angle."""
+    return abs(accum_angle) / TWO_PI
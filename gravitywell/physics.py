@@ -0,0 +1,438 @@
+# gravitywell/physics.py
+#
+# Projectile state and the integrators.  Only pygame.math is used here, so
+# importing this module never touches the display, fonts or event loop.
+
+import math
+from pygame.math import Vector2
+import numpy as np
+from .orbits import CRASH, ESCAPE
+
+G = 1
+# a bullet scores once it has stayed in flight this long (seconds)
+SCORE_TIME = 20
+
+class Projectile:
+    def __init__(self, pos, vel, radius, mass, friction):
+        self.pos                 = Vector2(pos)
+        self.vel                 = Vector2(vel)
+        self.radius              = radius
+        self.mass                = mass
+        self.friction            = friction
+        self.id                  = None   # assigned by World.add
+        self.born = self.touched = 0      # World.version stamps
+        self.published           = None   # (x, y, vx, vy, t) for World.delta
+        self.active              = True
+        self.outcome             = None   # CRASH / ESCAPE once inactive
+        self.arc_time            = 0.0
+        self.last_acc_components = []
+        self.distance            = 0.0
+        # orbit analytics, kept current by orbits.OrbitTracker
+        self.prev_angle          = float("nan")
+        self.accum_angle         = 0.0
+        self.semi_major          = float("nan")
+        self.eccentricity        = float("nan")
+        self.periapsis           = float("nan")
+        self.fate                = None
+
+    def update(self, dt, gv_radius, gv_mass, center, max_dist, others):
+        if not self.active:
+            return
+        self.arc_time += dt
+
+        to_center = center - self.pos
+        r_center  = to_center.length()
+        self.distance = r_center
+
+        if r_center <= gv_radius + self.radius or r_center > max_dist:
+            self.active  = False
+            self.outcome = CRASH if r_center <= gv_radius + self.radius else ESCAPE
+            return
+
+        comps = [to_center.normalize() * (G * gv_mass / (r_center*r_center))]
+        for other in others:
+            if other is self or not other.active:
+                continue
+            d  = other.pos - self.pos
+            r2 = d.length_squared()
+            if r2 == 0:
+                continue
+            comps.append(d.normalize() * (G * other.mass / r2))
+
+        self.last_acc_components = comps
+
+        total_acc = Vector2()
+        for a in comps:
+            total_acc += a
+
+        self.vel += total_acc * dt
+        self.vel *= max(0.0, 1 - self.friction/100.0*dt)
+        self.pos += self.vel * dt
+
+def path_buffer(out, steps):
+    """
+    ``out`` (a C-contiguous (M, 2) float array with M >= ``steps``), or a
+    new one, and a flat memoryview the trajectory loops write x, y into:
+    storing a float through it allocates nothing, unlike a list of points.
+    """
+    if out is None:
+        out = np.empty((steps, 2))
+    elif len(out) < steps:
+        raise ValueError(f"path buffer holds {len(out)} points, {steps} needed")
+    return out, memoryview(out).cast("B").cast("d")
+
+def simulate_trajectory(start, vel, gv_radius, gv_mass, fr, center, max_dist,
+                        steps=200, dt=1/60.0, out=None):
+    """
+    Predicted path of a test particle around a single well: the (n, 2)
+    positions after each step until it crashes or leaves ``max_dist``.
+    They are written into ``out`` (see ``path_buffer``) when given, so a
+    preview redrawn every frame can reuse one array; the result is a view
+    of it.  The loop runs on plain floats – it is the preview's hot path.
+    """
+    x, y   = start
+    vx, vy = vel
+    cx, cy = center
+    damp = max(0.0, 1 - fr/100.0*dt)
+    out, flat = path_buffer(out, steps)
+    n = 0
+    gm = G * gv_mass
+    for _ in range(steps):
+        dx, dy   = cx - x, cy - y
+        r_center = math.sqrt(dx*dx + dy*dy)
+        if r_center <= gv_radius or r_center > max_dist:
+            break
+        k = gm / (r_center*r_center*r_center) * dt
+        vx = (vx + dx * k) * damp
+        vy = (vy + dy * k) * damp
+        x += vx * dt
+        y += vy * dt
+        flat[n] = x
+        flat[n+1] = y
+        n += 2
+    return out[:n // 2]
+
+def step_arrays(pos, vel, radius, mass, damp, dt, wells, origin, max_dist,
+                pairs=True, diag=None, acc_ext=None):
+    """
+    The batched force pass on plain arrays.  ``pos`` and ``vel`` (N, 2) are
+    advanced in place for every body that survives the step; ``wells`` is
+    ``Scene.arrays()``.  Without ``pairs`` the bodies are test particles that
+    only feel the wells (no N x N term).  ``pairs`` may also be a mass: only
+    bodies at least that heavy then act as sources, every body still feels
+    them, and the term costs N x heavy instead of N x N.  Light bodies
+    no longer pull on anything, so this trades accuracy for time; see
+    benchmarks/bench_truncation.py for the error against the exact pass.
+    Or a ``mesh.MeshSolver``, which takes over the bullet-bullet term.
+    ``acc_ext`` (N, 2) is added to the pull as it is (e.g. the far field
+    of bodies stepped elsewhere; see ``lod``).
+
+    Given a ``diag`` dict, the surviving bodies' ``kinetic`` and
+    ``potential`` energy and ``angular`` momentum about ``origin`` before
+    the step are stored in it, the potential reusing the force terms.
+
+    Returns ``(crashed, dead, dist, acc_w, pair, src)``: ``acc_w`` is the
+    (N, W, 2) pull of each well, ``pair`` is ``(dx, dy, k)`` with the pull
+    of source j on body i being ``(dx[i, j], dy[i, j]) * k[i, j]`` and
+    ``src`` marks the pairs that count.  The sources are all bodies, or the
+    heavy ones in order; ``pair`` and ``src`` are None without ``pairs``.
+    """
+    wpos, wrad, wmass = wells
+
+    # wells: (n, W)
+    d_w  = wpos[None, :, :] - pos[:, None, :]
+    r2_w = np.einsum("nwk,nwk->nw", d_w, d_w)
+    r_w  = np.sqrt(r2_w)
+    off  = pos - origin
+    crashed = (r_w <= wrad[None, :] + radius[:, None]).any(axis=1)
+    dead = crashed | (np.einsum("nk,nk->n", off, off) > max_dist * max_dist)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k_w = np.where(r2_w > 0, G * wmass[None, :] / (r2_w * r_w), 0.0)
+    acc_w = d_w * k_w[:, :, None]
+    acc   = acc_w.sum(axis=1)
+
+    # bullets: (n, sources), crashed/escaped bullets no longer act as
+    # sources.  Kept as separate x/y planes and updated in place – this
+    # term is memory bound, and the (n, n, 2) temporaries cost 4x the time.
+    pair = src = phi_mesh = None
+    if hasattr(pairs, "accelerations"):
+        acc_m, phi_mesh = pairs.accelerations(pos, mass, ~dead, origin, max_dist,
+                                              potential=diag is not None)
+        acc += acc_m
+    elif pairs:
+        x, y = pos[:, 0], pos[:, 1]
+        if pairs is True:
+            sx, sy, s_mass, s_dead = x, y, mass, dead
+        else:
+            heavy = np.flatnonzero(mass >= pairs)
+            sx, sy, s_mass, s_dead = x[heavy], y[heavy], mass[heavy], dead[heavy]
+        dx = np.subtract.outer(x, sx)
+        dx *= -1
+        dy = np.subtract.outer(y, sy)
+        dy *= -1
+        r2 = dx*dx
+        r2 += dy*dy
+        src = r2 > 0
+        src &= ~s_dead[None, :]
+        k_b = np.sqrt(r2)
+        k_b *= r2
+        np.divide(G * s_mass[None, :], k_b, out=k_b, where=src)
+        k_b[~src] = 0.0
+        acc[:, 0] += np.einsum("ij,ij->i", dx, k_b)
+        acc[:, 1] += np.einsum("ij,ij->i", dy, k_b)
+        pair = (dx, dy, k_b)
+    if acc_ext is not None:
+        acc += acc_ext
+
+    alive = ~dead
+    if diag is not None:
+        m, v, o = mass[alive], vel[alive], off[alive]
+        # k * r^2 = G*M/r for both the well and the pair terms
+        phi = np.einsum("nw,nw->n", k_w[alive], r2_w[alive])
+        if pair is not None:
+            # each exact pair shows up twice; a light-heavy pair only once
+            half = 0.5 if pairs is True else np.where(m >= pairs, 0.5, 1.0)
+            phi += half * np.einsum("ij,ij->i", k_b[alive], r2[alive])
+        elif phi_mesh is not None:
+            phi -= 0.5 * phi_mesh[alive]
+        diag["kinetic"]   = 0.5 * float(m @ np.einsum("nk,nk->n", v, v))
+        diag["potential"] = -float(m @ phi)
+        diag["angular"]   = float(m @ (o[:, 0] * v[:, 1] - o[:, 1] * v[:, 0]))
+        diag["count"]     = len(m)
+    vel[alive] += acc[alive] * dt
+    vel[alive] *= damp[alive, None]
+    pos[alive] += vel[alive] * dt
+
+    dist = r_w.min(axis=1) if len(wrad) else np.sqrt(np.einsum("nk,nk->n", off, off))
+    return crashed, dead, dist, acc_w, pair, src
+
+def step_bullets(bullets, dt, scene, max_dist, components=False, orbits=None,
+                 pairs=True, diag=None, lod=None, tick=0, stats=None):
+    """
+    Advance all active bullets by one step in a single batched pass.
+
+    Wells and bullets are both just rows in the source arrays, so adding a
+    well costs one more column in the same vector op rather than another
+    Python loop per bullet.  Unlike ``Projectile.update`` every bullet sees
+    the positions from the start of the step.  With ``components`` set the
+    per‑source accelerations are kept on each bullet for the gravity
+    indicators, and an ``orbits.OrbitTracker`` is fed the new state about the
+    scene's first well.  Without ``pairs`` bullets only feel the wells, and
+    a mass limits the bullet sources to the bullets that heavy (see
+    ``step_arrays``, which also gets ``diag``).
+
+    With a ``lod.LOD`` the bullets it classifies as far step on its coarse
+    path instead (``tick`` staggers them): only the due ones move, by
+    ``lod.every`` steps at once, feeling the wells and the coarse mesh field
+    of all bullets; the rest feel the far ones through that field too.
+    ``diag`` and ``components`` then cover the full-path bullets only.
+    A ``stats.Stats`` gets its aggregates sampled from the state before
+    the step.
+    """
+    live = [b for b in bullets if b.active]
+    if not live:
+        if orbits is not None:
+            orbits.clear()
+        return
+    if lod is None and diag is None and (not pairs or len(live) == 1):
+        return _step_wells(live, dt, scene, max_dist, components, orbits, stats)
+    wells = scene.arrays()
+
+    # one gather for every per-bullet input; columns are sliced off it
+    state  = np.array([(b.pos.x, b.pos.y, b.vel.x, b.vel.y, b.radius, b.mass, b.friction)
+                       for b in live], dtype=float)
+    pos, mass = state[:, 0:2], state[:, 5]
+    if stats is not None:
+        stats.sample(pos, state[:, 2:4], scene.origin, max_dist)
+
+    groups = [(None, dt, pairs, None, diag, components)]
+    if lod is not None:
+        dist = np.array([b.distance for b in live], dtype=float)
+        far  = lod.classify(pos, scene.origin, dist)
+        lod.coarse = int(far.sum())
+        lod.due = 0
+        if lod.coarse:
+            full = np.flatnonzero(~far)
+            ids  = np.array([b.id or 0 for b in live], dtype=np.int64)
+            due  = np.flatnonzero(far & lod.stepping(ids, tick))
+            lod.due = len(due)
+            near_ext = far_ext = None
+            if pairs:
+                # the field of every bullet for the coarse path, and of
+                # the coarse bullets alone for the full one
+                src = (np.ones(len(live), bool) if pairs is True or hasattr(pairs, "accelerations")
+                       else mass >= pairs)
+                far_ext, _ = lod.field.accelerations(pos, mass, src, scene.origin, max_dist)
+                if full.size:
+                    near_ext, _ = lod.field.accelerations(pos, mass, src & far,
+                                                          scene.origin, max_dist)
+                    near_ext = near_ext[full]
+                far_ext = far_ext[due]
+            groups = [(full, dt, pairs, near_ext, diag, components),
+                      (due, dt * lod.every, False, far_ext, None, False)]
+
+    stepped = []
+    for rows, h, g_pairs, ext, g_diag, g_comps in groups:
+        if rows is not None:
+            if not rows.size:
+                continue
+            s = state[rows]
+        else:
+            s = state
+        p, v = s[:, 0:2], s[:, 2:4]
+        damp = np.maximum(0.0, 1 - s[:, 6] / 100.0 * h)
+        crashed, dead, dist, acc_w, pair, src = step_arrays(
+            p, v, s[:, 4], s[:, 5], damp, h, wells, scene.origin, max_dist,
+            g_pairs, g_diag, ext)
+        group = live if rows is None else [live[i] for i in rows.tolist()]
+
+        # scatter from Python lists: indexing numpy scalars per bullet is slower
+        for i, (b, (x, y, vx, vy), d, is_dead) in enumerate(
+                zip(group, s[:, :4].tolist(), dist.tolist(), dead.tolist())):
+            b.distance = d
+            if is_dead:
+                b.active  = False
+                b.outcome = CRASH if crashed[i] else ESCAPE
+                continue
+            b.pos.update(x, y)
+            b.vel.update(vx, vy)
+            if g_comps:
+                comps = [Vector2(a) for a in acc_w[i].tolist()]
+                if pair is not None:
+                    dx, dy, k_b = pair
+                    m = src[i]
+                    comps += [Vector2(a) for a in
+                              np.c_[dx[i, m] * k_b[i, m], dy[i, m] * k_b[i, m]].tolist()]
+                b.last_acc_components = comps
+            elif components:
+                b.last_acc_components = []
+        alive = ~dead
+        stepped.append(([b for b, d in zip(group, dead) if not d], p[alive], v[alive]))
+
+    # flight time runs for every bullet, stepped this tick or not
+    for b in live:
+        b.arc_time += dt
+
+    wpos, wrad, wmass = wells
+    if orbits is not None and len(wrad):
+        for group, p, v in stepped:
+            orbits.update(group, p, v, wpos[0], G * wmass[0], wrad[0], max_dist)
+        if lod is not None:
+            orbits.recount([b for b in live if b.active])
+
+def _step_wells(live, dt, scene, max_dist, components, orbits, stats):
+    """
+    ``step_bullets`` when no bullet pulls on another (the classic and
+    practice modes).  Without the N x N term, gathering the bullets into
+    arrays and scattering them back is most of the batched step, so this
+    steps them one by one instead -- with Vector2 arithmetic for a single
+    well, like ``Projectile.update``, or on plain floats for several.  Same
+    step, same results to rounding.
+    """
+    if stats is not None:
+        state = np.array([(b.pos.x, b.pos.y, b.vel.x, b.vel.y) for b in live], dtype=float)
+        stats.sample(state[:, 0:2], state[:, 2:4], scene.origin, max_dist)
+    origin = Vector2(scene.origin)
+    reach2 = max_dist * max_dist
+    if len(scene.wells) == 1:
+        w = scene.wells[0]
+        c, wr, gm = origin + w.offset_at(scene.time), w.radius, G * w.mass
+        for b in live:
+            b.arc_time += dt
+            pos, vel = b.pos, b.vel
+            d = c - pos
+            r = d.length()
+            b.distance = r
+            if r <= wr + b.radius or pos.distance_squared_to(origin) > reach2:
+                b.active  = False
+                b.outcome = CRASH if r <= wr + b.radius else ESCAPE
+                continue
+            acc = d * (gm / (r * r * r))
+            vel += acc * dt
+            vel *= max(0.0, 1 - b.friction / 100.0 * dt)
+            pos += vel * dt
+            if components:
+                b.last_acc_components = [acc]
+        if orbits is not None:
+            orbits.advance(live, c, gm, wr, max_dist)
+        return
+
+    centers = scene.positions()
+    wells   = [(x, y, w.radius, G * w.mass) for (x, y), w in zip(centers, scene.wells)]
+    ox, oy = origin
+    for b in live:
+        b.arc_time += dt
+        pos, vel = b.pos, b.vel
+        x, y, vx, vy = pos.x, pos.y, vel.x, vel.y
+        ax = ay = 0.0
+        crashed, dist, comps = False, math.inf, []
+        for wx, wy, wr, gm in wells:
+            dx, dy = wx - x, wy - y
+            r2 = dx*dx + dy*dy
+            r  = math.sqrt(r2)
+            if r <= wr + b.radius:
+                crashed = True
+            if r < dist:
+                dist = r
+            k = gm / (r2 * r) if r2 > 0 else 0.0
+            ax += dx * k
+            ay += dy * k
+            if components:
+                comps.append(Vector2(dx * k, dy * k))
+        off2 = (x - ox)**2 + (y - oy)**2
+        b.distance = dist if wells else math.sqrt(off2)
+        if crashed or off2 > reach2:
+            b.active  = False
+            b.outcome = CRASH if crashed else ESCAPE
+            continue
+        damp = max(0.0, 1 - b.friction / 100.0 * dt)
+        vx = (vx + ax * dt) * damp
+        vy = (vy + ay * dt) * damp
+        vel.update(vx, vy)
+        pos.update(x + vx * dt, y + vy * dt)
+        if components:
+            b.last_acc_components = comps
+
+    if orbits is not None and wells:
+        _, _, wr, gm = wells[0]
+        orbits.advance(live, centers[0], gm, wr, max_dist)
+
+def simulate_scene_trajectory(start, vel, scene, pad, fr, max_dist,
+                              steps=200, dt=1/60.0, out=None):
+    """
+    ``simulate_trajectory`` against every well of a scene, following moving
+    wells forward in time.  ``pad`` (the bullet radius) is added to each
+    well's radius for the crash test.
+    """
+    x, y   = start
+    vx, vy = vel
+    ox, oy = scene.origin
+    reach2 = max_dist * max_dist
+    damp = max(0.0, 1 - fr/100.0*dt)
+    wells  = [(w.radius + pad, G * w.mass) for w in scene.wells]
+    fixed  = scene.positions() if scene.is_static else None
+    t = scene.time
+    out, flat = path_buffer(out, steps)
+    n = 0
+    for _ in range(steps):
+        if (x - ox)**2 + (y - oy)**2 > reach2:
+            break
+        centers = fixed or scene.positions(t)
+        ax = ay = 0.0
+        for (cx, cy), (crash_r, gm) in zip(centers, wells):
+            dx, dy = cx - x, cy - y
+            r = math.sqrt(dx*dx + dy*dy)
+            if r <= crash_r:
+                return out[:n // 2]
+            k = gm / (r*r*r)
+            ax += dx * k
+            ay += dy * k
+        vx = (vx + ax * dt) * damp
+        vy = (vy + ay * dt) * damp
+        x += vx * dt
+        y += vy * dt
+        flat[n] = x
+        flat[n+1] = y
+        n += 2
+        t += dt
+    return out[:n // 2]
@@ -0,0 +1,315 @@
+# gravitywell/recorder.py
+#
+# Streaming run recorder for offline analysis.  Every ``every``-th tick the
+# state of each body (id, pos, vel, mass, arc_time, active) is appended to
+# an in-memory chunk; full chunks are handed to a background thread that
+# writes them as numbered NPZ files in the run directory, so the game loop
+# only pays for copying the arrays.  ``load`` reads a whole run back as
+# flat columns.  A World with a conservation monitor (gravitywell.
+# diagnostics) also gets its energy / angular momentum series recorded,
+# at the monitor's own rate.
+#
+# With ``deltas`` a World is recorded as ``World.delta`` sees it: a sample
+# holds only the bullets spawned or republished since the previous one (at
+# their published state, with the time ``t`` it is from) and the ones
+# removed; a sample flagged ``full`` lists every bullet and replaces
+# everything before it.
+#
+#   python -m gravitywell.recorder runs/last       summary of a recorded run
+
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+import numpy as np
+from .diagnostics import SERIES
+
+CHUNK_TICKS = 600      # recorded ticks per NPZ file
+QUEUE_CHUNKS = 8       # chunks waiting for the writer before record() blocks
+META_FILE   = "meta.json"
+
+# column -> (per-row shape, dtype on disk)
+COLUMNS = {
+    "id":       ((),   np.int64),
+    "pos":      ((2,), np.float64),
+    "vel":      ((2,), np.float64),
+    "mass":     ((),   np.float64),
+    "arc_time": ((),   np.float64),
+    "active":   ((),   np.bool_),
+}
+
+# extra column of delta recordings: the time each row's state is from
+DELTA_COLUMNS = {"t": ((), np.float64)}
+
+# diagnostics.SERIES as stored in the chunks (own tick / time per row)
+DIAG_COLUMNS = ("diag_tick", "diag_time", "diag_count", "kinetic", "potential",
+                "angular", "drift_energy", "drift_angular")
+
+def chunk_name(i):
+    return f"chunk_{i:05d}.npz"
+
+class Recorder:
+    """
+    Records into the directory ``path`` (created if needed; chunks already
+    there are replaced).  ``every`` is the sample rate in ticks,
+    ``compress`` trades writer time for disk space, ``deltas`` records
+    worlds as deltas (``record`` and ``record_bodies`` then write full
+    samples).  Use as a context manager or call ``close`` to flush the
+    last chunk.
+    """
+    def __init__(self, path, every=1, chunk_ticks=CHUNK_TICKS, compress=False,
+                 meta=None, deltas=False):
+        self.path        = path
+        self.every       = max(1, int(every))
+        self.chunk_ticks = chunk_ticks
+        self.compress    = compress
+        self.deltas      = deltas
+        self.columns     = {**COLUMNS, **DELTA_COLUMNS} if deltas else COLUMNS
+        self.since       = 0        # World.version of the last delta
+        self.ticks       = 0        # ticks offered to record()
+        self.samples     = 0        # ticks actually recorded
+        self.rows        = 0
+        self.chunks      = 0
+        self.error       = None
+        self._pending    = []       # (tick, time, {column: array}, diag rows, full) per sample
+        self._removed    = []       # removed since the last sample
+        self._diag       = []       # diagnostics rows since the last sample
+        self._diag_row   = None
+
+        os.makedirs(path, exist_ok=True)
+        for name in os.listdir(path):
+            if name.startswith("chunk_") and name.endswith(".npz"):
+                os.remove(os.path.join(path, name))
+        with open(os.path.join(path, META_FILE), "w") as f:
+            json.dump({"every": self.every, "columns": list(self.columns),
+                       "deltas": deltas,
+                       "diagnostics": list(DIAG_COLUMNS),
+                       **(meta or {})}, f, indent=2)
+
+        self._queue  = queue.Queue(QUEUE_CHUNKS)
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _due(self):
+        """Count one offered tick; True if it is one to sample."""
+        due = self.ticks % self.every == 0
+        self.ticks += 1
+        return due
+
+    def record(self, tick, t, ids, pos, vel, mass, arc_time, active=True):
+        """
+        Offer one tick's state as parallel arrays (``active`` may be a
+        scalar).  Kept only on every ``every``-th call; the arrays are
+        copied, so the caller may keep mutating its own.  Returns whether
+        the tick was sampled.
+        """
+        if not self._due():
+            return False
+        return self._append(tick, t, ids, pos, vel, mass, arc_time, active)
+
+    def _append(self, tick, t, ids, pos, vel, mass, arc_time, active=True,
+                row_t=None, full=True):
+        if self.error:
+            raise RuntimeError("recorder writer failed") from self.error
+        n = len(ids)
+        cols = {
+            "id":       np.array(ids, dtype=np.int64),
+            "pos":      np.array(pos, dtype=np.float64).reshape(n, 2),
+            "vel":      np.array(vel, dtype=np.float64).reshape(n, 2),
+            "mass":     np.array(mass, dtype=np.float64),
+            "arc_time": np.array(arc_time, dtype=np.float64),
+            "active":   np.broadcast_to(np.asarray(active, dtype=np.bool_), (n,)).copy(),
+        }
+        if self.deltas:
+            cols["t"] = np.broadcast_to(np.asarray(t if row_t is None else row_t,
+                                                   dtype=np.float64), (n,)).copy()
+        self._pending.append((tick, t, cols, self._diag, full))
+        self._diag = []
+        self.samples += 1
+        self.rows    += n
+        if len(self._pending) >= self.chunk_ticks:
+            self.flush()
+        return True
+
+    def record_bodies(self, tick, t, bodies):
+        """Record a ``bodies.Bodies`` store (every row is active)."""
+        if not self._due():
+            return False
+        return self._append(tick, t, bodies.ids, bodies.pos, bodies.vel,
+                           bodies.mass, bodies.arc_time)
+
+    def record_world(self, tick, world, removed=()):
+        """
+        Record a ``world.World``: its bullets plus ``removed`` (what the
+        last ``World.step`` returned), which show up once as inactive in
+        the next sample.  Bullets are recorded under their world ids.
+        """
+        diags = world.diagnostics
+        if diags is not None and diags.last is not self._diag_row:
+            self._diag_row = diags.last
+            self._diag.append(tuple(diags.last[k] for k in SERIES))
+        if not self._due():
+            self._removed.extend(removed)
+            return False
+        if self.deltas:
+            return self._append_delta(tick, world, removed)
+        bullets = list(world.bullets) + self._removed + list(removed)
+        self._removed = []
+        return self._append(
+            tick, world.time, [b.id for b in bullets],
+            [(b.pos.x, b.pos.y) for b in bullets],
+            [(b.vel.x, b.vel.y) for b in bullets],
+            [b.mass for b in bullets],
+            [b.arc_time for b in bullets],
+            [b.active for b in bullets])
+
+    def _append_delta(self, tick, world, removed):
+        d = world.delta(self.since)
+        self.since = d.version
+        # the final state of bullets that left in a step; evicted ones are
+        # only known by id
+        final = {b.id: b for b in self._removed + list(removed)}
+        self._removed = []
+        live = d.spawned + d.changed
+        rows = [b.published for b in live]
+        gone = [final.get(i) for i in d.removed]
+        nan  = float("nan")
+        return self._append(
+            tick, d.time,
+            [b.id for b in live] + list(d.removed),
+            [(r[0], r[1]) for r in rows] + [(b.pos.x, b.pos.y) if b else (nan, nan) for b in gone],
+            [(r[2], r[3]) for r in rows] + [(b.vel.x, b.vel.y) if b else (nan, nan) for b in gone],
+            [b.mass for b in live] + [b.mass if b else nan for b in gone],
+            [b.arc_time - (d.time - r[4]) for b, r in zip(live, rows)]
+            + [b.arc_time if b else nan for b in gone],
+            [True] * len(live) + [False] * len(gone),
+            [r[4] for r in rows] + [d.time] * len(gone),
+            d.full)
+
+    def flush(self):
+        """Hand the buffered samples to the writer thread."""
+        if self._pending:
+            self._pending[-1][3].extend(self._diag)
+            self._diag = []
+            self._queue.put((self.chunks, self._pending))
+            self.chunks  += 1
+            self._pending = []
+
+    def close(self):
+        """Flush, wait for the writer and raise if it failed."""
+        if self._thread is None:
+            return
+        self.flush()
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        if self.error:
+            raise RuntimeError("recorder writer failed") from self.error
+
+    def _write_loop(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            if self.error:
+                continue
+            try:
+                self._write_chunk(*job)
+            except Exception as e:        # surfaced by record() / close()
+                self.error = e
+
+    def _write_chunk(self, index, samples):
+        counts = np.array([len(s[2]["id"]) for s in samples], dtype=np.int64)
+        arrays = {
+            "tick":  np.array([s[0] for s in samples], dtype=np.int64),
+            "time":  np.array([s[1] for s in samples], dtype=np.float64),
+            "count": counts,
+        }
+        if self.deltas:
+            arrays["full"] = np.array([s[4] for s in samples], dtype=np.bool_)
+        for k, (shape, dtype) in self.columns.items():
+            parts = [s[2][k] for s in samples]
+            arrays[k] = (np.concatenate(parts) if parts
+                         else np.zeros((0,) + shape, dtype))
+        diag = np.array([r for s in samples for r in s[3]],
+                        dtype=np.float64).reshape(-1, len(DIAG_COLUMNS))
+        for i, k in enumerate(DIAG_COLUMNS):
+            arrays[k] = diag[:, i]
+        save = np.savez_compressed if self.compress else np.savez
+        # write under a temporary name so a partly written chunk is never loaded
+        final = os.path.join(self.path, chunk_name(index))
+        tmp   = final + ".tmp"
+        with open(tmp, "wb") as f:
+            save(f, **arrays)
+        os.replace(tmp, final)
+
+def chunk_files(path):
+    return sorted(os.path.join(path, n) for n in os.listdir(path)
+                  if n.startswith("chunk_") and n.endswith(".npz"))
+
+def load(path, columns=None):
+    """
+    A recorded run as flat columns: ``tick``, ``time`` and ``count`` per
+    sample, and one row per body per sample for the body ``columns`` (all
+    by default).  ``offsets[k]:offsets[k+1]`` are the rows of sample ``k``.
+    DIAG_COLUMNS are the diagnostics series (empty if it was not on), and
+    ``full`` and the DELTA_COLUMNS are empty unless it is a delta recording.
+    """
+    columns = list(COLUMNS) + list(DELTA_COLUMNS) if columns is None else list(columns)
+    parts = {k: [] for k in ["tick", "time", "count", "full"] + columns + list(DIAG_COLUMNS)}
+    for name in chunk_files(path):
+        with np.load(name) as z:
+            for k in parts:
+                if k in z.files:
+                    parts[k].append(z[k])
+    run = {}
+    for k, chunks in parts.items():
+        if chunks:
+            run[k] = np.concatenate(chunks)
+        else:
+            shape, dtype = {**COLUMNS, **DELTA_COLUMNS}.get(k, ((), np.float64))
+            run[k] = np.zeros((0,) + shape, dtype)
+    run["offsets"] = np.concatenate(([0], np.cumsum(run["count"])))
+    return run
+
+def track(run, body_id):
+    """Rows of one body: ``(time, pos)`` over the samples it appears in
+    (in a delta recording, the times its rows' states are from)."""
+    rows = np.flatnonzero(run["id"] == body_id)
+    if len(run.get("t", ())) == len(run["id"]):
+        return run["t"][rows], run["pos"][rows]
+    sample = np.searchsorted(run["offsets"], rows, side="right") - 1
+    return run["time"][sample], run["pos"][rows]
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Summarise a recorded run")
+    ap.add_argument("path")
+    args = ap.parse_args(argv)
+
+    t0  = time.perf_counter()
+    run = load(args.path)
+    elapsed = time.perf_counter() - t0
+    with open(os.path.join(args.path, META_FILE)) as f:
+        meta = json.load(f)
+    n = len(run["tick"])
+    print(f"{args.path}: {n} samples (every {meta['every']} ticks), "
+          f"{len(run['id'])} rows, {len(np.unique(run['id']))} bodies")
+    if n:
+        print(f"time {run['time'][0]:.2f} .. {run['time'][-1]:.2f} s, "
+              f"up to {run['count'].max()} bodies at once")
+    if len(run["diag_tick"]):
+        print(f"diagnostics: {len(run['diag_tick'])} samples, energy drift "
+              f"{run['drift_energy'][-1]:+.3e}, angular momentum drift "
+              f"{run['drift_angular'][-1]:+.3e}")
+    print(f"loaded in {elapsed:.2f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# gravitywell/render.py
+#
+# Everything that draws.  Fonts are created lazily on first use, so importing
+# this module (or the physics) does not need an initialised display.
+
+import numpy as np
+import pygame
+
+gravity_indicators = True
+show_head_tail    = True
+
+# how many world‐units back the tail goes, and ahead the head goes
+TAIL_SCALE = 3
+HEAD_SCALE = 5
+# arrowhead width in world‐units
+ARROWHEAD_SCALE = 5
+
+# these will be set by the app
+camera_center = pygame.math.Vector2(0, 0)
+camera_zoom   = 1.0
+
+_fonts = {}
+
+def font(size):
+    """pygame SysFont of the given size, created on first use and cached."""
+    f = _fonts.get(size)
+    if f is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        f = _fonts[size] = pygame.font.SysFont(None, size)
+    return f
+
+def mass_to_color(m, mn, mx):
+    t = max(0.0, min(1.0, (m - mn)/(mx - mn)))
+    g = int(255 * (1 - t))
+    return (255, g, g)
+
+def to_screen(wv):
+    """Map a world position to the screen using the current camera."""
+    return (wv - camera_center) * camera_zoom + camera_center
+
+def screen_to_world(sv):
+    return (sv - camera_center) / camera_zoom + camera_center
+
+def path_to_screen(path, out=None):
+    """
+    Screen points of an (n, 2) world-space path for ``pygame.draw.lines``:
+    the camera transform as one array operation (into ``out`` when given),
+    rounded to whole pixels, with consecutive points on the same pixel
+    dropped – a long, slow path collapses to about one point per pixel.
+    """
+    n = len(path)
+    pts = np.empty((n, 2)) if out is None else out[:n]
+    c = (camera_center.x, camera_center.y)
+    np.subtract(path, c, out=pts)
+    pts *= camera_zoom
+    pts += c
+    np.rint(pts, out=pts)
+    keep = np.empty(n, dtype=bool)
+    keep[:1] = True
+    np.any(pts[1:] != pts[:-1], axis=1, out=keep[1:])
+    return pts[keep]
+
+def draw_projectile(surf, b, color, vectors=True, head_tail=True):
+    # ``vectors`` / ``head_tail`` False skip those even when switched on
+    # (the app's frame-budget governor sheds them)
+    # draw gravity vectors (in screen‐space)
+    if gravity_indicators and vectors:
+        for acc in b.last_acc_components:
+            if acc.length() == 0: continue
+            dirn = acc.normalize()
+            length = min(acc.length() * 50, 100)
+            start_w = b.pos
+            end_w   = b.pos + dirn * length
+            start_s = to_screen(start_w)
+            end_s   = to_screen(end_w)
+            pygame.draw.line(surf, (0,255,0), start_s, end_s, 2)
+            # arrowhead in world coords, then to screen
+            perp_w = dirn.rotate(90) * 5
+            pts_w = [
+                end_w,
+                end_w - dirn*10 + perp_w,
+                end_w - dirn*10 - perp_w
+            ]
+            pts_s = [to_screen(p) for p in pts_w]
+            pygame.draw.polygon(surf, (0,255,0), pts_s)
+
+    # draw head & tail
+    if show_head_tail and head_tail and b.vel.length() > 0:
+        dirn = b.vel.normalize()
+        tail_w = b.pos - dirn * (b.radius * TAIL_SCALE)
+        head_w = b.pos + dirn * (b.radius * HEAD_SCALE)
+        tail_s = to_screen(tail_w)
+        head_s = to_screen(head_w)
+        pygame.draw.line(surf, (255,255,0), tail_s, head_s, 2)
+
+        perp_w = dirn.rotate(90) * ARROWHEAD_SCALE
+        pts_w = [
+            head_w,
+            head_w - dirn*ARROWHEAD_SCALE + perp_w,
+            head_w - dirn*ARROWHEAD_SCALE - perp_w
+        ]
+        pts_s = [to_screen(p) for p in pts_w]
+        pygame.draw.polygon(surf, (255,255,0), pts_s)
+
+    # draw circle
+    center_s = to_screen(b.pos)
+    radius_s = int(b.radius * camera_zoom)
+    if radius_s > 0:
+        pygame.draw.circle(surf, color,
+                           (int(center_s.x), int(center_s.y)),
+                           radius_s)
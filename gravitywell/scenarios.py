@@ -0,0 +1,103 @@
+# gravitywell/scenarios.py
+#
+# Bulk bullet distributions for stress tests and benchmarks: a ring of
+# circular orbits, a random disc, and clusters on a collision course.
+# Each generator returns ``(pos, vel)`` arrays of n bullets about a centre
+# with gravitational parameter ``mu`` (G * GV mass); ``populate`` inserts
+# them in one go into a World (``World.spawn_many``) or into the array
+# engine (``bodies.Bodies`` through ``net.Server.spawn``).  The benchmarks
+# build their fixtures from these, so every number they print is about the
+# same few loads.
+#
+#   python -m gravitywell.scenarios disc 5000 --out savegame.json
+
+import argparse
+import json
+import numpy as np
+from pygame.math import Vector2
+from .physics import G
+from .settings import Settings
+from .world import World
+
+WIDTH, HEIGHT = 1920, 1080
+
+def _orbits(rng, center, mu, ang, r, jitter=0.0, sign=1.0):
+    """Positions at polar ``ang`` / ``r`` and circular velocities (scaled by
+    up to +-``jitter``), counter-clockwise for ``sign`` 1."""
+    dirs = np.c_[np.cos(ang), np.sin(ang)]
+    pos  = np.asarray(center, dtype=float) + dirs * r[:, None]
+    v    = np.sqrt(mu / r)
+    if jitter:
+        v = v * rng.uniform(1 - jitter, 1 + jitter, len(r))
+    vel  = np.c_[-dirs[:, 1], dirs[:, 0]] * (sign * v)[:, None]
+    return pos, vel
+
+def ring(n, center, mu, radius=400.0, width=40.0, jitter=0.0, seed=0):
+    """n bullets evenly around a ring ``width`` px wide, on circular orbits."""
+    rng = np.random.default_rng(seed)
+    ang = np.linspace(0, 2*np.pi, n, endpoint=False) + rng.uniform(0, 2*np.pi)
+    r   = radius + rng.uniform(-width/2, width/2, n)
+    return _orbits(rng, center, mu, ang, r, jitter)
+
+def disc(n, center, mu, inner=100.0, outer=900.0, jitter=0.0, seed=0):
+    """n bullets at random angles, uniform in radius, on circular orbits."""
+    rng = np.random.default_rng(seed)
+    ang = rng.uniform(0, 2*np.pi, n)
+    r   = rng.uniform(inner, outer, n)
+    return _orbits(rng, center, mu, ang, r, jitter)
+
+def clusters(n, center, mu, count=2, radius=400.0, spread=50.0, seed=0):
+    """
+    ``count`` round clusters of bullets (``spread`` px across, one sigma)
+    spaced evenly on an orbit of ``radius``, alternately circling one way
+    and the other, so neighbouring clusters run into each other.
+    """
+    rng  = np.random.default_rng(seed)
+    k    = np.arange(n) % count
+    c    = np.asarray(center, dtype=float)
+    base = 2*np.pi * k / count
+    sign = np.where(k % 2, -1.0, 1.0)
+    home = c + radius * np.c_[np.cos(base), np.sin(base)]
+    pos  = home + rng.normal(0.0, spread, (n, 2))
+    off  = pos - c
+    r    = np.sqrt(np.einsum("nk,nk->n", off, off))
+    _, vel = _orbits(rng, center, mu, np.arctan2(off[:, 1], off[:, 0]), r, sign=sign)
+    return pos, vel
+
+SCENARIOS = {"ring": ring, "disc": disc, "clusters": clusters}
+
+def generate(name, n, center, mu, **params):
+    """``(pos, vel)`` of scenario ``name`` (a key of SCENARIOS)."""
+    return SCENARIOS[name](n, center, mu, **params)
+
+def populate(target, name, n, **params):
+    """
+    Add n bullets of scenario ``name`` around the GV object of ``target`` --
+    a World, or anything with ``settings``, ``center`` and an array
+    ``spawn`` (net.Server).  Returns what the bulk insert returned.
+    """
+    pos, vel = generate(name, n, target.center, G * target.settings.gv_mass, **params)
+    spawn = getattr(target, "spawn_many", None) or target.spawn
+    return spawn(pos, vel)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Write a scenario as a saved game")
+    ap.add_argument("scenario", choices=sorted(SCENARIOS))
+    ap.add_argument("count", type=int)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out",
+                    help="file to write (default: <scenario>.json; Load Game "
+                         "reads savegame.json)")
+    args = ap.parse_args(argv)
+    out = args.out or f"{args.scenario}.json"
+    settings = Settings()
+    world = World(settings, Vector2(WIDTH/2, HEIGHT/2), max(WIDTH, HEIGHT) * 1.5)
+    populate(world, args.scenario, args.count, seed=args.seed)
+    data = {"settings": settings.to_dict(), **world.to_dict(),
+            "scene": world.scene.to_dict()}
+    with open(out, "w") as f:
+        json.dump(data, f, indent=2)
+    print(f"{len(world.bullets)} bullets ({args.scenario}) written to {out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# gravitywell/scene.py
+
+import json
+import math
+import os
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+import numpy as np
+
+class Well:
+    """
+    A gravity well.  ``pos`` is an offset from the scene origin (the screen
+    centre), so a scene plays the same on any display.  With an ``orbit``
+    ({"radius", "period", "phase"}) the well circles ``pos`` instead of
+    sitting on it.  A ``linked`` well takes its radius/density from Settings.
+    """
+    def __init__(self, pos=(0, 0), radius=30, density=10, orbit=None,
+                 linked=False):
+        self.pos     = (float(pos[0]), float(pos[1]))
+        self.radius  = radius
+        self.density = density
+        self.orbit   = orbit
+        self.linked  = linked
+
+    @property
+    def mass(self):
+        return self.density * (self.radius ** 2)
+
+    def offset_at(self, t):
+        if not self.orbit:
+            return self.pos
+        ang = 2*math.pi * t / self.orbit["period"] + math.radians(self.orbit.get("phase", 0))
+        r   = self.orbit["radius"]
+        return (self.pos[0] + r*math.cos(ang), self.pos[1] + r*math.sin(ang))
+
+    def to_dict(self):
+        d = {"pos": list(self.pos), "radius": self.radius, "density": self.density}
+        if self.orbit:
+            d["orbit"] = dict(self.orbit)
+        if self.linked:
+            d["linked"] = True
+        return d
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d.get("pos", (0, 0)), d.get("radius", 30), d.get("density", 10),
+                   d.get("orbit"), d.get("linked", False))
+
+class Scene:
+    def __init__(self, wells=None, origin=(0, 0)):
+        self.wells  = list(wells or [])
+        self.origin = (float(origin[0]), float(origin[1]))
+        self.time   = 0.0
+
+    @classmethod
+    def from_settings(cls, settings, origin):
+        """The classic single GV object at the origin, driven by Settings."""
+        scene = cls([Well(linked=True)], origin)
+        scene.sync(settings)
+        return scene
+
+    @property
+    def is_classic(self):
+        """Just the Settings-driven GV object sitting at the origin."""
+        return (len(self.wells) == 1 and self.wells[0].linked
+                and not self.wells[0].orbit and self.wells[0].pos == (0.0, 0.0))
+
+    @property
+    def is_static(self):
+        return all(not w.orbit for w in self.wells)
+
+    def sync(self, settings):
+        for w in self.wells:
+            if w.linked:
+                w.radius  = settings.gv_radius
+                w.density = settings.gv_density
+
+    def advance(self, dt):
+        self.time += dt
+
+    def positions(self, t=None):
+        """World positions of all wells at time ``t`` as a list of (x, y)."""
+        t = self.time if t is None else t
+        ox, oy = self.origin
+        return [(ox + x, oy + y) for x, y in (w.offset_at(t) for w in self.wells)]
+
+    def arrays(self, t=None):
+        """(positions (W,2), radii (W,), masses (W,)) for the batched force pass."""
+        pos = np.array(self.positions(t), dtype=float).reshape(-1, 2)
+        rad = np.array([w.radius for w in self.wells], dtype=float)
+        mas = np.array([w.mass for w in self.wells], dtype=float)
+        return pos, rad, mas
+
+    def to_dict(self):
+        return {"wells": [w.to_dict() for w in self.wells], "time": self.time}
+
+    @classmethod
+    def from_dict(cls, data, origin):
+        scene = cls([Well.from_dict(d) for d in data.get("wells", [])], origin)
+        scene.time = data.get("time", 0.0)
+        return scene
+
+    def save(self, filename):
+        with open(filename, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, filename, origin):
+        """Load a scene from a .json or .toml file (``[[wells]]`` tables)."""
+        if os.path.splitext(filename)[1].lower() == ".toml":
+            if tomllib is None:
+                raise RuntimeError("TOML scenes need Python 3.11+ (tomllib)")
+            with open(filename, "rb") as f:
+                data = tomllib.load(f)
+        else:
+            with open(filename, "r") as f:
+                data = json.load(f)
+        return cls.from_dict(data, origin)
@@ -0,0 +1,159 @@
+# gravitywell/settings.py
+#
+# The user-tweakable parameters.  The masses derived from them are cached
+# and recomputed only when a parameter changes; every change bumps
+# ``version`` and is reported to subscribers (the colour and preview
+# caches), and ``watch`` / ``poll`` pick up edits to the settings file
+# while the game runs.
+
+import os
+import json
+import time
+
+GV_RADIUS_RANGE     = (10, 200)
+GV_DENSITY_RANGE    = (1, 100)
+BULLET_RADIUS_RANGE = (2, 20)
+BULLET_DENSITY_RANGE= (1, 50)
+DRAG_SCALE_RANGE    = (1, 100)
+FRICTION_RANGE      = (0, 100)
+
+SETTINGS_FILE = "settings.json"
+GAME_SAVE_FILE = "savegame.json"
+
+FIELDS = ("gv_radius", "gv_density", "bullet_radius", "bullet_density",
+          "drag_scale", "friction")
+POLL_INTERVAL = 1.0    # seconds between settings-file mtime checks
+
+def clamp(attr, value):
+    """Clamp ``value`` to the ``<ATTR>_RANGE`` declared for a setting."""
+    lo, hi = globals()[attr.upper() + "_RANGE"]
+    return max(lo, min(hi, value))
+
+class Settings:
+    """
+    The FIELDS are plain attributes; assigning one that changes its value
+    refreshes ``gv_mass`` / ``bullet_mass``, bumps ``version`` and calls
+    every subscriber as ``fn(settings, changed)`` with the set of changed
+    names.  ``update`` changes several at once with a single notification.
+    """
+    def __init__(self):
+        # internal state goes straight into __dict__ (no change tracking)
+        self.__dict__.update(version=0, _subscribers=[], _batch=set(), _watch=None)
+        self.gv_radius      = 30
+        self.gv_density     = 10
+        self.bullet_radius  = 5
+        self.bullet_density = 1
+        self.drag_scale     = 20
+        self.friction       = 0
+        self.__dict__["_batch"] = None
+        self._derive()
+
+    def __setattr__(self, name, value):
+        d = self.__dict__
+        if name in FIELDS and (name not in d or d[name] != value):
+            d[name] = value
+            self._changed({name})
+        elif name in ("gv_mass", "bullet_mass"):
+            raise AttributeError(f"{name} is derived from the other settings")
+        elif name not in FIELDS:
+            d[name] = value
+
+    def _derive(self):
+        d = self.__dict__
+        d["gv_mass"]     = d["gv_density"] * (d["gv_radius"] ** 2)
+        d["bullet_mass"] = d["bullet_density"] * (d["bullet_radius"] ** 2)
+
+    def _changed(self, names):
+        if self._batch is not None:
+            self._batch.update(names)
+            return
+        self._derive()
+        self.__dict__["version"] += 1
+        for fn in list(self._subscribers):
+            fn(self, names)
+
+    def subscribe(self, fn):
+        """Call ``fn(settings, changed)`` after every change; returns ``fn``."""
+        self._subscribers.append(fn)
+        return fn
+
+    def unsubscribe(self, fn):
+        if fn in self._subscribers:
+            self._subscribers.remove(fn)
+
+    def update(self, **values):
+        """Set several fields, notifying once.  Returns the changed names."""
+        d = self.__dict__
+        d["_batch"] = set()
+        try:
+            for k, v in values.items():
+                setattr(self, k, v)
+        finally:
+            changed, d["_batch"] = d["_batch"], None
+        if changed:
+            self._changed(changed)
+        return changed
+
+    def to_dict(self):
+        return {
+            "gv_radius":      self.gv_radius,
+            "gv_density":     self.gv_density,
+            "bullet_radius":  self.bullet_radius,
+            "bullet_density": self.bullet_density,
+            "drag_scale":     self.drag_scale,
+            "friction":       self.friction
+        }
+
+    def save(self, filename=SETTINGS_FILE):
+        with open(filename, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def load(self, filename=SETTINGS_FILE):
+        with open(filename, "r") as f:
+            data = json.load(f)
+        values = {}
+        for k, v in data.items():
+            if k in FIELDS:
+                rng = globals().get(k.upper() + "_RANGE")
+                if rng:
+                    lo, hi = rng
+                    values[k] = max(lo, min(hi, v))
+                else:
+                    values[k] = v
+        return self.update(**values)
+
+    def watch(self, filename=SETTINGS_FILE, interval=POLL_INTERVAL):
+        """
+        Reload ``filename`` from ``poll`` whenever its mtime changes; the
+        first poll loads it.  ``None`` stops watching.
+        """
+        self.__dict__["_watch"] = None if filename is None else [filename, interval, None, None]
+
+    def poll(self, now=None):
+        """
+        Check the watched file at most once per interval; reload it if it
+        changed.  A file that does not parse (say, half written) is
+        retried on the next check.  Returns the changed names.
+        """
+        w = self._watch
+        if w is None:
+            return set()
+        now = time.monotonic() if now is None else now
+        if w[2] is not None and now - w[2] < w[1]:
+            return set()
+        w[2] = now
+        mtime = file_mtime(w[0])
+        if mtime is None or mtime == w[3]:
+            return set()
+        try:
+            changed = self.load(w[0])
+        except (OSError, ValueError, TypeError):
+            return set()
+        w[3] = mtime
+        return changed
+
+def file_mtime(filename):
+    try:
+        return os.stat(filename).st_mtime_ns
+    except OSError:
+        return None
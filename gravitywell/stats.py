@@ -0,0 +1,96 @@
+# gravitywell/stats.py
+#
+# Running statistics for World, so neither scoring nor the HUD has to scan
+# every bullet each frame.  Every live bullet's flight time grows by the
+# same dt per step, so a bullet is fully described by its launch time
+# (world time minus arc_time): the oldest bullet is the earliest launch,
+# and bullets start scoring in launch order.  Two heaps keyed by launch
+# time, with removals dropped lazily, give both in O(log N) per change.
+#
+# The per-step aggregates (mean speed, distance histogram) are filled by
+# physics.step_bullets from the arrays it has gathered anyway.
+
+import heapq
+import numpy as np
+from .physics import SCORE_TIME
+
+HIST_BINS = 16         # distance histogram bins between the origin and max_dist
+EPS       = 1e-9       # launch-time slack; scoring is confirmed on arc_time
+
+class Stats:
+    """
+    ``scoring`` counts the live bullets past SCORE_TIME.  With ``aggregates``
+    set, each step also stores ``mean_speed`` and ``histogram`` (bullet
+    counts by distance from the scene origin, ``edges`` in px).
+    """
+    def __init__(self, bins=HIST_BINS):
+        self.bins       = bins
+        self.aggregates = False
+        self.clear()
+
+    def clear(self):
+        self.launch     = {}    # id -> launch time
+        self.oldest_q   = []    # (launch, id), every live bullet
+        self.pending    = []    # (launch, id), not scoring yet
+        self.scorers    = set()
+        self.scoring    = 0
+        self.mean_speed = 0.0
+        self.histogram  = np.zeros(self.bins, dtype=int)
+        self.edges      = np.zeros(self.bins + 1)
+
+    def add(self, b, now):
+        """A bullet entered the world at time ``now`` (with its arc_time)."""
+        t = now - b.arc_time
+        self.launch[b.id] = t
+        heapq.heappush(self.oldest_q, (t, b.id))
+        if b.arc_time > SCORE_TIME:
+            self.scorers.add(b.id)
+            self.scoring += 1
+        else:
+            heapq.heappush(self.pending, (t, b.id))
+
+    def remove(self, body_id):
+        if self.launch.pop(body_id, None) is None:
+            return
+        if body_id in self.scorers:
+            self.scorers.remove(body_id)
+            self.scoring -= 1
+
+    def _live(self, entry):
+        t, i = entry
+        return self.launch.get(i) == t
+
+    def advance(self, now, index):
+        """Count the bullets (``index``: id -> bullet) that started scoring by ``now``."""
+        q = self.pending
+        while q and q[0][0] + SCORE_TIME <= now + EPS:
+            if not self._live(q[0]):
+                heapq.heappop(q)
+                continue
+            if index[q[0][1]].arc_time <= SCORE_TIME:
+                break
+            self.scorers.add(heapq.heappop(q)[1])
+            self.scoring += 1
+        # keep the lazily deleted entries from piling up
+        if len(self.oldest_q) > 2 * len(self.launch) + 64:
+            self.oldest_q = [e for e in self.oldest_q if self._live(e)]
+            heapq.heapify(self.oldest_q)
+            self.pending = [e for e in self.pending if self._live(e)]
+            heapq.heapify(self.pending)
+
+    def oldest(self):
+        """Id of the bullet in flight longest, or None."""
+        q = self.oldest_q
+        while q and not self._live(q[0]):
+            heapq.heappop(q)
+        return q[0][1] if q else None
+
+    def sample(self, pos, vel, origin, max_dist):
+        """Aggregates over (N, 2) bullet positions / velocities."""
+        speed = np.sqrt(np.einsum("nk,nk->n", vel, vel))
+        self.mean_speed = float(speed.mean()) if len(speed) else 0.0
+        off = pos - origin
+        dist = np.sqrt(np.einsum("nk,nk->n", off, off))
+        k = np.minimum((dist * (self.bins / max_dist)).astype(np.intp), self.bins - 1)
+        self.histogram = np.bincount(k, minlength=self.bins)
+        self.edges = np.linspace(0.0, max_dist, self.bins + 1)
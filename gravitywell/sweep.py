@@ -0,0 +1,184 @@
+# gravitywell/sweep.py
+#
+# Headless parameter sweeps over the Settings ranges.  Every combination of
+# settings runs the same launch script in a fresh World, spread over a
+# process pool.  One CSV row per combination is appended (and flushed) as
+# soon as it finishes, so an interrupted sweep resumes where it stopped.
+#
+#   python -m gravitywell.sweep --grid gv_radius=5 drag_scale=4 --out sweep.csv
+#   python -m gravitywell.sweep --sample 200 --workers 8
+
+import argparse
+import csv
+import hashlib
+import json
+import math
+import os
+import random
+import itertools
+from multiprocessing import Pool
+from pygame.math import Vector2
+from . import settings as settings_mod
+from .settings import Settings
+from .world import World
+from .orbits import CRASH, ESCAPE
+
+PARAMS = ["gv_radius", "gv_density", "bullet_radius", "bullet_density",
+          "drag_scale", "friction"]
+
+WIDTH, HEIGHT = 1920, 1080
+DT            = 1/60.0
+
+# the fixed launch script: (time, offset from the centre, drag vector)
+# – six shots 2s apart from a ring of radius 300, dragged tangentially
+DEFAULT_SCRIPT = [
+    (2.0*i,
+     (300*math.cos(math.radians(60*i)), 300*math.sin(math.radians(60*i))),
+     (mag*math.sin(math.radians(60*i)), -mag*math.cos(math.radians(60*i))))
+    for i, mag in enumerate((2.0, 2.5, 3.0, 3.5, 4.0, 5.0))
+]
+
+COLUMNS = ["key"] + PARAMS + ["score", "mean_survival", "max_survival",
+                              "crash_rate", "escape_rate", "alive_rate"]
+
+def param_range(attr):
+    return getattr(settings_mod, attr.upper() + "_RANGE")
+
+def grid(counts):
+    """
+    Settings combinations on a grid: ``counts`` maps a parameter to how many
+    evenly spaced (integer) values to take across its range; the others keep
+    their defaults.
+    """
+    default = Settings().to_dict()
+    axes = []
+    for p in PARAMS:
+        n = counts.get(p, 0)
+        if n <= 1:
+            axes.append([default[p]])
+            continue
+        lo, hi = param_range(p)
+        axes.append(sorted({round(lo + (hi-lo)*i/(n-1)) for i in range(n)}))
+    for values in itertools.product(*axes):
+        yield dict(zip(PARAMS, values))
+
+def sample(n, seed=0, params=PARAMS):
+    """``n`` random combinations, uniform over each parameter's range."""
+    rng = random.Random(seed)
+    default = Settings().to_dict()
+    for _ in range(n):
+        combo = dict(default)
+        for p in params:
+            combo[p] = rng.randint(*param_range(p))
+        yield combo
+
+def script_id(script):
+    """A short digest of a launch script, so results from another one never match."""
+    return hashlib.sha1(json.dumps(sorted(script)).encode()).hexdigest()[:10]
+
+def combo_key(combo, script=DEFAULT_SCRIPT, duration=60.0):
+    """
+    The checkpoint key of one run: the settings plus the launch script and
+    duration it ran with, so a resumed sweep reruns anything that differs.
+    """
+    return ";".join([f"{p}={combo[p]}" for p in PARAMS]
+                    + [f"script={script_id(script)}", f"duration={float(duration)}"])
+
+def load_script(filename):
+    """A launch script file: a JSON list of {"t", "pos", "drag"} records."""
+    with open(filename, "r") as f:
+        return [(rec["t"], tuple(rec["pos"]), tuple(rec["drag"])) for rec in json.load(f)]
+
+def run_one(job):
+    """Run one settings combination headless and return its result row."""
+    combo, script, duration = job
+    settings = Settings()
+    for k, v in combo.items():
+        setattr(settings, k, v)
+    center = Vector2(WIDTH/2, HEIGHT/2)
+    world  = World(settings, center, max(WIDTH, HEIGHT) * 1.5)
+
+    shots = sorted(script)
+    ended = []
+    for k in range(round(duration / DT)):
+        t = k * DT
+        while shots and shots[0][0] <= t:
+            _, offset, drag = shots.pop(0)
+            world.spawn(center + Vector2(offset),
+                        world.launch_velocity(Vector2(drag), Vector2(0, 0)))
+        ended += world.step(DT)
+
+    flights = ended + world.bullets
+    n = max(1, len(flights))
+    row = {"key": combo_key(combo, script, duration), **combo}
+    row["score"]         = round(world.total_score, 3)
+    row["mean_survival"] = round(sum(b.arc_time for b in flights) / n, 3)
+    row["max_survival"]  = round(max((b.arc_time for b in flights), default=0.0), 3)
+    row["crash_rate"]    = round(sum(b.outcome == CRASH for b in ended) / n, 4)
+    row["escape_rate"]   = round(sum(b.outcome == ESCAPE for b in ended) / n, 4)
+    row["alive_rate"]    = round(len(world.bullets) / n, 4)
+    return row
+
+def read_results(filename):
+    if not os.path.exists(filename):
+        return []
+    with open(filename, "r", newline="") as f:
+        return list(csv.DictReader(f))
+
+def run_sweep(combos, out, script=DEFAULT_SCRIPT, duration=60.0, workers=None):
+    """
+    Run every combination not already in the ``out`` CSV (the checkpoint)
+    with this same script and duration, and append each result as it arrives.  Returns all rows, old and new.
+    """
+    rows = read_results(out)
+    done = {r["key"] for r in rows}
+    combos = list(combos)
+    jobs = [(c, script, duration) for c in combos
+            if combo_key(c, script, duration) not in done]
+    print(f"{len(combos) - len(jobs)} done, {len(jobs)} to run")
+
+    new_file = not rows
+    with open(out, "a", newline="") as f, Pool(workers) as pool:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        if new_file:
+            writer.writeheader()
+        for i, row in enumerate(pool.imap_unordered(run_one, jobs), 1):
+            writer.writerow(row)
+            f.flush()
+            rows.append(row)
+            print(f"[{i}/{len(jobs)}] {row['key']}  score={row['score']}")
+    return rows
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Headless Settings sweep")
+    ap.add_argument("--grid", nargs="*", default=[], metavar="PARAM=N",
+                    help="evenly spaced values per parameter")
+    ap.add_argument("--sample", type=int, default=0, metavar="N",
+                    help="random combinations instead of a grid")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--script", help="launch script JSON ({t, pos, drag} list)")
+    ap.add_argument("--duration", type=float, default=60.0, help="seconds per run")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--out", default="sweep.csv", help="results / checkpoint CSV")
+    args = ap.parse_args(argv)
+
+    if args.sample:
+        combos = list(sample(args.sample, args.seed))
+    else:
+        counts = {}
+        for spec in args.grid:
+            p, n = spec.split("=")
+            if p not in PARAMS:
+                ap.error(f"unknown parameter {p!r}, expected one of {', '.join(PARAMS)}")
+            counts[p] = int(n)
+        combos = list(grid(counts))
+    script = load_script(args.script) if args.script else DEFAULT_SCRIPT
+
+    rows = run_sweep(combos, args.out, script, args.duration, args.workers)
+    best = sorted(rows, key=lambda r: float(r["score"]), reverse=True)[:5]
+    print("\nbest by score:")
+    for r in best:
+        print(f"  {float(r['score']):8.2f}  {r['key']}")
+
+if __name__ == "__main__":
+    main()
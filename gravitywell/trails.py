@@ -0,0 +1,134 @@
+# gravitywell/trails.py
+#
+# Ghost trails: the recent path of every bullet, kept in one preallocated
+# (slots, length, 2) ring buffer.  All trails share the write column, so
+# recording a tick is a single array write of the live positions, and the
+# memory is fixed however many bullets come and go.  Drawing samples a
+# bounded number of points per trail (fewer when zoomed out), so the frame
+# cost does not grow with the trail length, and plots the pixels of every
+# trail in one array write rather than a draw call per trail.
+
+import numpy as np
+import pygame
+from . import render
+
+TRAIL_SLOTS  = 1024    # bullets with a trail at once; later ones get none
+TRAIL_LENGTH = 256     # positions kept per trail
+TRAIL_EVERY  = 4       # ticks between recorded positions (256 x 4 = ~17 s)
+TRAIL_POINTS = 64      # points drawn per trail at zoom 1 or more
+TRAIL_MIN_POINTS = 8   # ... and at the lowest zoom
+TRAIL_COLOR  = (70, 70, 110)
+
+def clip(ax, ay, bx, by, rows, w, h):
+    """
+    Clip the segments ``rows`` of (ax, ay) -> (bx, by) to the rectangle
+    0..w x 0..h in place (Liang-Barsky); returns which of them are left.
+    """
+    x0, y0 = ax[rows], ay[rows]
+    dx, dy = bx[rows] - x0, by[rows] - y0
+    t0, t1 = np.zeros(len(rows)), np.ones(len(rows))
+    seen = np.ones(len(rows), bool)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for p, q in ((-dx, x0), (dx, w - x0), (-dy, y0), (dy, h - y0)):
+            r = q / p
+            t0 = np.where(p < 0, np.maximum(t0, r), t0)
+            t1 = np.where(p > 0, np.minimum(t1, r), t1)
+            seen &= (p != 0) | (q >= 0)
+    seen &= t0 <= t1
+    ax[rows], ay[rows] = x0 + t0 * dx, y0 + t0 * dy
+    bx[rows], by[rows] = x0 + t1 * dx, y0 + t1 * dy
+    return seen
+
+class Trails:
+    """
+    Ring buffer of bullet positions.  ``slot`` maps a bullet id to its row;
+    rows are handed out as bullets appear and cleared for reuse once they
+    are gone.  Unwritten entries are NaN.
+    """
+    def __init__(self, slots=TRAIL_SLOTS, length=TRAIL_LENGTH, every=TRAIL_EVERY):
+        self.length = length
+        self.every  = max(1, int(every))
+        self.buf    = np.full((slots, length, 2), np.nan)
+        self.slot   = {}
+        self.free   = list(range(slots - 1, -1, -1))
+        self.head   = 0        # column the next tick is written to
+        self.ticks  = 0
+
+    def clear(self):
+        self.buf.fill(np.nan)
+        self.slot.clear()
+        self.free = list(range(len(self.buf) - 1, -1, -1))
+        self.head = self.ticks = 0
+
+    def record(self, bullets):
+        """Called once per physics tick; stores every ``every``-th one."""
+        self.ticks += 1
+        if self.ticks % self.every:
+            return
+        slot, free = self.slot, self.free
+        ids = {b.id for b in bullets}
+        for i in [i for i in slot if i not in ids]:
+            free.append(slot.pop(i))
+        rows, pos = [], []
+        for b in bullets:
+            r = slot.get(b.id)
+            if r is None:
+                if not free:
+                    continue
+                r = slot[b.id] = free.pop()
+                self.buf[r] = np.nan
+            rows.append(r)
+            pos.append((b.pos.x, b.pos.y))
+        if rows:
+            self.buf[rows, self.head] = pos
+        self.head = (self.head + 1) % self.length
+
+    def draw(self, surf, color=TRAIL_COLOR):
+        if not self.slot:
+            return
+        zoom = render.camera_zoom
+        k = self.length
+        points = max(TRAIL_MIN_POINTS, int(TRAIL_POINTS * min(1.0, zoom)))
+        stride = -(-k // points)
+        # the newest sample and every stride-th one before it, oldest first
+        cols = (self.head - 1 - np.arange(0, k, stride)[::-1]) % k
+        rows = np.fromiter(self.slot.values(), np.intp, len(self.slot))
+        pts  = self.buf[rows[:, None], cols[None, :]]
+        c = (render.camera_center.x, render.camera_center.y)
+        pts -= c
+        pts *= zoom
+        pts += c
+        # every segment between two recorded samples that reaches the
+        # screen, in x / y planes (a trail is NaN up to its first sample,
+        # and NaN fails every test)
+        w, h = surf.get_size()
+        ax, bx = pts[:, :-1, 0].ravel(), pts[:, 1:, 0].ravel()
+        ay, by = pts[:, :-1, 1].ravel(), pts[:, 1:, 1].ravel()
+        keep = np.minimum(ax, bx) < w
+        keep &= np.maximum(ax, bx) >= 0
+        keep &= np.minimum(ay, by) < h
+        keep &= np.maximum(ay, by) >= 0
+        ax, ay, bx, by = ax[keep], ay[keep], bx[keep], by[keep]
+        # the ones crossing an edge are clipped to the screen, so that a
+        # long one costs only its visible part
+        cross = np.flatnonzero((np.minimum(ax, bx) < 0) | (np.maximum(ax, bx) >= w)
+                               | (np.minimum(ay, by) < 0) | (np.maximum(ay, by) >= h))
+        if len(cross):
+            seen = clip(ax, ay, bx, by, cross, w, h)
+            if not seen.all():
+                keep = np.ones(len(ax), bool)
+                keep[cross[~seen]] = False
+                ax, ay, bx, by = ax[keep], ay[keep], bx[keep], by[keep]
+        if not len(ax):
+            return
+        dx, dy = bx - ax, by - ay
+        # one point per pixel along each segment, all segments at once
+        n = np.maximum(np.abs(dx), np.abs(dy)).astype(np.intp) + 1
+        i = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+        step = 1.0 / np.maximum(n - 1, 1)
+        x = (np.repeat(ax, n) + np.repeat(dx * step, n) * i).astype(np.intp)
+        y = (np.repeat(ay, n) + np.repeat(dy * step, n) * i).astype(np.intp)
+        on = (x >= 0) & (x < w) & (y >= 0) & (y < h)
+        pixels = pygame.surfarray.pixels2d(surf)
+        pixels[x[on], y[on]] = surf.map_rgb(color)
+        del pixels
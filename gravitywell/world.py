@@ -0,0 +1,338 @@
+# gravitywell/world.py
+#
+# The simulated game without any display: bullets, wells, score and the
+# per-step bookkeeping the app used to do inline.  Used by the app and by
+# the headless tools.
+#
+# Every bullet gets a stable id when it enters the world (ids only ever
+# increase, and survive save/load), and every change is stamped with the
+# world's ``version`` so consumers can ask what was spawned, removed or
+# changed since they last looked (``delta``) instead of copying everything.
+# A bullet's state is published with the time it is from; consumers
+# dead-reckon it from there, and it only counts as changed again once that
+# extrapolation is off by more than DELTA_TOL (or it was edited).
+
+import math
+from collections import deque
+import numpy as np
+from . import modes
+from .physics import Projectile, step_bullets
+from .scene import Scene
+from .orbits import OrbitTracker, ORBIT
+from .stats import Stats
+
+# removals remembered for ``delta``; older versions get a full snapshot
+REMOVAL_HISTORY = 4096
+
+# px a bullet may drift from pos + vel * elapsed of its published state
+# before ``delta`` publishes it again
+DELTA_TOL = 1.0
+
+def body_record(b):
+    """A bullet as plain JSON-able data (the savegame format)."""
+    return {
+        "id": b.id,
+        "pos": [b.pos.x, b.pos.y],
+        "vel": [b.vel.x, b.vel.y],
+        "radius": b.radius,
+        "mass": b.mass,
+        "friction": b.friction,
+        "arc_time": b.arc_time
+    }
+
+def published_record(b):
+    """``body_record`` at the bullet's published state, plus the time ``t``
+    that state is from."""
+    x, y, vx, vy, t = b.published
+    rec = body_record(b)
+    rec.update(pos=[x, y], vel=[vx, vy], t=t)
+    return rec
+
+class Delta:
+    """
+    What happened between ``since`` and ``version``: the bullets
+    ``spawned``, the ids ``removed`` and the bullets that already existed
+    and ``changed`` (were edited, or drifted from their last published
+    state).  A ``full`` delta (``since`` too old, or the world was cleared
+    or reloaded since) lists every bullet as spawned and the consumer
+    should drop whatever it had.  A consumer takes each listed bullet's
+    ``published`` state, (x, y, vx, vy, t), and extrapolates it to
+    ``time``; every bullet it holds is then within DELTA_TOL of the world.
+    """
+    def __init__(self, since, version, time, full, spawned, removed, changed):
+        self.since   = since
+        self.version = version
+        self.time    = time
+        self.full    = full
+        self.spawned = spawned
+        self.removed = removed
+        self.changed = changed
+
+    def to_dict(self):
+        return {
+            "since": self.since, "version": self.version, "time": self.time,
+            "full": self.full,
+            "spawned": [published_record(b) for b in self.spawned],
+            "removed": list(self.removed),
+            "changed": [published_record(b) for b in self.changed],
+        }
+
+class World:
+    """
+    One game in progress.  ``mode`` (a ``modes.Mode`` or its name) picks
+    the variant: mutual gravity, shots in flight, launch scale, goal.
+    """
+    def __init__(self, settings, center, max_dist, scene=None, mode=None):
+        self.settings    = settings
+        self.mode        = modes.get(mode)
+        self.pairs       = self.mode.pairs   # or a heavy-mass limit / mesh.MeshSolver
+        self.center      = center
+        self.max_dist    = max_dist
+        self.scene       = scene or Scene.from_settings(settings, center)
+        self.synced      = None     # (settings version, scene) last synced
+        self.orbits      = OrbitTracker()
+        self.bullets     = []
+        self.index       = {}       # id -> bullet
+        self.next_id     = 0
+        self.total_score = 0.0
+        self.time        = 0.0
+        # change tracking for delta()
+        self.version     = 0
+        self.republished = 0        # versions taken by delta() republishing drifted bullets
+        self.reset_at    = 0        # version of the last clear / load
+        self.removals    = deque()  # (version, id)
+        self.removal_floor = 0      # removals before this were forgotten
+        self.steps       = 0
+        self.diagnostics = None     # a diagnostics.Diagnostics, sampled in step
+        self.lod         = None     # a lod.LOD: far bullets step on a coarse path
+        self.stats       = Stats()  # scoring count, oldest bullet, HUD aggregates
+
+    def _bump(self):
+        self.version += 1
+        return self.version
+
+    def clear(self):
+        self.bullets.clear()
+        self.index.clear()
+        self.removals.clear()
+        self.stats.clear()
+        self.total_score = 0.0
+        self.reset_at = self._bump()
+
+    def get(self, body_id):
+        """The live bullet with ``body_id``, or None."""
+        return self.index.get(body_id)
+
+    @property
+    def oldest(self):
+        """The bullet in flight longest, or None."""
+        return self.index.get(self.stats.oldest())
+
+    def launch_velocity(self, drag_start, drag_end):
+        """Velocity of a shot dragged from ``drag_start`` to ``drag_end``."""
+        scale = self.mode.vel_scale
+        if scale is None:
+            scale = self.settings.drag_scale / 10
+        return (drag_start - drag_end) * scale
+
+    @property
+    def friction(self):
+        """Friction given to new shots."""
+        f = self.mode.friction
+        return self.settings.friction if f is None else f
+
+    def add(self, b, body_id=None):
+        """Put a projectile into the world under a new (or its saved) id."""
+        if body_id is None:
+            body_id = self.next_id
+        self.next_id = max(self.next_id, body_id + 1)
+        b.id = body_id
+        b.born = b.touched = self._bump()
+        self._publish(b)
+        self.bullets.append(b)
+        self.index[body_id] = b
+        self.stats.add(b, self.time)
+        return b
+
+    def spawn(self, pos, vel):
+        """
+        Add a bullet with the current bullet settings and return it.  In a
+        mode with ``max_shots`` the oldest shots make room for it.
+        """
+        s = self.settings
+        limit = self.mode.max_shots
+        if limit is not None and len(self.bullets) >= limit:
+            self.remove(self.bullets[:len(self.bullets) - limit + 1])
+        return self.add(Projectile(pos, vel, s.bullet_radius, s.bullet_mass, self.friction))
+
+    def spawn_many(self, pos, vel):
+        """
+        Add bullets at the (k, 2) ``pos`` / ``vel`` with the current bullet
+        settings in one pass (one version stamp for all of them); returns
+        them.  In a mode with ``max_shots`` only the last ones fit.
+        """
+        s = self.settings
+        pos = np.asarray(pos, dtype=float).reshape(-1, 2)
+        vel = np.asarray(vel, dtype=float).reshape(-1, 2)
+        limit = self.mode.max_shots
+        if limit is not None:
+            first = max(0, len(pos) - limit)
+            pos, vel = pos[first:], vel[first:]
+            if len(self.bullets) + len(pos) > limit:
+                self.remove(self.bullets[:len(self.bullets) + len(pos) - limit])
+        v = self._bump()
+        new = [Projectile(p, u, s.bullet_radius, s.bullet_mass, self.friction)
+               for p, u in zip(pos.tolist(), vel.tolist())]
+        for i, b in enumerate(new, self.next_id):
+            b.id = i
+            b.born = b.touched = v
+            self._publish(b)
+            self.index[i] = b
+            self.stats.add(b, self.time)
+        self.next_id += len(new)
+        self.bullets.extend(new)
+        return new
+
+    def remove(self, bullets):
+        """Take bullets out of the world (e.g. to evict them)."""
+        ids  = [b.id for b in bullets]
+        gone = set(ids)
+        if not gone:
+            return
+        self.bullets[:] = [b for b in self.bullets if b.id not in gone]
+        v = self._bump()
+        for i in ids:
+            del self.index[i]
+            self.stats.remove(i)
+            self.removals.append((v, i))
+        self._trim_removals()
+
+    def _trim_removals(self):
+        while len(self.removals) > REMOVAL_HISTORY:
+            self.removal_floor = self.removals.popleft()[0]
+
+    def touch(self, b):
+        """Record an edit to a bullet's state made outside ``step``."""
+        b.touched = self._bump()
+        self._publish(b)
+
+    def _publish(self, b):
+        b.published = (b.pos.x, b.pos.y, b.vel.x, b.vel.y, self.time)
+
+    def sync(self):
+        """
+        Pick up Settings changes (linked wells follow the GV settings); only
+        does work when the settings version or the scene changed.
+        """
+        key = (self.settings.version, self.scene)
+        if key != self.synced:
+            self.scene.sync(self.settings)
+            self.synced = key
+
+    def step(self, dt, components=False):
+        """
+        Advance the world by ``dt``: physics, scoring (``dt`` per bullet that
+        has been in flight longer than SCORE_TIME, see ``stats``) and removal of bullets
+        that crashed, escaped or reached the mode's orbit goal (outcome
+        ORBIT).  Returns the removed bullets.
+        """
+        mode = self.mode
+        self.sync()
+        diags = self.diagnostics
+        diag  = {} if diags is not None and diags.due() else None
+        tick, t = self.steps, self.time     # diag describes the state before the step
+        step_bullets(self.bullets, dt, self.scene, self.max_dist,
+                     components=components, orbits=self.orbits, pairs=self.pairs,
+                     diag=diag, lod=self.lod, tick=self.steps,
+                     stats=self.stats if self.stats.aggregates else None)
+        self.steps += 1
+        if mode.goal is not None:
+            goal = mode.goal * 2 * math.pi
+            for b in self.bullets:
+                if b.active and abs(b.accum_angle) >= goal:
+                    b.active  = False
+                    b.outcome = ORBIT
+        self.scene.advance(dt)
+        self.time += dt
+        removed = [b for b in self.bullets if not b.active]
+        if removed:
+            self.bullets[:] = [b for b in self.bullets if b.active]
+            v = self._bump()
+            for b in removed:
+                del self.index[b.id]
+                self.stats.remove(b.id)
+                self.removals.append((v, b.id))
+            self._trim_removals()
+        if diag is not None:
+            # anything that bumped the version (spawn, edit, removal, clear)
+            # but republishing breaks conservation; so does a bullet moving
+            # between the LOD paths (diag only sees the full one)
+            population = (self.version - self.republished, len(self.removals),
+                          self.removal_floor, self.lod.coarse if self.lod is not None else 0)
+            diags.add(tick, t, diag, population)
+        # every bullet past SCORE_TIME scores dt, counted incrementally
+        self.stats.advance(self.time, self.index)
+        if mode.score:
+            self.total_score += dt * self.stats.scoring
+        return removed
+
+    def delta(self, since):
+        """
+        Changes after version ``since`` (the ``version`` of the previous
+        delta; 0 for everything).  Bullets that drifted more than DELTA_TOL
+        from their published state are published again first, under a new
+        version, so every consumer hears about them once.
+        """
+        t, tol2 = self.time, DELTA_TOL * DELTA_TOL
+        drifted = []
+        for b in self.bullets:
+            x, y, vx, vy, t0 = b.published
+            ex = b.pos.x - (x + vx * (t - t0))
+            ey = b.pos.y - (y + vy * (t - t0))
+            if ex*ex + ey*ey > tol2:
+                drifted.append(b)
+        if drifted:
+            v = self._bump()
+            self.republished += 1
+            for b in drifted:
+                b.touched = v
+                self._publish(b)
+        if since < self.reset_at or since < self.removal_floor:
+            return Delta(since, self.version, t, True, list(self.bullets), [], [])
+        spawned, changed = [], []
+        for b in self.bullets:
+            if b.born > since:
+                spawned.append(b)
+            elif b.touched > since:
+                changed.append(b)
+        removed = []
+        for v, i in reversed(self.removals):
+            if v <= since:
+                break
+            removed.append(i)
+        removed.reverse()
+        return Delta(since, self.version, t, False, spawned, removed, changed)
+
+    def to_dict(self):
+        """Bullets, score and the id counter (the savegame's world part)."""
+        return {
+            "bullets": [body_record(b) for b in self.bullets],
+            "score": self.total_score,
+            "next_id": self.next_id,
+        }
+
+    def load_dict(self, data):
+        """Replace the bullets and score from ``to_dict`` data; saves made
+        before bullets had ids get fresh ones."""
+        self.clear()
+        self.total_score = data.get("score", 0.0)
+        self.next_id = max(self.next_id, data.get("next_id", 0))
+        s = self.settings
+        for rec in data.get("bullets", []):
+            b = Projectile(
+                rec["pos"], rec["vel"],
+                rec["radius"], rec.get("mass", s.bullet_mass),
+                rec.get("friction", s.friction)
+            )
+            b.arc_time = rec.get("arc_time", 0.0)
+            self.add(b, rec.get("id"))